@@ -13,11 +13,13 @@ import os
 import shlex
 import subprocess
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 MODEL = "claude-sonnet-4-20250514"
+MAX_DIFF_CHARS = 50000
 
 REVIEW_PROMPT = """You are a senior code reviewer. Review this pull request and list every issue you find.
 
@@ -38,6 +40,14 @@ Focus on:
 Be thorough. List ALL issues, even minor ones."""
 
 
+def truncate_diff(diff: str, limit: int = MAX_DIFF_CHARS) -> str:
+    """Cap *diff* at *limit* characters, cutting at the last full line."""
+    if len(diff) <= limit:
+        return diff
+    cut = diff.rfind("\n", 0, limit)
+    return diff[:cut] if cut > 0 else diff[:limit]
+
+
 def _format_cmd(cmd: Sequence[str]) -> str:
     return " ".join(shlex.quote(part) for part in cmd)
 
@@ -48,16 +58,18 @@ def run_cmd(
     *,
     allowed_returncodes: tuple[int, ...] = (0,),
 ) -> str:
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, check=False)
+    # Capture bytes and decode once; text mode would decode incrementally
+    # through a TextIOWrapper while reading multi-megabyte diffs.
+    result = subprocess.run(cmd, capture_output=True, cwd=cwd, check=False)
+    stdout = result.stdout.decode("utf-8", errors="replace")
     if result.returncode not in allowed_returncodes:
-        stderr = result.stderr.strip()
-        stdout = result.stdout.strip()
-        detail = stderr or stdout or "no stderr/stdout captured"
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        detail = stderr or stdout.strip() or "no stderr/stdout captured"
         location = f" in {cwd}" if cwd is not None else ""
         raise RuntimeError(
             f"Command failed with exit {result.returncode}{location}: {_format_cmd(cmd)}\n{detail}"
         )
-    return result.stdout
+    return stdout
 
 
 def get_diff(repo_path: str | Path, ref_range: str) -> str:
@@ -65,26 +77,55 @@ def get_diff(repo_path: str | Path, ref_range: str) -> str:
 
 
 def get_diffguard_context(repo_path: str | Path, ref_range: str) -> str:
-    diffguard = Path(__file__).parent.parent / ".venv" / "bin" / "diffguard"
-    return run_cmd(
-        [
-            str(diffguard),
-            "review",
-            ref_range,
-            "--repo",
-            str(repo_path),
-            "--format",
-            "json",
-        ],
-        cwd=repo_path,
-        # diffguard review exits 1 when high-signal findings are present; for
-        # the A/B oracle that JSON is the useful context, not a command failure.
-        allowed_returncodes=(0, 1),
-    )
+    """Run ``diffguard review --format json`` in-process and return its output.
+
+    The harness already runs inside DiffGuard's environment, so invoking the
+    Click command directly avoids an interpreter start and engine import per
+    test case. ``CliRunner`` captures stdout and stderr separately and reports
+    the same exit codes as the installed CLI.
+    """
+    from click.testing import CliRunner
+
+    from diffguard.cli import main as diffguard_main
+
+    args = ["review", ref_range, "--repo", str(repo_path), "--format", "json"]
+    result = CliRunner().invoke(diffguard_main, args, prog_name="diffguard", catch_exceptions=False)
+    # diffguard review exits 1 when high-signal findings are present; for
+    # the A/B oracle that JSON is the useful context, not a command failure.
+    if result.exit_code not in (0, 1):
+        detail = result.stderr.strip() or result.stdout.strip() or "no stderr/stdout captured"
+        raise RuntimeError(
+            f"Command failed with exit {result.exit_code} in {repo_path}: "
+            f"{_format_cmd(['diffguard', *args])}\n{detail}"
+        )
+    return result.stdout
+
+
+def _stream_text(lines: Iterable[bytes]) -> str:
+    """Accumulate text deltas from a Messages API server-sent event stream."""
+    parts: list[str] = []
+    for raw in lines:
+        line = raw.decode("utf-8").strip()
+        if not line.startswith("data:"):
+            continue
+        event = json.loads(line[len("data:") :])
+        if event.get("type") == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                parts.append(delta["text"])
+        elif event.get("type") == "error":
+            raise RuntimeError(f"Claude stream error: {event.get('error')}")
+        elif event.get("type") == "message_stop":
+            break
+    return "".join(parts)
 
 
 def call_claude(system: str, user_content: str) -> str:
-    """Call Claude API and return the response text."""
+    """Call Claude API and return the response text.
+
+    The response is streamed, so text is consumed as it is generated rather
+    than after the whole completion has been buffered by the server.
+    """
     import urllib.request
 
     body = json.dumps(
@@ -93,6 +134,7 @@ def call_claude(system: str, user_content: str) -> str:
             "max_tokens": 4096,
             "messages": [{"role": "user", "content": user_content}],
             "system": system,
+            "stream": True,
         }
     )
 
@@ -107,8 +149,7 @@ def call_claude(system: str, user_content: str) -> str:
     )
 
     with urllib.request.urlopen(req) as resp:
-        data = json.loads(resp.read())
-        return data["content"][0]["text"]
+        return _stream_text(resp)
 
 
 def run_test(name: str, repo_path: str | Path, ref_range: str) -> tuple[str, str]:
@@ -117,25 +158,37 @@ def run_test(name: str, repo_path: str | Path, ref_range: str) -> tuple[str, str
     print(f"Repo: {repo_path}, Range: {ref_range}")
     print(f"{'=' * 60}")
 
-    diff = get_diff(repo_path, ref_range)
-    context = get_diffguard_context(repo_path, ref_range)
+    # git diff and the diffguard CLI are independent subprocesses; overlap them
+    # so the pre-review phase costs the slower of the two rather than the sum.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        diff_future = pool.submit(get_diff, repo_path, ref_range)
+        context_future = pool.submit(get_diffguard_context, repo_path, ref_range)
+        diff = diff_future.result()
+        context = context_future.result()
 
     print(f"\nDiff size: {len(diff)} chars")
     print(f"Context size: {len(context)} chars")
     print(f"\n--- DiffGuard Context ---\n{context}\n--- End Context ---\n")
 
-    # A: baseline (diff only)
-    print("Running baseline review (diff only)...")
-    review_a = call_claude(
-        REVIEW_PROMPT, f"Here is the git diff to review:\n\n```diff\n{diff[:50000]}\n```"
-    )
-
-    # B: treatment (context + diff)
-    print("Running treatment review (context + diff)...")
-    review_b = call_claude(
-        REVIEW_PROMPT,
-        f"Here is structured context about the changes:\n\n{context}\n\nHere is the full git diff:\n\n```diff\n{diff[:50000]}\n```",
-    )
+    # The two reviews are independent network round-trips, so issue them
+    # together instead of waiting for the baseline before starting treatment.
+    print("Running baseline (diff only) and treatment (context + diff) reviews...")
+    diff_block = f"```diff\n{truncate_diff(diff)}\n```"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # A: baseline (diff only)
+        future_a = pool.submit(
+            call_claude,
+            REVIEW_PROMPT,
+            f"Here is the git diff to review:\n\n{diff_block}",
+        )
+        # B: treatment (context + diff)
+        future_b = pool.submit(
+            call_claude,
+            REVIEW_PROMPT,
+            f"Here is structured context about the changes:\n\n{context}\n\nHere is the full git diff:\n\n{diff_block}",
+        )
+        review_a = future_a.result()
+        review_b = future_b.result()
 
     # Output
     outdir = Path(__file__).parent.parent / "tests" / "ab_results"
@@ -58,7 +58,7 @@ def validate(corpus_path: Path) -> dict[str, Any]:
         else:
             if expected_parse_gap:
                 missing_expected_parse_gaps.append(case_id)
-            matches = match_symbols(old_result.symbols, new_result.symbols)
+            matches = match_symbols(old_result.symbols, new_result.symbols).matches
 
             def compare(old: str, new: str) -> SignatureComparison:
                 return compare_signatures(old, new, language)
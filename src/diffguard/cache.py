@@ -0,0 +1,252 @@
+"""On-disk caches for committed-range results and per-file parses.
+
+Both ends of a committed range are immutable, so re-running ``review`` or
+``summarize`` over the same range (pre-push hooks, agent retries) yields the
+same ``DiffGuardOutput``. Entries are stored as schema JSON under Git's own
+directory, keyed by the resolved commits, the diff text, the analysis options,
+and the DiffGuard version. Every failure degrades to a cache miss; the cache
+never changes what a run reports. Set ``DIFFGUARD_NO_CACHE`` to bypass it.
+
+Parse results and reference-scan identifier indexes are cached separately by
+source content, so files that did not change between overlapping ranges, or
+between staged and worktree runs, skip tree-sitter parsing entirely.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from diffguard import __version__
+from diffguard.engine._refs import split_ref_range
+from diffguard.engine._types import ParseResult, Symbol
+from diffguard.engine.deps import IdentifierHit, SourceIndexer, index_identifiers
+from diffguard.engine.parser import parse_file
+from diffguard.engine.pipeline import SourceParser
+from diffguard.git import get_cache_dir, resolve_commit
+from diffguard.languages import get_parser
+from diffguard.schema import DiffGuardOutput
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 256
+MAX_PARSE_ENTRIES = 4096
+DISABLE_ENV_VAR = "DIFFGUARD_NO_CACHE"
+
+_T = TypeVar("_T")
+
+
+def cache_key(
+    repo_path: str,
+    ref_range: str,
+    diff_text: str,
+    *,
+    skip_generated: bool = False,
+    include_tests: bool = False,
+    show_skipped: bool = False,
+) -> str | None:
+    """Return the cache key for a committed range, or ``None`` if uncacheable.
+
+    Ranges whose ends are not both commits (index or worktree snapshots) are
+    mutable and never cached.
+    """
+    if os.environ.get(DISABLE_ENV_VAR):
+        return None
+    old_ref, new_ref = split_ref_range(ref_range)
+    if old_ref.startswith(":") or new_ref.startswith(":"):
+        return None
+    try:
+        old_commit = resolve_commit(old_ref, repo_path)
+        new_commit = resolve_commit(new_ref, repo_path)
+    except OSError:
+        return None
+    if old_commit is None or new_commit is None:
+        return None
+    diff_digest = hashlib.sha256(diff_text.encode("utf-8", errors="surrogatepass")).hexdigest()
+    payload = json.dumps(
+        {
+            "version": __version__,
+            "schema_version": DiffGuardOutput.model_fields["schema_version"].default,
+            "ref_range": ref_range,
+            "commits": [old_commit, new_commit],
+            "diff": diff_digest,
+            "options": [skip_generated, include_tests, show_skipped],
+        },
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+def _entry_path(repo_path: str, key: str) -> Path:
+    return get_cache_dir(repo_path) / f"{key}.json"
+
+
+def load_output(repo_path: str, key: str) -> DiffGuardOutput | None:
+    """Return the cached output for *key*, or ``None`` on any miss."""
+    try:
+        data = _entry_path(repo_path, key).read_text(encoding="utf-8")
+        return DiffGuardOutput.model_validate_json(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, RuntimeError, ValueError):
+        logger.debug("Ignoring unreadable cache entry %s", key, exc_info=True)
+        return None
+
+
+def store_output(repo_path: str, key: str, output: DiffGuardOutput) -> None:
+    """Persist *output* under *key*; failures are logged and ignored.
+
+    Outputs carrying warnings are not stored because a warning may reflect a
+    transient read failure rather than the range itself. Entries that do not
+    round-trip exactly through JSON are skipped for the same reason.
+    """
+    if output.meta.warnings:
+        return
+    try:
+        data = output.model_dump_json()
+        if DiffGuardOutput.model_validate_json(data) != output:
+            return
+        cache_dir = get_cache_dir(repo_path)
+        _write_atomic(cache_dir / f"{key}.json", data)
+        _prune(cache_dir, MAX_ENTRIES)
+    except (OSError, RuntimeError, ValueError):
+        logger.debug("Could not store cache entry %s", key, exc_info=True)
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Write *data* to *path* so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _prune(cache_dir: Path, max_entries: int) -> None:
+    """Drop the oldest entries beyond *max_entries*."""
+    entries = sorted(cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+    for path in entries[:-max_entries]:
+        path.unlink(missing_ok=True)
+
+
+def make_cached_parser(repo_path: str) -> SourceParser:
+    """Return a :func:`parse_file` wrapper backed by the on-disk parse cache.
+
+    Entries are keyed by language, grammar version, file extension (which
+    selects dialects such as TSX), source content, and DiffGuard version.
+    Falls back to plain :func:`parse_file` when caching is disabled or the
+    cache is unavailable.
+    """
+    cached = _make_source_cache(repo_path, "parse", parse_file, _dump_parse, _load_parse)
+    return parse_file if cached is None else cached
+
+
+def make_cached_indexer(repo_path: str) -> SourceIndexer | None:
+    """Return an :func:`index_identifiers` wrapper backed by the on-disk cache.
+
+    The identifier index is independent of the names being searched for, so
+    warm reference scans over unchanged files skip tree-sitter entirely.
+    Returns ``None`` when caching is disabled or unavailable, so reference
+    scans search each file for the requested names directly.
+    """
+    return _make_source_cache(repo_path, "refs", index_identifiers, _dump_index, _load_index)
+
+
+def _make_source_cache(
+    repo_path: str,
+    kind: str,
+    compute: Callable[..., _T],
+    dump: Callable[[_T], object],
+    load: Callable[[Any], _T],
+) -> Callable[..., _T] | None:
+    """Wrap a pure ``(source, language, *, file_path)`` function with a disk cache."""
+    if os.environ.get(DISABLE_ENV_VAR):
+        return None
+    try:
+        entry_dir = get_cache_dir(repo_path) / kind
+    except (OSError, RuntimeError):
+        return None
+    pruned = False
+
+    def _cached(source: str, language: str, *, file_path: str | None = None) -> _T:
+        nonlocal pruned
+        path = entry_dir / f"{_source_key(kind, source, language, file_path)}.json"
+        try:
+            return load(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.debug("Ignoring unreadable %s cache entry %s", kind, path, exc_info=True)
+        result = compute(source, language, file_path=file_path)
+        try:
+            _write_atomic(path, json.dumps(dump(result)))
+        except (OSError, ValueError):
+            logger.debug("Could not store %s cache entry %s", kind, path, exc_info=True)
+        else:
+            if not pruned:
+                pruned = True
+                _prune_entry_dir(entry_dir)
+        return result
+
+    return _cached
+
+
+def _source_key(kind: str, source: str, language: str, file_path: str | None) -> str:
+    extension = os.path.splitext(file_path)[1] if file_path else ""
+    grammar = _grammar_version(language, extension)
+    digest = hashlib.sha256(f"{__version__}\0{kind}\0{language}\0{grammar}\0{extension}\0".encode())
+    digest.update(source.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+@functools.cache
+def _grammar_version(language: str, extension: str) -> str:
+    """Return the tree-sitter grammar version so grammar upgrades miss the cache."""
+    try:
+        grammar = get_parser(language, file_path=f"file{extension}").language
+    except (ImportError, ValueError):
+        return ""
+    if grammar is None:
+        return ""
+    return f"{grammar.abi_version}:{'.'.join(map(str, grammar.semantic_version or ()))}"
+
+
+def _dump_parse(result: ParseResult) -> object:
+    symbols = [
+        [s.name, s.kind, s.signature, s.start_line, s.end_line, s.body_hash, s.parent]
+        for s in result.symbols
+    ]
+    return {"parse_error": result.parse_error, "symbols": symbols}
+
+
+def _load_parse(data: Any) -> ParseResult:
+    symbols = [Symbol(*fields) for fields in data["symbols"]]
+    return ParseResult(symbols=symbols, parse_error=bool(data["parse_error"]))
+
+
+def _dump_index(index: tuple[list[IdentifierHit], bool]) -> object:
+    hits, parse_error = index
+    return {"parse_error": parse_error, "hits": hits}
+
+
+def _load_index(data: Any) -> tuple[list[IdentifierHit], bool]:
+    hits = [(name, line, ctx, src_line) for name, line, ctx, src_line in data["hits"]]
+    return hits, bool(data["parse_error"])
+
+
+def _prune_entry_dir(entry_dir: Path) -> None:
+    try:
+        _prune(entry_dir, MAX_PARSE_ENTRIES)
+    except OSError:
+        logger.debug("Could not prune cache directory %s", entry_dir, exc_info=True)
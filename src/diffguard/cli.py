@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import sys
+import time
+import weakref
 from typing import NoReturn
 
 import click
 
-from diffguard import __version__, hooks, report
+from diffguard import __version__, cache, hooks, report
 from diffguard.engine._refs import split_ref_range
 from diffguard.engine.deps import scan_references
-from diffguard.engine.findings import extract_findings
+from diffguard.engine.findings import attach_references, extract_findings
 from diffguard.engine.pipeline import FileContentProvider, run_pipeline
 from diffguard.git import (
+    BlobBatchReader,
     get_diff,
     get_file_at_snapshot,
-    get_file_at_ref,
     get_file_from_index,
     get_merge_base,
     get_repository_root,
@@ -36,35 +39,108 @@ EXIT_NO_CHANGES = 3  # No changes in diff (summarize command)
 EXIT_PARTIAL = 4  # Parse errors in some files (summarize command)
 
 
+_CONTENT_CACHE_SIZE = 4096
+
+
 def _make_content_provider(repo_path: str) -> FileContentProvider:
-    """Create a file content provider bound to a repo path."""
+    """Create a file content provider bound to a repo path.
+
+    Blobs stream from one persistent ``git cat-file --batch`` process that is
+    stopped when the provider is released. Commit snapshots are immutable, so
+    repeated ``(ref, path)`` lookups within one invocation are served from an
+    LRU cache instead of re-querying git. The returned provider exposes
+    ``cache_clear()`` for callers that need a reset.
+    """
+    reader = BlobBatchReader(repo_path)
 
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
     def _get(ref: str, file_path: str) -> str | None:
-        return get_file_at_ref(ref, file_path, repo_path=repo_path)
+        return reader.read(ref, file_path)
 
+    weakref.finalize(_get, reader.close)
     return _get
 
 
 def _make_staged_content_provider(repo_path: str) -> FileContentProvider:
-    """Create a content provider that compares HEAD to the git index."""
+    """Create a content provider that compares HEAD to the git index.
+
+    Commit-side blobs share one ``git cat-file --batch`` process rather than
+    forking ``git show`` per file.
+    """
+    reader = BlobBatchReader(repo_path)
 
     def _get(ref: str, file_path: str) -> str | None:
         if ref == ":index":
             return get_file_from_index(file_path, repo_path=repo_path)
-        return get_file_at_ref(ref, file_path, repo_path=repo_path)
+        return reader.read(ref, file_path)
 
+    weakref.finalize(_get, reader.close)
     return _get
 
 
 def _make_worktree_content_provider(repo_path: str) -> FileContentProvider:
-    """Create a provider comparing a commit baseline to current worktree files."""
+    """Create a provider comparing a commit baseline to current worktree files.
+
+    Baseline blobs share one ``git cat-file --batch`` process.
+    """
+    reader = BlobBatchReader(repo_path)
 
     def _get(ref: str, file_path: str) -> str | None:
-        return get_file_at_snapshot(ref, file_path, repo_path=repo_path)
+        return get_file_at_snapshot(ref, file_path, repo_path=repo_path, reader=reader)
 
+    weakref.finalize(_get, reader.close)
     return _get
 
 
+def _run_repo_pipeline(
+    repo: str,
+    diff_text: str,
+    ref_range: str,
+    content_provider: FileContentProvider,
+    *,
+    cache_output: bool,
+    skip_generated: bool = False,
+    include_tests: bool = False,
+    show_skipped: bool = False,
+) -> DiffGuardOutput:
+    """Run the pipeline against *repo* with its on-disk caches.
+
+    Parses always go through the content-keyed parse cache. When
+    *cache_output* is set (committed ranges only) the whole result is reused
+    if the same range was analyzed before; a reused result reports the time
+    this run took, not the run that produced it.
+    """
+    t0 = time.monotonic()
+    key = None
+    if cache_output:
+        key = cache.cache_key(
+            repo,
+            ref_range,
+            diff_text,
+            skip_generated=skip_generated,
+            include_tests=include_tests,
+            show_skipped=show_skipped,
+        )
+    if key is not None:
+        cached = cache.load_output(repo, key)
+        if cached is not None:
+            elapsed_ms = (time.monotonic() - t0) * 1000
+            meta = cached.meta.model_copy(update={"timing_ms": round(elapsed_ms, 2)})
+            return cached.model_copy(update={"meta": meta})
+    output = run_pipeline(
+        diff_text,
+        ref_range,
+        content_provider,
+        skip_generated=skip_generated,
+        include_tests=include_tests,
+        show_skipped=show_skipped,
+        parse_source=cache.make_cached_parser(repo),
+    )
+    if key is not None:
+        cache.store_output(repo, key, output)
+    return output
+
+
 def _normalize_ref_range(ref_range: str, repo: str) -> str:
     """Resolve git's three-dot range to a concrete ``<merge-base>..<new>`` range.
 
@@ -199,14 +275,26 @@ def summarize(
                 click.echo("No changes found.", err=True)
             sys.exit(EXIT_NO_CHANGES)
 
-        output = run_pipeline(
-            diff_text,
-            range_label,
-            content_provider,
-            skip_generated=skip_generated,
-            include_tests=include_tests,
-            show_skipped=show_skipped,
-        )
+        if content_provider is not None:
+            output = _run_repo_pipeline(
+                repo,
+                diff_text,
+                range_label,
+                content_provider,
+                cache_output=ref_range is not None,
+                skip_generated=skip_generated,
+                include_tests=include_tests,
+                show_skipped=show_skipped,
+            )
+        else:
+            output = run_pipeline(
+                diff_text,
+                range_label,
+                content_provider,
+                skip_generated=skip_generated,
+                include_tests=include_tests,
+                show_skipped=show_skipped,
+            )
 
         has_parse_errors = any(fc.parse_error for fc in output.files)
 
@@ -273,18 +361,22 @@ def _run_review(
                 click.echo("No changes found.", err=True)
             sys.exit(EXIT_SUCCESS)
 
-        output = run_pipeline(diff_text, ref_range, content_provider)
+        output = _run_repo_pipeline(
+            repo, diff_text, ref_range, content_provider, cache_output=mode == "committed"
+        )
 
         findings = extract_findings(output)
         names = list(dict.fromkeys(finding.change.name for finding in findings))
         dep_refs = None
         if deps and names:
-            scan = scan_references(repo, names, reference_snapshot)
+            scan = scan_references(
+                repo, names, reference_snapshot, index_source=cache.make_cached_indexer(repo)
+            )
             dep_refs = scan.references
             output.meta.warnings.extend(scan.warnings)
 
         if dep_refs is not None:
-            findings = extract_findings(output, dep_refs)
+            findings = attach_references(findings, dep_refs)
         has_findings = bool(findings)
 
         if fmt == "json":
@@ -6,6 +6,7 @@ access; :mod:`diffguard.git` produces the text this module consumes.
 
 from __future__ import annotations
 
+import functools
 import posixpath
 import re
 from dataclasses import dataclass, field
@@ -34,7 +35,7 @@ DEFAULT_GENERATED_PATTERNS: tuple[str, ...] = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HunkHeader:
     """Parsed @@ header."""
 
@@ -45,7 +46,7 @@ class HunkHeader:
     section: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffLine:
     """A single line from a diff hunk."""
 
@@ -55,7 +56,7 @@ class DiffLine:
     new_lineno: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffHunk:
     """A contiguous hunk."""
 
@@ -63,9 +64,13 @@ class DiffHunk:
     lines: list[DiffLine] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDiff:
-    """Parsed diff for a single file."""
+    """Parsed diff for a single file.
+
+    ``additions`` and ``deletions`` count ``+`` and ``-`` lines across
+    ``hunks``; :func:`parse_diff` maintains them as it appends lines.
+    """
 
     old_path: str | None  # None for new files
     new_path: str | None  # None for deleted files
@@ -73,21 +78,15 @@ class FileDiff:
     binary: bool = False
     generated: bool = False
     hunks: list[DiffHunk] = field(default_factory=list)
+    additions: int = 0
+    deletions: int = 0
 
     @property
     def path(self) -> str:
         return self.new_path or self.old_path or ""
 
-    @property
-    def additions(self) -> int:
-        return sum(1 for h in self.hunks for ln in h.lines if ln.origin == "+")
-
-    @property
-    def deletions(self) -> int:
-        return sum(1 for h in self.hunks for ln in h.lines if ln.origin == "-")
 
-
-_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)?$")
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
 
 
 def _decode_git_quoted_path(token: str) -> str:
@@ -181,19 +180,36 @@ def _parse_git_header_paths(line: str) -> tuple[str, str] | None:
     return candidates[-1] if candidates else None
 
 
-def is_generated(path: str, patterns: tuple[str, ...] = DEFAULT_GENERATED_PATTERNS) -> bool:
-    """Check whether a file path matches generated/vendored patterns."""
+@functools.lru_cache(maxsize=32)
+def _partition_generated_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...], tuple[str, ...]]:
+    """Split *patterns* into exact paths, path suffixes, and directory markers.
+
+    Basename patterns contribute both an exact path and a ``/name`` suffix, so
+    each kind of pattern is checked with one set lookup or ``str.endswith``.
+    """
+    exact: set[str] = set()
+    suffixes: list[str] = []
+    directories: list[str] = []
     for pat in patterns:
         if pat.endswith("/"):  # directory prefix
-            if f"/{pat}" in f"/{path}" or path.startswith(pat):
-                return True
+            directories.append(f"/{pat}")
         elif pat.startswith("."):  # extension/suffix
-            if path.endswith(pat):
-                return True
+            suffixes.append(pat)
         else:  # exact filename (basename)
-            if path == pat or path.endswith(f"/{pat}"):
-                return True
-    return False
+            exact.add(pat)
+            suffixes.append(f"/{pat}")
+    return frozenset(exact), tuple(suffixes), tuple(directories)
+
+
+def is_generated(path: str, patterns: tuple[str, ...] = DEFAULT_GENERATED_PATTERNS) -> bool:
+    """Check whether a file path matches generated/vendored patterns."""
+    exact, suffixes, directories = _partition_generated_patterns(patterns)
+    if path in exact or path.endswith(suffixes):
+        return True
+    rooted = f"/{path}"
+    return any(directory in rooted for directory in directories)
 
 
 def _normalized_path_key(path: str) -> str:
@@ -238,6 +254,8 @@ def _coalesce_recreated_files(files: list[FileDiff]) -> list[FileDiff]:
         removed.binary = removed.binary or added.binary
         removed.generated = removed.generated or added.generated
         removed.hunks.extend(added.hunks)
+        removed.additions += added.additions
+        removed.deletions += added.deletions
         additions_to_remove.add(added_index)
 
     return [file_diff for index, file_diff in enumerate(files) if index not in additions_to_remove]
@@ -338,15 +356,16 @@ def _parse_hunks(lines: list[str], i: int, file_diff: FileDiff) -> int:
         if match is None:
             i += 1
             continue
+        # Omitted counts default to one line; the section group always matches.
+        old_start, old_count, new_start, new_count, section = match.groups("1")
         header = HunkHeader(
-            old_start=int(match.group(1)),
-            old_count=int(match.group(2) or "1"),
-            new_start=int(match.group(3)),
-            new_count=int(match.group(4) or "1"),
-            section=match.group(5).strip() if match.group(5) else "",
+            old_start=int(old_start),
+            old_count=int(old_count),
+            new_start=int(new_start),
+            new_count=int(new_count),
+            section=section.strip(),
         )
-        hunk, i = _parse_hunk_body(lines, i, header)
-        file_diff.hunks.append(hunk)
+        i = _parse_hunk_body(lines, i, header, file_diff)
     return i
 
 
@@ -358,38 +377,48 @@ def _blank_is_context(lines: list[str], i: int) -> bool:
     )
 
 
-def _parse_hunk_body(lines: list[str], i: int, header: HunkHeader) -> tuple[DiffHunk, int]:
-    """Parse a hunk's body lines. *i* indexes the ``@@`` header; returns the
-    populated hunk and the index of the first line past it."""
+def _parse_hunk_body(lines: list[str], i: int, header: HunkHeader, file_diff: FileDiff) -> int:
+    """Parse a hunk's body lines into *file_diff*. *i* indexes the ``@@``
+    header; returns the index of the first line past the hunk."""
     hunk = DiffHunk(header=header)
     i += 1
     old_ln = header.old_start
     new_ln = header.new_start
-
-    while i < len(lines) and not lines[i].startswith(("diff --git ", "@@")):
+    context = 0
+
+    # One dispatch on the first character per line: body lines vastly
+    # outnumber the headers that end the hunk. DiffLine arguments are
+    # positional (origin, content, old_lineno, new_lineno) on this path.
+    append = hunk.lines.append
+    end = len(lines)
+    while i < end:
         dl = lines[i]
-        if dl.startswith("+"):
-            hunk.lines.append(DiffLine(origin="+", content=dl[1:], new_lineno=new_ln))
+        origin = dl[:1]
+        if origin == "+":
+            append(DiffLine("+", dl[1:], None, new_ln))
             new_ln += 1
-        elif dl.startswith("-"):
-            hunk.lines.append(DiffLine(origin="-", content=dl[1:], old_lineno=old_ln))
+        elif origin == "-":
+            append(DiffLine("-", dl[1:], old_ln))
             old_ln += 1
-        elif dl.startswith(" "):
-            hunk.lines.append(
-                DiffLine(origin=" ", content=dl[1:], old_lineno=old_ln, new_lineno=new_ln)
-            )
+        elif origin == " ":
+            append(DiffLine(" ", dl[1:], old_ln, new_ln))
             old_ln += 1
             new_ln += 1
-        elif dl == "" and _blank_is_context(lines, i):
-            hunk.lines.append(
-                DiffLine(origin=" ", content="", old_lineno=old_ln, new_lineno=new_ln)
-            )
+            context += 1
+        elif not dl:
+            if not _blank_is_context(lines, i):
+                i += 1
+                break  # a blank line with nothing after it ends the diff
+            append(DiffLine(" ", "", old_ln, new_ln))
             old_ln += 1
             new_ln += 1
-        elif dl == "":
-            i += 1
-            break  # a blank line with nothing after it ends the diff
+            context += 1
+        elif dl.startswith(("diff --git ", "@@")):
+            break
         # else: "\ No newline at end of file" / any other line — skip, don't record.
         i += 1
 
-    return hunk, i
+    file_diff.hunks.append(hunk)
+    file_diff.additions += new_ln - header.new_start - context
+    file_diff.deletions += old_ln - header.old_start - context
+    return i
@@ -18,7 +18,25 @@ _TEST_PATH_RE = re.compile(
     re.IGNORECASE,
 )
 
+# The same rules as plain string checks, used for ASCII paths where
+# ``str.lower`` agrees with the regex's case-insensitive matching.
+_TEST_DIRS = frozenset({"test", "tests", "spec", "__tests__"})
+_TEST_SUFFIXES = (
+    "_test.py",
+    *(
+        f"{separator}{role}.{ext}"
+        for separator in "._"
+        for role in ("spec", "test")
+        for ext in ("ts", "js", "tsx", "jsx")
+    ),
+)
+
 
 def is_test_file(path: str) -> bool:
     """Return True if *path* looks like a test file."""
-    return _TEST_PATH_RE.search(path) is not None
+    if not path.isascii():
+        return _TEST_PATH_RE.search(path) is not None
+    *directories, name = path.lower().split("/")
+    if not _TEST_DIRS.isdisjoint(directories):
+        return True
+    return name.endswith(_TEST_SUFFIXES) or (name.startswith("test_") and name.endswith(".py"))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import re
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -17,9 +16,12 @@ Confidence = Literal["high", "medium", "low"]
 """Confidence in an analysis statement, never a probability."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Symbol:
-    """A parsed symbol from source code."""
+    """A parsed symbol from source code.
+
+    Slotted because parsers create one per function, class, and method.
+    """
 
     name: str
     kind: ParsedSymbolKind
@@ -102,5 +104,5 @@ class ReferenceScan:
 
 def compute_body_hash(body: str) -> str:
     """Compute hash of body text, normalized to ignore whitespace differences."""
-    normalized = re.sub(r"\s+", " ", body.strip())
-    return hashlib.md5(normalized.encode("utf-8")).hexdigest()  # noqa: S324
+    normalized = " ".join(body.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -6,10 +6,15 @@ tree-sitter scanning that confirms textual matches are real references.
 
 from __future__ import annotations
 
+import functools
+import re
+from typing import Protocol
+
 import tree_sitter
 
 from diffguard.engine._types import Reference, ReferenceScan, RefContext
 from diffguard.git import (
+    BlobBatchReader,
     get_file_at_snapshot,
     grep_files,
     list_files_at_snapshot_with_status,
@@ -49,6 +54,18 @@ _IMPORT_PARENT_TYPES: set[str] = {
 }
 
 
+# (name, line, context, stripped source line) for one identifier occurrence.
+IdentifierHit = tuple[str, int, RefContext, str]
+
+
+class SourceIndexer(Protocol):
+    """Callable with the signature of :func:`index_identifiers`."""
+
+    def __call__(
+        self, source: str, language: str, *, file_path: str | None = None
+    ) -> tuple[list[IdentifierHit], bool]: ...
+
+
 def _unreadable_candidate_warning(file_path: str, ref: str) -> str:
     """Return the stable analysis-gap warning for an unreadable grep candidate."""
     return (
@@ -62,16 +79,6 @@ def _unavailable_listing_warning(ref: str) -> str:
     return f"reference file listing unavailable at snapshot {ref} — reference analysis incomplete"
 
 
-def _is_import_context(node: tree_sitter.Node) -> bool:
-    """Check if a node is in an import context by walking parents."""
-    current = node.parent
-    while current is not None:
-        if current.type in _IMPORT_PARENT_TYPES:
-            return True
-        current = current.parent
-    return False
-
-
 _CALL_TYPES = {"call", "call_expression"}
 _CALLABLE_EXPRESSION_TYPES = {"attribute", "member_expression", "selector_expression"}
 _CALLABLE_MEMBER_FIELDS = {
@@ -315,9 +322,18 @@ def _is_call_context(node: tree_sitter.Node) -> bool:
     return False
 
 
-def _is_declaration_context(node: tree_sitter.Node, language: str) -> bool:
-    """Exclude declarations, binding targets, and syntax-only labels."""
-    if _is_match_pattern_binding(node):
+def _is_declaration_context(
+    node: tree_sitter.Node,
+    language: str,
+    *,
+    in_case_pattern: bool = True,
+) -> bool:
+    """Exclude declarations, binding targets, and syntax-only labels.
+
+    Callers that already know *node* is outside every ``case_pattern`` pass
+    ``in_case_pattern=False`` to skip the match-binding ancestor walk.
+    """
+    if in_case_pattern and _is_match_pattern_binding(node):
         return True
 
     current = node
@@ -355,13 +371,178 @@ def _is_declaration_context(node: tree_sitter.Node, language: str) -> bool:
     return False
 
 
+class _SourceLines:
+    """Stripped source line text for nodes, decoded once per line.
+
+    Lines are cut from the UTF-8 buffer at the node's own row start, so they
+    follow tree-sitter's row numbering (``\\n`` only) rather than
+    :meth:`str.splitlines`, which also breaks on form feeds and other
+    separators.
+    """
+
+    def __init__(self, source_bytes: bytes) -> None:
+        self._source_bytes = source_bytes
+        self._lines: dict[int, str] = {}
+
+    def __call__(self, node: tree_sitter.Node) -> str:
+        row = node.start_point.row
+        text = self._lines.get(row)
+        if text is None:
+            start = node.start_byte - node.start_point.column
+            end = self._source_bytes.find(b"\n", node.start_byte)
+            if end < 0:
+                end = len(self._source_bytes)
+            text = self._source_bytes[start:end].decode("utf-8").strip()
+            self._lines[row] = text
+        return text
+
+
+def index_identifiers(
+    source: str,
+    language: str,
+    *,
+    file_path: str | None = None,
+) -> tuple[list[IdentifierHit], bool]:
+    """Return every non-declaration identifier occurrence in *source*.
+
+    The index does not depend on which names are being searched for, so it
+    can be cached by source content and filtered per scan.
+    """
+    parser = get_parser(language, file_path=file_path)
+    source_bytes = source.encode("utf-8")
+    tree = parser.parse(source_bytes)
+    source_line = _SourceLines(source_bytes)
+
+    id_types = _IDENTIFIER_TYPES.get(language, {"identifier"})
+    results: list[IdentifierHit] = []
+
+    # Iterative cursor walk: no per-node child lists and no recursion limit.
+    # ``ancestry`` records, per depth, whether an import node or a match-case
+    # pattern encloses the cursor, replacing per-identifier parent walks.
+    cursor = tree.walk()
+    ancestry: list[tuple[bool, bool]] = [(False, False)]
+    visited_children = False
+    while True:
+        if not visited_children:
+            node = cursor.node
+            if node is None:
+                break
+            in_import, in_case_pattern = ancestry[-1]
+            if node.type in id_types and not _is_declaration_context(
+                node, language, in_case_pattern=in_case_pattern
+            ):
+                name = source_bytes[node.start_byte : node.end_byte].decode("utf-8")
+                line = node.start_point.row + 1
+                if in_import:
+                    ctx: RefContext = "import"
+                elif _is_call_context(node):
+                    ctx = "call"
+                else:
+                    ctx = "reference"
+                results.append((name, line, ctx, source_line(node)))
+            if cursor.goto_first_child():
+                ancestry.append(
+                    (
+                        in_import or node.type in _IMPORT_PARENT_TYPES,
+                        in_case_pattern or node.type == "case_pattern",
+                    )
+                )
+                continue
+        if cursor.goto_next_sibling():
+            visited_children = False
+        elif cursor.goto_parent():
+            ancestry.pop()
+            visited_children = True
+        else:
+            break
+
+    return results, tree.root_node.has_error
+
+
+@functools.lru_cache(maxsize=8)
+def _name_pattern(symbol_names: frozenset[str]) -> re.Pattern[bytes]:
+    """Compile one pattern matching any of *symbol_names* as a whole token."""
+    alternatives = b"|".join(
+        re.escape(name.encode("utf-8")) for name in sorted(symbol_names, key=len, reverse=True)
+    )
+    return re.compile(rb"(?<![A-Za-z0-9_$])(?:" + alternatives + rb")(?![A-Za-z0-9_$])")
+
+
+def _has_name_token(source: str, symbol_names: set[str]) -> bool:
+    """Return whether any of *symbol_names* occurs in *source* as a whole token."""
+    if not symbol_names:
+        return False
+    return _name_pattern(frozenset(symbol_names)).search(source.encode("utf-8")) is not None
+
+
+def find_named_identifiers(
+    source: str,
+    language: str,
+    symbol_names: set[str],
+    *,
+    file_path: str | None = None,
+) -> tuple[list[IdentifierHit], bool]:
+    """Return :func:`index_identifiers` hits for *symbol_names* only.
+
+    Occurrences are located with one byte-level pattern scan, then confirmed
+    against the syntax tree, so identifiers that cannot match are never
+    visited. Text inside strings and comments resolves to a non-identifier
+    node and is discarded. Sources with no occurrence at all are not parsed
+    and report no parse gap, since no identifier in them could match.
+    """
+    source_bytes = source.encode("utf-8")
+    matches = list(_name_pattern(frozenset(symbol_names)).finditer(source_bytes))
+    if not symbol_names or not matches:
+        return [], False
+
+    parser = get_parser(language, file_path=file_path)
+    tree = parser.parse(source_bytes)
+    root = tree.root_node
+    id_types = _IDENTIFIER_TYPES.get(language, {"identifier"})
+    names_by_token = {name.encode("utf-8"): name for name in symbol_names}
+    source_line = _SourceLines(source_bytes)
+    results: list[IdentifierHit] = []
+    for match in matches:
+        start, end = match.span()
+        # Grammars may nest equal-width nodes; report them outermost first,
+        # as the full traversal does.
+        node: tree_sitter.Node | None = root.descendant_for_byte_range(start, end)
+        spanning: list[tree_sitter.Node] = []
+        while node is not None and node.start_byte == start and node.end_byte == end:
+            spanning.append(node)
+            node = node.parent
+        for node in reversed(spanning):
+            if node.type not in id_types:
+                continue
+            in_import = False
+            in_case_pattern = False
+            ancestor = node.parent
+            while ancestor is not None:
+                in_import = in_import or ancestor.type in _IMPORT_PARENT_TYPES
+                in_case_pattern = in_case_pattern or ancestor.type == "case_pattern"
+                ancestor = ancestor.parent
+            if _is_declaration_context(node, language, in_case_pattern=in_case_pattern):
+                continue
+            name = names_by_token[match.group()]
+            line = node.start_point.row + 1
+            if in_import:
+                ctx: RefContext = "import"
+            elif _is_call_context(node):
+                ctx = "call"
+            else:
+                ctx = "reference"
+            results.append((name, line, ctx, source_line(node)))
+
+    return results, root.has_error
+
+
 def _scan_file_for_symbols(
     source: str,
     language: str,
     symbol_names: set[str],
     *,
     file_path: str | None = None,
-) -> list[tuple[str, int, RefContext, str]]:
+) -> list[IdentifierHit]:
     """Scan a file for references to symbol names."""
     hits, _ = _scan_file_for_symbols_with_status(
         source,
@@ -378,37 +559,21 @@ def _scan_file_for_symbols_with_status(
     symbol_names: set[str],
     *,
     file_path: str | None = None,
-) -> tuple[list[tuple[str, int, RefContext, str]], bool]:
+    index_source: SourceIndexer | None = None,
+) -> tuple[list[IdentifierHit], bool]:
     """Scan a file and retain tree-sitter's parse-gap status.
 
-    Returns hits plus whether tree-sitter reported a parse gap.
+    Returns hits plus whether tree-sitter reported a parse gap. Without an
+    *index_source*, only occurrences of *symbol_names* are examined. Files
+    with no whole-token occurrence of any name (for example, grep matched a
+    longer identifier) are skipped without consulting the index.
     """
-    parser = get_parser(language, file_path=file_path)
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
-    source_lines = source.splitlines()
-
-    id_types = _IDENTIFIER_TYPES.get(language, {"identifier"})
-    results: list[tuple[str, int, RefContext, str]] = []
-
-    def _walk(node: tree_sitter.Node) -> None:
-        if node.type in id_types:
-            name = source_bytes[node.start_byte : node.end_byte].decode("utf-8")
-            if name in symbol_names and not _is_declaration_context(node, language):
-                line = node.start_point.row + 1
-                if _is_import_context(node):
-                    ctx: RefContext = "import"
-                elif _is_call_context(node):
-                    ctx = "call"
-                else:
-                    ctx = "reference"
-                src_line = source_lines[line - 1].strip() if line <= len(source_lines) else ""
-                results.append((name, line, ctx, src_line))
-        for child in node.children:
-            _walk(child)
-
-    _walk(tree.root_node)
-    return results, tree.root_node.has_error
+    if index_source is None:
+        return find_named_identifiers(source, language, symbol_names, file_path=file_path)
+    if not _has_name_token(source, symbol_names):
+        return [], False
+    hits, parse_error = index_source(source, language, file_path=file_path)
+    return [hit for hit in hits if hit[0] in symbol_names], parse_error
 
 
 def _candidate_files(symbols: set[str], ref: str, repo_path: str) -> set[str] | None:
@@ -417,13 +582,10 @@ def _candidate_files(symbols: set[str], ref: str, repo_path: str) -> set[str] |
     An empty set is a definitive no-match result. ``None`` means candidate
     discovery was unavailable and signals the caller to scan all files.
     """
-    candidates: set[str] = set()
-    for symbol in symbols:
-        hits = grep_files(symbol, ref, repo_path, _GREP_GLOBS)
-        if hits is None:  # git grep unavailable -> scan all
-            return None
-        candidates.update(hits)
-    return candidates
+    hits = grep_files(sorted(symbols), ref, repo_path, _GREP_GLOBS)
+    if hits is None:  # git grep unavailable -> scan all
+        return None
+    return set(hits)
 
 
 def scan_references(
@@ -431,6 +593,8 @@ def scan_references(
     changed_symbols: list[str],
     ref: str,
     changed_files: set[str] | None = None,
+    *,
+    index_source: SourceIndexer | None = None,
 ) -> ReferenceScan:
     """Find syntactic references to changed names in a repository snapshot.
 
@@ -440,6 +604,9 @@ def scan_references(
         repo_path: Path to the git repository.
         changed_symbols: List of symbol names to search for.
         ref: Git ref to scan files at (e.g. HEAD or the "after" ref).
+        index_source: Optional identifier indexer, such as a cached
+            :func:`index_identifiers`. By default each file is searched for
+            the requested names directly.
     Returns:
         References and parse-gap warnings. ``changed_files`` is accepted for
         call compatibility but deliberately not excluded: declaration AST
@@ -463,6 +630,23 @@ def scan_references(
     else:
         files_to_scan = sorted(candidate_files)
 
+    with BlobBatchReader(repo_path) as reader:
+        references = _scan_files(
+            repo_path, files_to_scan, ref, symbol_names, index_source, reader, warnings
+        )
+    return ReferenceScan(references=references, warnings=sorted(set(warnings)))
+
+
+def _scan_files(
+    repo_path: str,
+    files_to_scan: list[str],
+    ref: str,
+    symbol_names: set[str],
+    index_source: SourceIndexer | None,
+    reader: BlobBatchReader,
+    warnings: list[str],
+) -> list[Reference]:
+    """Scan each candidate file, appending analysis gaps to *warnings*."""
     references: list[Reference] = []
 
     for file_path in files_to_scan:
@@ -470,7 +654,7 @@ def scan_references(
         if language is None:
             continue
 
-        source = get_file_at_snapshot(ref, file_path, repo_path=repo_path)
+        source = get_file_at_snapshot(ref, file_path, repo_path=repo_path, reader=reader)
         if source is None:
             warnings.append(_unreadable_candidate_warning(file_path, ref))
             continue
@@ -481,6 +665,7 @@ def scan_references(
                 language,
                 symbol_names,
                 file_path=file_path,
+                index_source=index_source,
             )
         except UnicodeEncodeError:
             # Commit/index reads use surrogateescape so invalid UTF-8 can reach
@@ -504,7 +689,7 @@ def scan_references(
             )
 
     references.sort(key=lambda r: (r.file_path, r.line))
-    return ReferenceScan(references=references, warnings=sorted(set(warnings)))
+    return references
 
 
 def find_references(
@@ -9,12 +9,14 @@ objects so the trigger logic lives in exactly one place.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from diffguard.engine._paths import is_test_file
 from diffguard.engine._types import Reference
 from diffguard.schema import DiffGuardOutput, FileChange, SymbolChange
 
+_REMOVED_KINDS = frozenset({"function_removed", "class_removed"})
+
 
 def is_high_signal(sc: SymbolChange) -> bool:
     """Return True if a symbol change is worth surfacing to a reviewer.
@@ -23,17 +25,12 @@ def is_high_signal(sc: SymbolChange) -> bool:
     changes, breaking changes, removed symbols, and moved symbols. Body-only
     changes (same signature, different implementation) are *not* high-signal.
     """
-    return bool(
-        (sc.before_signature and sc.after_signature)
-        or sc.breaking
-        or sc.kind.endswith("_removed")
-        or sc.kind == "moved"
-    )
+    return _high_signal_category(sc) is not None
 
 
 def categorize_change(sc: SymbolChange) -> str:
     """Return a category label for a high-signal change."""
-    if sc.kind.endswith("_removed"):
+    if sc.kind in _REMOVED_KINDS:
         return "SYMBOL REMOVED"
     if sc.kind == "moved":
         return sc.category or "POSSIBLE SYMBOL MOVE"
@@ -42,6 +39,19 @@ def categorize_change(sc: SymbolChange) -> str:
     return "CHANGED"
 
 
+def _high_signal_category(sc: SymbolChange) -> str | None:
+    """Return the category of a high-signal change, or ``None`` for silence.
+
+    Tests each kind once so extraction does not repeat the trigger checks
+    when it categorizes.
+    """
+    if sc.kind in _REMOVED_KINDS or sc.kind == "moved":
+        return categorize_change(sc)
+    if (sc.before_signature and sc.after_signature) or sc.breaking:
+        return sc.category or "CHANGED"
+    return None
+
+
 @dataclass(frozen=True)
 class Finding:
     """A high-signal change plus unresolved syntactic reference evidence.
@@ -86,23 +96,37 @@ def extract_findings(
 
     Each finding is annotated with syntactic production and test references.
     """
-    refs_by_symbol: dict[str, list[Reference]] = {}
-    for ref in dep_refs or []:
-        refs_by_symbol.setdefault(ref.symbol_name, []).append(ref)
-
-    findings: list[Finding] = []
-    for fc in output.files:
-        for sc in fc.changes:
-            if not is_high_signal(sc):
-                continue
-            references = refs_by_symbol.get(sc.name, [])
-            findings.append(
-                Finding(
-                    file=fc,
-                    change=sc,
-                    category=categorize_change(sc),
-                    prod_references=[ref for ref in references if not is_test_file(ref.file_path)],
-                    test_references=[ref for ref in references if is_test_file(ref.file_path)],
-                )
-            )
+    findings = [
+        Finding(file=fc, change=sc, category=category)
+        for fc in output.files
+        for sc in fc.changes
+        if (category := _high_signal_category(sc)) is not None
+    ]
+    if dep_refs:
+        findings = attach_references(findings, dep_refs)
     return findings
+
+
+def attach_references(findings: list[Finding], dep_refs: list[Reference]) -> list[Finding]:
+    """Return *findings* annotated with production and test references.
+
+    Lets a caller that already filtered and categorized the change set add
+    reference evidence without walking the pipeline output again. References
+    are split into production and test buckets once, up front, so each
+    reference path is classified a single time however many findings share
+    the symbol name.
+    """
+    prod_refs_by_symbol: dict[str, list[Reference]] = {}
+    test_refs_by_symbol: dict[str, list[Reference]] = {}
+    for ref in dep_refs:
+        bucket = test_refs_by_symbol if is_test_file(ref.file_path) else prod_refs_by_symbol
+        bucket.setdefault(ref.symbol_name, []).append(ref)
+
+    return [
+        replace(
+            finding,
+            prod_references=list(prod_refs_by_symbol.get(finding.change.name, ())),
+            test_references=list(test_refs_by_symbol.get(finding.change.name, ())),
+        )
+        for finding in findings
+    ]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass, field
+
 from diffguard.engine._types import MatchedSymbol, Symbol
 
 SymbolKey = tuple[str, str, str | None]
@@ -16,6 +19,21 @@ UnmatchedByFile = dict[str, UnmatchedFileSymbols]
 LocatedSymbol = tuple[str, Symbol]
 
 
+@dataclass(frozen=True)
+class SymbolMatches:
+    """Result of :func:`match_symbols`.
+
+    ``matches`` holds only pairs that may classify as a change: identical
+    pairs (same signature and body hash) are omitted. It includes one-sided
+    records for additions and removals; the ``unmatched_*`` lists repeat those
+    symbols as cross-file move candidates.
+    """
+
+    matches: list[MatchedSymbol] = field(default_factory=list)
+    unmatched_old: list[Symbol] = field(default_factory=list)
+    unmatched_new: list[Symbol] = field(default_factory=list)
+
+
 def _key(s: Symbol) -> SymbolKey:
     return (s.name, s.kind, s.parent)
 
@@ -35,85 +53,102 @@ def _build_index(symbols: list[Symbol]) -> dict[SymbolKey, list[Symbol]]:
 def match_symbols(
     old_symbols: list[Symbol],
     new_symbols: list[Symbol],
-) -> list[MatchedSymbol]:
+) -> SymbolMatches:
     """Match old symbols to new symbols by (name, kind, parent) key.
 
     For duplicates with the same key, falls back to signature comparison,
-    then positional order.
+    then positional order. Unmatched symbols are collected while pairing, so
+    callers need no second pass to find move candidates.
     """
     old_index = _build_index(old_symbols)
     new_index = _build_index(new_symbols)
 
     all_keys = dict.fromkeys([*old_index, *new_index])
-    results: list[MatchedSymbol] = []
+    result = SymbolMatches()
 
     for key in all_keys:
-        olds = list(old_index.get(key, []))
-        news = list(new_index.get(key, []))
+        olds = old_index.get(key, [])
+        news = new_index.get(key, [])
 
         # Match by signature first for duplicates
         if len(olds) > 1 or len(news) > 1:
-            _match_duplicates(olds, news, results)
+            _match_duplicates(olds, news, result)
+        elif olds and news:
+            _pair(olds[0], news[0], result)
+        elif olds:
+            result.matches.append(MatchedSymbol(old=olds[0], new=None))
+            result.unmatched_old.append(olds[0])
         else:
-            if olds and news:
-                results.append(MatchedSymbol(old=olds[0], new=news[0]))
-            elif olds:
-                for o in olds:
-                    results.append(MatchedSymbol(old=o, new=None))
-            else:
-                for n in news:
-                    results.append(MatchedSymbol(old=None, new=n))
+            result.matches.append(MatchedSymbol(old=None, new=news[0]))
+            result.unmatched_new.append(news[0])
 
-    return results
+    return result
+
+
+def _pair(old: Symbol, new: Symbol, result: SymbolMatches) -> None:
+    """Record a matched pair unless it is identical and cannot be a change."""
+    if old.body_hash != new.body_hash or old.signature != new.signature:
+        result.matches.append(MatchedSymbol(old=old, new=new))
 
 
 def _match_duplicates(
     olds: list[Symbol],
     news: list[Symbol],
-    results: list[MatchedSymbol],
+    result: SymbolMatches,
 ) -> None:
     """Match duplicates by signature, then positional order."""
-    remaining_old = list(olds)
-    remaining_new = list(news)
-
-    # Pass 1: exact signature match
-    for o in list(remaining_old):
-        for n in list(remaining_new):
-            if o.signature == n.signature:
-                results.append(MatchedSymbol(old=o, new=n))
-                remaining_old.remove(o)
-                remaining_new.remove(n)
-                break
+    used_new = [False] * len(news)
+    new_by_signature: dict[str, deque[int]] = {}
+    for j, n in enumerate(news):
+        new_by_signature.setdefault(n.signature, deque()).append(j)
+
+    # Pass 1: exact signature match, pairing each old with the earliest
+    # unused new symbol that shares its signature.
+    remaining_old: list[Symbol] = []
+    for o in olds:
+        candidates = new_by_signature.get(o.signature)
+        if candidates:
+            j = candidates.popleft()
+            used_new[j] = True
+            _pair(o, news[j], result)
+        else:
+            remaining_old.append(o)
+    remaining_new = [n for j, n in enumerate(news) if not used_new[j]]
 
     # Pass 2: positional pairing
-    while remaining_old and remaining_new:
-        results.append(MatchedSymbol(old=remaining_old.pop(0), new=remaining_new.pop(0)))
+    paired = min(len(remaining_old), len(remaining_new))
+    for o, n in zip(remaining_old[:paired], remaining_new[:paired]):
+        _pair(o, n, result)
+    remaining_old = remaining_old[paired:]
+    remaining_new = remaining_new[paired:]
 
     # Leftovers
     for o in remaining_old:
-        results.append(MatchedSymbol(old=o, new=None))
+        result.matches.append(MatchedSymbol(old=o, new=None))
     for n in remaining_new:
-        results.append(MatchedSymbol(old=None, new=n))
+        result.matches.append(MatchedSymbol(old=None, new=n))
+    result.unmatched_old.extend(remaining_old)
+    result.unmatched_new.extend(remaining_new)
 
 
 def _match_unique_cross_file_evidence(
     old_records: list[LocatedSymbol],
     new_records: list[LocatedSymbol],
-    matched_old: set[int],
-    matched_new: set[int],
     results: list[MatchedSymbol],
     *,
     require_signature: bool,
     require_body: bool,
-) -> None:
-    """Match one evidence tier only where both sides have one candidate."""
+) -> tuple[list[LocatedSymbol], list[LocatedSymbol]]:
+    """Match one evidence tier only where both sides have one candidate.
+
+    Returns the records left unmatched on each side, so later tiers only scan
+    symbols that are still candidates.
+    """
     candidates_by_old: dict[int, list[int]] = {}
     candidates_by_new: dict[int, list[int]] = {}
     for old_index, (old_file, old_symbol) in enumerate(old_records):
-        if old_index in matched_old:
-            continue
         for new_index, (new_file, new_symbol) in enumerate(new_records):
-            if new_index in matched_new or new_file == old_file:
+            if new_file == old_file:
                 continue
             if require_signature and old_symbol.signature != new_symbol.signature:
                 continue
@@ -122,6 +157,8 @@ def _match_unique_cross_file_evidence(
             candidates_by_old.setdefault(old_index, []).append(new_index)
             candidates_by_new.setdefault(new_index, []).append(old_index)
 
+    matched_old: set[int] = set()
+    matched_new: set[int] = set()
     for old_index, candidates in candidates_by_old.items():
         if len(candidates) != 1:
             continue
@@ -141,6 +178,13 @@ def _match_unique_cross_file_evidence(
         matched_old.add(old_index)
         matched_new.add(new_index)
 
+    if not matched_old:
+        return old_records, new_records
+    return (
+        [record for index, record in enumerate(old_records) if index not in matched_old],
+        [record for index, record in enumerate(new_records) if index not in matched_new],
+    )
+
 
 def match_cross_file(
     unmatched_old: UnmatchedByFile,
@@ -160,27 +204,29 @@ def match_cross_file(
         for symbol in symbols:
             old_by_key.setdefault(_cross_file_key(language, symbol), []).append((file_path, symbol))
 
+    if not old_by_key:
+        return results
+
+    # Additions whose identity never appears on the old side cannot be moves.
     new_by_key: dict[CrossFileSymbolKey, list[LocatedSymbol]] = {}
     for file_path, (language, symbols) in unmatched_new.items():
         for symbol in symbols:
-            new_by_key.setdefault(_cross_file_key(language, symbol), []).append((file_path, symbol))
+            key = _cross_file_key(language, symbol)
+            if key in old_by_key:
+                new_by_key.setdefault(key, []).append((file_path, symbol))
 
-    for key in dict.fromkeys([*old_by_key, *new_by_key]):
-        old_records = old_by_key.get(key, [])
+    for key, old_records in old_by_key.items():
         new_records = new_by_key.get(key, [])
-        matched_old: set[int] = set()
-        matched_new: set[int] = set()
-
         for require_signature, require_body in (
             (True, True),
             (True, False),
             (False, True),
         ):
-            _match_unique_cross_file_evidence(
+            if not old_records or not new_records:
+                break
+            old_records, new_records = _match_unique_cross_file_evidence(
                 old_records,
                 new_records,
-                matched_old,
-                matched_new,
                 results,
                 require_signature=require_signature,
                 require_body=require_body,
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 import time
-from typing import Callable
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
 
 from diffguard.engine._refs import split_ref_range
-from diffguard.engine._types import MatchedSymbol, Symbol
+from diffguard.engine._types import MatchedSymbol, ParseResult, Symbol
 from diffguard.engine.classifier import classify_changes
 from diffguard.engine.matcher import UnmatchedByFile, match_cross_file, match_symbols
 from diffguard.engine.parser import parse_file
@@ -28,39 +33,123 @@ logger = logging.getLogger(__name__)
 FileContentProvider = Callable[[str, str], str | None]
 """(ref, path) -> source text or None."""
 
+
+class SourceParser(Protocol):
+    """Callable with :func:`~diffguard.engine.parser.parse_file`'s signature."""
+
+    def __call__(
+        self, source: str, language: str, *, file_path: str | None = None
+    ) -> ParseResult: ...
+
+
+@dataclass(frozen=True)
+class _FileResult:
+    """Outcome of analysing one file diff, merged by :func:`run_pipeline`."""
+
+    file_change: FileChange
+    warnings: list[str] = field(default_factory=list)
+    unmatched_old: list[Symbol] = field(default_factory=list)
+    unmatched_new: list[Symbol] = field(default_factory=list)
+
+
+_PREFETCH_DEPTH = 32
+"""File sides read ahead of the analysis that consumes them."""
+
+
+class _PrefetchingProvider:
+    """Serve content reads that were submitted ahead of time.
+
+    Reads are issued in the order analysis will request them, at most
+    ``depth`` ahead of the consumer, so git streams the next blobs while
+    tree-sitter parses the current one. Requests that arrive before their
+    read was submitted are served directly and dropped from the queue.
+    """
+
+    def __init__(
+        self,
+        get_content: FileContentProvider,
+        keys: list[tuple[str, str]],
+        executor: Executor,
+        *,
+        depth: int = _PREFETCH_DEPTH,
+    ) -> None:
+        self._get_content = get_content
+        self._executor = executor
+        self._queued: deque[tuple[str, str]] = deque(keys)
+        self._skipped: Counter[tuple[str, str]] = Counter()
+        self._submitted: dict[tuple[str, str], deque[Future[str | None]]] = {}
+        self._lock = threading.Lock()
+        with self._lock:
+            for _ in range(depth):
+                self._submit_next()
+
+    def _submit_next(self) -> None:
+        while self._queued:
+            key = self._queued.popleft()
+            if self._skipped[key]:
+                self._skipped[key] -= 1
+                continue
+            future = self._executor.submit(self._get_content, *key)
+            self._submitted.setdefault(key, deque()).append(future)
+            return
+
+    def __call__(self, ref: str, file_path: str) -> str | None:
+        key = (ref, file_path)
+        with self._lock:
+            futures = self._submitted.get(key)
+            if futures:
+                future: Future[str | None] | None = futures.popleft()
+                if not futures:
+                    del self._submitted[key]
+                self._submit_next()
+            else:
+                future = None
+                self._skipped[key] += 1
+        if future is None:
+            return self._get_content(ref, file_path)
+        return future.result()
+
+
 _INCOMPLETE_DIFF_WARNING = (
     "diff contains file headers that could not be parsed — analysis incomplete"
 )
 
 
-def _split_diff_records(diff_text: str) -> list[str]:
-    """Return each raw ``diff --git`` record, excluding leading preamble."""
-    records: list[str] = []
-    current: list[str] = []
-    for line in diff_text.splitlines(keepends=True):
-        if line.startswith("diff --git "):
-            if current:
-                records.append("".join(current))
-            current = [line]
-        elif current:
-            current.append(line)
-    if current:
-        records.append("".join(current))
-    return records
+def _diff_record_headers(diff_text: str) -> list[str]:
+    """Return the ``diff --git`` line that opens each raw record.
 
-
-def _has_unparsed_diff_records(diff_text: str, *, skip_generated: bool) -> bool:
+    Records start at any :meth:`str.splitlines` boundary, but
+    :func:`parse_diff` reads lines split on ``\\n`` only, so a header runs to
+    the next newline or the next record, whichever comes first.
+    """
+    pieces = diff_text.splitlines(keepends=True)
+    headers: list[str] = []
+    for index, piece in enumerate(pieces):
+        if not piece.startswith("diff --git "):
+            continue
+        header = piece
+        while (
+            not header.endswith("\n")
+            and index + 1 < len(pieces)
+            and not pieces[index + 1].startswith("diff --git ")
+        ):
+            index += 1
+            header += pieces[index]
+        headers.append(header.removesuffix("\n"))
+    return headers
+
+
+def _has_unparsed_diff_records(diff_text: str) -> bool:
     """Detect raw file records discarded by the tolerant diff parser.
 
-    Parsing each record independently preserves valid duplicate headers used by
-    mode changes and worktree recreation while still exposing a malformed
-    record beside otherwise valid files.
+    Checking each record's header independently preserves valid duplicate
+    headers used by mode changes and worktree recreation while still exposing
+    a malformed record beside otherwise valid files. Whether a record parses
+    depends only on its header, so hunk bodies are not re-parsed.
     """
-    records = _split_diff_records(diff_text)
-    parsed_records = sum(
-        len(parse_diff(record, skip_generated=skip_generated)) for record in records
-    )
-    return parsed_records != len(records)
+    headers = _diff_record_headers(diff_text)
+    parsed_records = sum(len(parse_diff(header, skip_generated=True)) for header in headers)
+    return parsed_records != len(headers)
 
 
 def run_pipeline(
@@ -71,6 +160,8 @@ def run_pipeline(
     skip_generated: bool = False,
     include_tests: bool = False,
     show_skipped: bool = False,
+    parse_source: SourceParser = parse_file,
+    max_workers: int | None = None,
 ) -> DiffGuardOutput:
     """Run the full analysis pipeline on a unified diff.
 
@@ -79,7 +170,13 @@ def run_pipeline(
         ref_range: e.g. ``"abc123..def456"`` — used only for metadata.
         get_content: Optional callback ``(ref, path) -> source``.
             When *None*, file-level symbol analysis is skipped and only
-            diff-level stats are reported.
+            diff-level stats are reported. Reads are issued ahead of
+            parsing from a background thread.
+        parse_source: Parser used for each file side; callers may supply a
+            caching wrapper around :func:`parse_file`.
+        max_workers: Threads used to analyse files concurrently; defaults to
+            the CPU count. tree-sitter releases the GIL while parsing, so
+            *get_content* and *parse_source* must be thread-safe.
 
     Returns:
         Fully populated :class:`DiffGuardOutput`.
@@ -89,13 +186,9 @@ def run_pipeline(
     file_diffs = parse_diff(diff_text, skip_generated=skip_generated)
     file_changes: list[FileChange] = []
     warnings: list[str] = []
-    if _has_unparsed_diff_records(diff_text, skip_generated=skip_generated):
+    if _has_unparsed_diff_records(diff_text):
         warnings.append(_INCOMPLETE_DIFF_WARNING)
 
-    # For cross-file move detection
-    unmatched_old: UnmatchedByFile = {}
-    unmatched_new: UnmatchedByFile = {}
-
     # A path can occur more than once in an assembled worktree patch (for
     # example, malformed or otherwise ambiguous split records).  Path alone
     # cannot identify which FileChange owns a possible move in that case, so
@@ -105,17 +198,35 @@ def run_pipeline(
     for file_diff in file_diffs:
         path_counts[file_diff.path] = path_counts.get(file_diff.path, 0) + 1
 
-    for fd in file_diffs:
-        fc = _process_file(
-            fd,
-            ref_range,
-            get_content,
-            unmatched_old,
-            unmatched_new,
-            warnings,
-            collect_move_candidates=path_counts[fd.path] == 1,
-        )
-        file_changes.append(fc)
+    keys = _content_keys(file_diffs, ref_range) if get_content is not None else []
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="diffguard-prefetch") as prefetch:
+        provider = get_content
+        if get_content is not None and keys:
+            provider = _PrefetchingProvider(get_content, keys, prefetch)
+
+        def _analyse(fd: FileDiff) -> _FileResult:
+            return _process_file(fd, ref_range, provider, parse_source=parse_source)
+
+        workers = min(len(file_diffs), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_analyse, file_diffs))
+        else:
+            results = [_analyse(fd) for fd in file_diffs]
+
+    # Merge in diff order so warnings and move candidates stay deterministic.
+    unmatched_old: UnmatchedByFile = {}
+    unmatched_new: UnmatchedByFile = {}
+    for fd, result in zip(file_diffs, results):
+        file_changes.append(result.file_change)
+        warnings.extend(result.warnings)
+        language = result.file_change.language
+        if path_counts[fd.path] != 1 or language is None:
+            continue
+        if result.unmatched_old:
+            unmatched_old[fd.path] = (language, result.unmatched_old)
+        if result.unmatched_new:
+            unmatched_new[fd.path] = (language, result.unmatched_new)
 
     # Cross-file moves
     if unmatched_old and unmatched_new:
@@ -154,35 +265,58 @@ def run_pipeline(
 # ---------------------------------------------------------------------------
 
 
+def _needs_content(fd: FileDiff) -> bool:
+    """Whether :func:`_process_file` reads source for *fd*."""
+    return not fd.generated and not fd.binary and detect_language(fd.path) is not None
+
+
+def _content_keys(file_diffs: list[FileDiff], ref_range: str) -> list[tuple[str, str]]:
+    """Return ``(ref, path)`` reads in the order :func:`_process_file` issues them."""
+    old_ref, new_ref = split_ref_range(ref_range)
+    keys: list[tuple[str, str]] = []
+    for fd in file_diffs:
+        if not _needs_content(fd):
+            continue
+        if fd.old_path:
+            keys.append((old_ref, fd.old_path))
+        if fd.new_path:
+            keys.append((new_ref, fd.new_path))
+    return keys
+
+
 def _process_file(
     fd: FileDiff,
     ref_range: str,
     get_content: FileContentProvider | None,
-    unmatched_old: UnmatchedByFile,
-    unmatched_new: UnmatchedByFile,
-    warnings: list[str],
     *,
-    collect_move_candidates: bool,
-) -> FileChange:
-    """Process a single FileDiff into a FileChange."""
+    parse_source: SourceParser = parse_file,
+) -> _FileResult:
+    """Process a single FileDiff into a FileChange.
+
+    Pure with respect to shared state: warnings and cross-file move
+    candidates are returned rather than accumulated, so files can be
+    analysed concurrently.
+    """
     path = fd.path
 
     if fd.generated:
-        return FileChange(path=path, change_type=fd.change_type, generated=True)
+        return _FileResult(FileChange(path=path, change_type=fd.change_type, generated=True))
 
     if fd.binary:
-        return FileChange(path=path, change_type=fd.change_type, binary=True)
+        return _FileResult(FileChange(path=path, change_type=fd.change_type, binary=True))
 
     language = detect_language(path)
     if language is None:
-        return FileChange(
-            path=path,
-            change_type=fd.change_type,
-            unsupported_language=True,
+        return _FileResult(
+            FileChange(
+                path=path,
+                change_type=fd.change_type,
+                unsupported_language=True,
+            )
         )
 
     if get_content is None:
-        return FileChange(path=path, language=language, change_type=fd.change_type)
+        return _FileResult(FileChange(path=path, language=language, change_type=fd.change_type))
 
     # Resolve refs from ref_range
     old_ref, new_ref = split_ref_range(ref_range)
@@ -197,57 +331,63 @@ def _process_file(
     if (fd.old_path is not None and old_source is None) or (
         fd.new_path is not None and new_source is None
     ):
-        warnings.append(f"{path}: content unavailable at ref — symbol analysis skipped")
-        return FileChange(path=path, language=language, change_type=fd.change_type)
+        return _FileResult(
+            FileChange(path=path, language=language, change_type=fd.change_type),
+            [f"{path}: content unavailable at ref — symbol analysis skipped"],
+        )
 
     old_symbols: list[Symbol] = []
     new_symbols: list[Symbol] = []
     parse_error = False
 
+    pr: ParseResult | None = None
     if old_source is not None:
-        pr = parse_file(old_source, language, file_path=fd.old_path)
+        pr = parse_source(old_source, language, file_path=fd.old_path)
         if pr.parse_error:
             parse_error = True
         old_symbols = pr.symbols
 
     if new_source is not None:
-        pr = parse_file(new_source, language, file_path=fd.new_path)
+        # Pure renames and mode changes carry identical content; the dialect
+        # is chosen by extension, so reuse the old parse when that matches too.
+        if (
+            pr is None
+            or new_source != old_source
+            or os.path.splitext(fd.new_path or "")[1] != os.path.splitext(fd.old_path or "")[1]
+        ):
+            pr = parse_source(new_source, language, file_path=fd.new_path)
         if pr.parse_error:
             parse_error = True
         new_symbols = pr.symbols
 
     if parse_error:
-        warnings.append(f"{path}: parse gap — symbol analysis skipped")
-        return FileChange(
-            path=path,
-            language=language,
-            change_type=fd.change_type,
-            parse_error=True,
+        return _FileResult(
+            FileChange(
+                path=path,
+                language=language,
+                change_type=fd.change_type,
+                parse_error=True,
+            ),
+            [f"{path}: parse gap — symbol analysis skipped"],
         )
 
-    matches = match_symbols(old_symbols, new_symbols)
+    matched = match_symbols(old_symbols, new_symbols)
     changes = classify_changes(
-        matches,
+        matched.matches,
         lambda old, new: compare_signatures(old, new, language),
     )
 
-    # Collect unmatched for cross-file move detection
-    matched_old_ids = {id(m.old) for m in matches if m.old and m.new}
-    matched_new_ids = {id(m.new) for m in matches if m.old and m.new}
-    um_old = [s for s in old_symbols if id(s) not in matched_old_ids]
-    um_new = [s for s in new_symbols if id(s) not in matched_new_ids]
-    if collect_move_candidates and um_old:
-        unmatched_old[path] = (language, um_old)
-    if collect_move_candidates and um_new:
-        unmatched_new[path] = (language, um_new)
-
-    return FileChange(
+    file_change = FileChange(
         path=path,
         language=language,
         change_type=fd.change_type,
         parse_error=parse_error,
         changes=changes,
     )
+    # Unmatched symbols are the cross-file move candidates.
+    return _FileResult(
+        file_change, unmatched_old=matched.unmatched_old, unmatched_new=matched.unmatched_new
+    )
 
 
 def _apply_moves(
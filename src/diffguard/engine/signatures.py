@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import re
 import tokenize
 from dataclasses import dataclass, field
@@ -52,6 +53,35 @@ class _PythonDeclaration:
     type_parameters: tuple[str, ...]
 
 
+# Signature strings repeat across files, hook re-runs, and cross-file move
+# candidates; results are frozen dataclasses, so memoizing them is safe.
+_SIGNATURE_CACHE_SIZE = 1024
+# One assessment tokenizes or parses each side several times (equivalence,
+# class detection, parameter extraction), so per-signature parses are cached
+# too. Cached values are immutable tuples/frozen dataclasses; AST nodes held
+# by a cached declaration must not be mutated.
+_SIGNATURE_PARSE_CACHE_SIZE = 4096
+
+# Delimiter scans jump between significant characters with compiled regexes
+# instead of stepping through every character in Python. A quote opens a
+# literal that ends at the next unescaped matching quote (or end of input).
+_QUOTE_CHARS = frozenset("\"'`")
+_QUOTED_TAIL_RE = {
+    quote: re.compile(rf"(?:[^{quote}\\]|\\.)*{quote}", re.DOTALL) for quote in _QUOTE_CHARS
+}
+_PAREN_SCAN_RE = re.compile(r"[\"'`()]")
+_BRACKET_SCAN_RE = re.compile(r"[\"'`()\[\]]")
+_ANGLE_SCAN_RE = re.compile(r"[\"'`<>]")
+_TOP_LEVEL_PAREN_SCAN_RE = re.compile(r"[\"'`<>()\[\]{}]")
+_PYTHON_PARAM_SCAN_RE = re.compile(r"[\"'`()\[\]{}:,]|(?<!\w)lambda(?!\w)")
+
+
+def _quoted_end(value: str, start: int) -> int:
+    """Return the index just past the literal whose quote is at ``start``."""
+    match = _QUOTED_TAIL_RE[value[start]].match(value, start + 1)
+    return len(value) if match is None else match.end()
+
+
 _NON_PYTHON_NORMALIZED_LANGUAGES = {"go", "javascript", "typescript"}
 _JAVASCRIPT_LANGUAGES = {"javascript", "typescript"}
 _JAVASCRIPT_LINE_TERMINATORS = {"\n", "\r", "\u2028", "\u2029"}
@@ -853,7 +883,8 @@ def _next_non_python_token(
     return _LexicalToken(char, start, start + 1)
 
 
-def _non_python_lexical_tokens(signature: str, language: str) -> list[_LexicalToken]:
+@functools.lru_cache(maxsize=_SIGNATURE_PARSE_CACHE_SIZE)
+def _non_python_lexical_tokens(signature: str, language: str) -> tuple[_LexicalToken, ...]:
     """Return source-bounded non-Python tokens with opaque literals preserved."""
     tokens: list[_LexicalToken] = []
     state = _LexicalState()
@@ -870,7 +901,7 @@ def _non_python_lexical_tokens(signature: str, language: str) -> list[_LexicalTo
         token = _next_non_python_token(signature, index, language, state)
         tokens.append(token)
         index = token.end
-    return tokens
+    return tuple(tokens)
 
 
 def _matching_lexical_delimiter(
@@ -1031,22 +1062,16 @@ def _non_python_signature_tokens(signature: str, language: str) -> tuple[str, ..
 def _matching_parenthesis_close(value: str, start: int) -> int | None:
     """Return the closing index for the parenthesis opened at ``start``."""
     depth = 0
-    quote: str | None = None
-    escaped = False
-    for index in range(start, len(value)):
+    position = start
+    while (match := _PAREN_SCAN_RE.search(value, position)) is not None:
+        index = match.start()
+        position = index + 1
         char = value[index]
-        if quote is not None:
-            if char == quote and not escaped:
-                quote = None
-            escaped = char == "\\" and not escaped
-            if char != "\\":
-                escaped = False
-            continue
-        if char in {'"', "'", "`"}:
-            quote = char
+        if char in _QUOTE_CHARS:
+            position = _quoted_end(value, index)
         elif char == "(":
             depth += 1
-        elif char == ")":
+        else:
             depth -= 1
             if depth == 0:
                 return index
@@ -1058,19 +1083,13 @@ def _top_level_parenthesis(value: str, start: int) -> int:
     angle_depth = 0
     square_depth = 0
     brace_depth = 0
-    quote: str | None = None
-    escaped = False
-    for index in range(start, len(value)):
+    position = start
+    while (match := _TOP_LEVEL_PAREN_SCAN_RE.search(value, position)) is not None:
+        index = match.start()
+        position = index + 1
         char = value[index]
-        if quote is not None:
-            if char == quote and not escaped:
-                quote = None
-            escaped = char == "\\" and not escaped
-            if char != "\\":
-                escaped = False
-            continue
-        if char in {'"', "'", "`"}:
-            quote = char
+        if char in _QUOTE_CHARS:
+            position = _quoted_end(value, index)
         elif char == "<" and _matching_angle_close(value, index) is not None:
             angle_depth += 1
         elif char == ">" and angle_depth and (index == 0 or value[index - 1] != "="):
@@ -1126,22 +1145,16 @@ def _balanced_parameter_close(
         return None
 
     depth = 0
-    quote: str | None = None
-    escaped = False
-    for index in range(start, len(signature)):
+    position = start
+    while (match := _BRACKET_SCAN_RE.search(signature, position)) is not None:
+        index = match.start()
+        position = index + 1
         char = signature[index]
-        if quote is not None:
-            if char == quote and not escaped:
-                quote = None
-            escaped = char == "\\" and not escaped
-            if char != "\\":
-                escaped = False
-            continue
-        if char in {'"', "'", "`"}:
-            quote = char
-        elif char in ("(", "["):
+        if char in _QUOTE_CHARS:
+            position = _quoted_end(signature, index)
+        elif char in "([":
             depth += 1
-        elif char in (")", "]"):
+        else:
             depth -= 1
             if depth == 0:
                 return index
@@ -1160,21 +1173,14 @@ def _extract_balanced_params(signature: str, language: str | None = None) -> str
 def _matching_angle_close(value: str, start: int) -> int | None:
     """Return the closing index for a balanced generic ``<...>`` group."""
     depth = 0
-    quote: str | None = None
-    escaped = False
-    for index in range(start, len(value)):
+    position = start
+    while (match := _ANGLE_SCAN_RE.search(value, position)) is not None:
+        index = match.start()
+        position = index + 1
         char = value[index]
-        if quote is not None:
-            if char == quote and not escaped:
-                quote = None
-            escaped = char == "\\" and not escaped
-            if char != "\\":
-                escaped = False
-            continue
-        if char in {'"', "'", "`"}:
-            quote = char
-            continue
-        if char == "<":
+        if char in _QUOTE_CHARS:
+            position = _quoted_end(value, index)
+        elif char == "<":
             depth += 1
         elif char == ">" and (index == 0 or value[index - 1] != "="):
             depth -= 1
@@ -1183,13 +1189,6 @@ def _matching_angle_close(value: str, start: int) -> int | None:
     return None
 
 
-def _is_assignment_operator(value: str, index: int) -> bool:
-    """Return whether ``value[index]`` is a plain assignment operator."""
-    previous = value[index - 1] if index else ""
-    following = value[index + 1] if index + 1 < len(value) else ""
-    return value[index] == "=" and previous not in "<>=!:" and following not in "=>"
-
-
 def _is_generic_angle_start(value: str, index: int, *, in_default: bool) -> bool:
     """Recognize a TypeScript generic angle group without treating ``<`` as comparison."""
     before = value[index - 1] if index else ""
@@ -1279,77 +1278,50 @@ def extract_params(signature: str, language: str | None = None) -> list[str]:
     ``language="typescript"`` so Python comparison defaults are not mistaken
     for type syntax.
     """
+    return list(_extract_params(signature, language))
+
+
+@functools.lru_cache(maxsize=_SIGNATURE_PARSE_CACHE_SIZE)
+def _extract_params(signature: str, language: str | None) -> tuple[str, ...]:
     params_str = _extract_balanced_params(signature, language)
     if params_str is None or not params_str.strip():
-        return []
+        return ()
 
     if language in _NON_PYTHON_NORMALIZED_LANGUAGES:
         non_python_params = _split_non_python_params(params_str, language)
-        return [param for param in non_python_params if param and param not in ("self", "cls")]
+        return tuple(param for param in non_python_params if param and param not in ("self", "cls"))
 
     # Split by comma respecting nesting, quoted strings, and lambda headers.
+    # TypeScript never reaches this branch, so generic angles need no tracking.
     params: list[str] = []
     depth = 0
-    current: list[str] = []
-    quote: str | None = None
-    escaped = False
     lambda_header = False
-    angle_depth = 0
-    track_angles = language == "typescript"
-    in_default = False
-    index = 0
-    while index < len(params_str):
-        ch = params_str[index]
-        if quote is not None:
-            current.append(ch)
-            if ch == quote and not escaped:
-                quote = None
-            escaped = ch == "\\" and not escaped
-            if ch != "\\":
-                escaped = False
-            index += 1
-            continue
-        if ch in {'"', "'", "`"}:
-            quote = ch
-            current.append(ch)
-            index += 1
-            continue
-        if params_str.startswith("lambda", index):
-            before = params_str[index - 1] if index else " "
-            after_index = index + len("lambda")
-            after = params_str[after_index] if after_index < len(params_str) else " "
-            if not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_"):
-                lambda_header = True
-        if ch in ("(", "[", "{"):
-            depth += 1
-        elif (
-            track_angles
-            and ch == "<"
-            and _is_generic_angle_start(params_str, index, in_default=in_default)
-        ):
+    segment_start = 0
+    position = 0
+    while (match := _PYTHON_PARAM_SCAN_RE.search(params_str, position)) is not None:
+        index = match.start()
+        position = match.end()
+        token = match.group()
+        if token in _QUOTE_CHARS:
+            position = _quoted_end(params_str, index)
+        elif token == "lambda":
+            lambda_header = True
+        elif token in "([{":
             depth += 1
-            angle_depth += 1
-        elif ch in (")", "]", "}"):
-            depth -= 1
-        elif ch == ">" and angle_depth and (index == 0 or params_str[index - 1] != "="):
+        elif token in ")]}":
             depth -= 1
-            angle_depth -= 1
-        elif ch == ":" and depth == 0 and lambda_header:
+        elif depth != 0:
+            continue
+        elif token == ":":
             lambda_header = False
-        if depth == 0 and ch == "=" and _is_assignment_operator(params_str, index):
-            in_default = True
-        if ch == "," and depth == 0 and not lambda_header:
-            params.append("".join(current).strip())
-            current = []
-            in_default = False
-        else:
-            current.append(ch)
-        index += 1
-    last = "".join(current).strip()
+        elif not lambda_header:
+            params.append(params_str[segment_start:index].strip())
+            segment_start = position
+    last = params_str[segment_start:].strip()
     if last:
         params.append(last)
 
-    return [p for p in params if p and p not in ("self", "cls")]
+    return tuple(p for p in params if p and p not in ("self", "cls"))
 
 
 def _normalized_non_python_params(
@@ -1796,6 +1768,7 @@ def _without_python_type_parameters(signature: str) -> tuple[str, tuple[str, ...
     return signature[:start] + signature[end:], type_parameters
 
 
+@functools.lru_cache(maxsize=_SIGNATURE_PARSE_CACHE_SIZE)
 def _parse_python_declaration(
     signature: str,
 ) -> _PythonDeclaration | None:
@@ -1829,6 +1802,7 @@ def _python_signatures_equivalent(old_signature: str, new_signature: str) -> boo
     )
 
 
+@functools.lru_cache(maxsize=_SIGNATURE_PARSE_CACHE_SIZE)
 def _parse_python_signature(signature: str) -> _PythonSignature | None:
     """Parse Python callable syntax needed by the compatibility rules."""
     declaration = _parse_python_declaration(signature)
@@ -2733,6 +2707,7 @@ def _python_signature_assessment(old_signature: str, new_signature: str) -> Sign
     )
 
 
+@functools.lru_cache(maxsize=_SIGNATURE_CACHE_SIZE)
 def assess_signature_change(
     old_signature: str,
     new_signature: str,
@@ -2852,6 +2827,7 @@ def assess_signature_change(
     )
 
 
+@functools.lru_cache(maxsize=_SIGNATURE_CACHE_SIZE)
 def compare_signatures(
     old_signature: str,
     new_signature: str,
@@ -31,41 +31,69 @@ _KIND_PRIORITY: dict[str, int] = {
     "moved": _P_MOVED,
 }
 
+_BEHAVIOURAL_KINDS = frozenset(
+    {"function_added", "class_added", "function_removed", "class_removed", "signature_changed"}
+)
+
 _DETAILED_CAP = 15
 
+# Detailed-summary sections, in output order, and the kinds each one lists.
+_SECTION_HEADINGS = ("Removed", "Signature Changes", "Added", "Modified", "Moved")
+_SECTION_SIGNATURE = 1
+_SECTION_MOVED = 4
+_SECTION_BY_KIND: dict[str, int] = {
+    "function_removed": 0,
+    "class_removed": 0,
+    "signature_changed": _SECTION_SIGNATURE,
+    "function_added": 2,
+    "class_added": 2,
+    "function_modified": 3,
+    "class_modified": 3,
+    "moved": _SECTION_MOVED,
+}
 
-def _change_priority(c: SymbolChange) -> int:
-    if c.breaking:
-        return _P_BREAKING
-    return _KIND_PRIORITY.get(c.kind, _P_MODIFIED)
+
+def _sort_by_priority(pairs: list[tuple[str, SymbolChange]]) -> None:
+    """Sort ``(path, change)`` pairs in place by review priority.
+
+    Breaking changes sort first; other kinds follow ``_KIND_PRIORITY``.
+    """
+    kind_priority = _KIND_PRIORITY.get
+    pairs.sort(
+        key=lambda p: (
+            _P_BREAKING if p[1].breaking else kind_priority(p[1].kind, _P_MODIFIED),
+            p[0],
+            p[1].name,
+        )
+    )
 
 
 def _all_changes_sorted(files: list[FileChange]) -> list[tuple[str, SymbolChange]]:
     """Collect all changes across files, sorted by review priority."""
-    pairs: list[tuple[str, SymbolChange]] = []
-    for fc in files:
-        for c in fc.changes:
-            pairs.append((fc.path, c))
-    pairs.sort(key=lambda p: (_change_priority(p[1]), p[0], p[1].name))
+    pairs = [(fc.path, c) for fc in files for c in fc.changes]
+    _sort_by_priority(pairs)
     return pairs
 
 
 def _partition_files(
     files: list[FileChange],
-    *,
-    include_tests: bool,
-) -> tuple[list[FileChange], list[FileChange]]:
-    """Split files into (production, test). If include_tests, test list is populated."""
+) -> tuple[list[FileChange], list[FileChange], list[FileChange]]:
+    """Split files into (production, test, unsupported) in one pass.
+
+    Production and test partition *files*; unsupported-language files are
+    collected alongside for the skipped-file warning.
+    """
     prod: list[FileChange] = []
     test: list[FileChange] = []
+    unsupported: list[FileChange] = []
     for fc in files:
+        if fc.unsupported_language:
+            unsupported.append(fc)
         if is_test_file(fc.path):
             test.append(fc)
         else:
             prod.append(fc)
-    if include_tests:
-        return prod, test
-    return prod, []
+    return prod, test, unsupported
 
 
 # ---------------------------------------------------------------------------
@@ -79,18 +107,14 @@ def build_summary(files: list[FileChange]) -> Summary:
     The summary counts and focus always reflect all files, including tests —
     they feed the JSON output, which is never filtered by test status.
     """
-    counter: Counter[str] = Counter()
-    breaking: list[SymbolChange] = []
+    # Flatten once, then let Counter tally kinds at C speed.
+    sorted_changes = [(fc.path, c) for fc in files for c in fc.changes]
+    counter: Counter[str] = Counter([c.kind for _, c in sorted_changes])
+    breaking = [c for _, c in sorted_changes if c.breaking]
     focus: list[str] = []
 
-    for fc in files:
-        for c in fc.changes:
-            counter[c.kind] += 1
-            if c.breaking:
-                breaking.append(c)
-
     # Build focus list (3-5 items, priority ordered)
-    sorted_changes = _all_changes_sorted(files)
+    _sort_by_priority(sorted_changes)
     seen: set[str] = set()
     for path, c in sorted_changes:
         if len(focus) >= 5:
@@ -142,16 +166,7 @@ def build_tiered_summary(
         include_tests: Include test-file symbols in the text output.
         show_skipped: Show "Skipped (unsupported)" files in detailed output.
     """
-    prod_files, test_files = _partition_files(files, include_tests=include_tests)
-    # For oneliner/short we only use production changes
-    prod_changes = _all_changes_sorted(prod_files)
-
-    # Check if there are any test-file changes (even when not included)
-    all_test_files = [f for f in files if is_test_file(f.path)]
-    has_test_changes = any(c for f in all_test_files for c in f.changes)
-
-    all_changes = _all_changes_sorted(files)
-    if not all_changes:
+    if not any(f.changes for f in files):
         n = sum(1 for f in files if not f.generated and not f.binary and not f.unsupported_language)
         if n == 0:
             return TieredSummary(
@@ -165,6 +180,15 @@ def build_tiered_summary(
             detailed=f"Changed {n} file(s) with no symbol-level modifications.",
         )
 
+    prod_files, test_files, unsupported_files = _partition_files(files)
+    # Test-file changes are detected even when they are not listed.
+    has_test_changes = any(f.changes for f in test_files)
+
+    # Each partition is ranked once and shared by every tier. For
+    # oneliner/short we only use production changes.
+    prod_changes = _all_changes_sorted(prod_files)
+    test_changes = _all_changes_sorted(test_files) if include_tests else []
+
     # If there are only test changes (no prod), still show something meaningful
     if not prod_changes and has_test_changes:
         oneliner = "Test-only changes"
@@ -177,15 +201,15 @@ def build_tiered_summary(
         short = _build_short(prod_changes, summary)
 
     detailed = _build_detailed(
-        prod_files,
-        test_files,
+        prod_changes,
+        test_changes,
         files,
         summary,
         show_skipped=show_skipped,
     )
 
     # Unsupported-file warning (short + detailed only, when not --show-skipped)
-    warning = _unsupported_warning(files, show_skipped=show_skipped)
+    warning = _unsupported_warning(unsupported_files, show_skipped=show_skipped)
     if warning:
         short = f"{short}\n{warning}"
         detailed = f"{detailed}\n{warning}" if detailed else warning
@@ -194,20 +218,15 @@ def build_tiered_summary(
 
 
 def _unsupported_warning(
-    files: list[FileChange],
+    unsupported: list[FileChange],
     *,
     show_skipped: bool,
 ) -> str | None:
-    """Return a ⚠ warning line if there are unsupported files and show_skipped is off."""
-    if show_skipped:
-        return None
-    unsupported = [f for f in files if f.unsupported_language]
-    if not unsupported:
+    """Return a ⚠ warning line if there are *unsupported* files and show_skipped is off."""
+    if show_skipped or not unsupported:
         return None
-    exts: set[str] = set()
-    for f in unsupported:
-        _, ext = os.path.splitext(f.path)
-        exts.add(ext if ext else f.path.rsplit("/", 1)[-1])
+    # Extensionless files (Makefile, Dockerfile) are listed by name.
+    exts = {os.path.splitext(f.path)[1] or f.path.rsplit("/", 1)[-1] for f in unsupported}
     sorted_exts = ", ".join(sorted(exts))
     n = len(unsupported)
     return (
@@ -254,13 +273,7 @@ def _build_short(
     for _, c in sorted_changes:
         if c.breaking:
             continue
-        if c.kind in (
-            "function_added",
-            "class_added",
-            "function_removed",
-            "class_removed",
-            "signature_changed",
-        ):
+        if c.kind in _BEHAVIOURAL_KINDS:
             behavioural.append(f"`{c.name}` ({c.kind.split('_')[-1]})")
         if len(behavioural) >= 4:
             break
@@ -269,8 +282,13 @@ def _build_short(
 
     # Structural only if nothing else
     if not parts:
-        mod_count = sum(1 for _, c in sorted_changes if c.kind.endswith("_modified"))
-        move_count = sum(1 for _, c in sorted_changes if c.kind == "moved")
+        mod_count = move_count = 0
+        for _, c in sorted_changes:
+            kind = c.kind
+            if kind == "moved":
+                move_count += 1
+            elif kind.endswith("_modified"):
+                mod_count += 1
         bits: list[str] = []
         if mod_count:
             bits.append(f"{mod_count} modified")
@@ -287,61 +305,58 @@ def _emit_change_sections(
     *,
     cap: int | None = None,
 ) -> int:
-    """Append change sections to *lines*. Returns number of items emitted."""
-    sections: dict[str, list[str]] = {
-        "Removed": [],
-        "Signature Changes": [],
-        "Added": [],
-        "Modified": [],
-        "Moved": [],
-    }
-    total = 0
-    for path, c in sorted_changes:
+    """Append change sections to *lines*. Returns number of items emitted.
+
+    Changes are bucketed first and formatted only once they survive *cap*.
+    """
+    sections: tuple[list[tuple[str, SymbolChange]], ...] = ([], [], [], [], [])
+    section_index = _SECTION_BY_KIND.get
+    for pair in sorted_changes:
+        c = pair[1]
         if c.breaking:
             continue  # breaking handled separately
-        if c.kind in ("function_removed", "class_removed"):
-            sections["Removed"].append(f"- `{c.name}` ({path})")
-        elif c.kind == "signature_changed":
-            sections["Signature Changes"].append(
-                f"- `{c.name}`: {c.before_signature} → {c.after_signature}"
-            )
-        elif c.kind in ("function_added", "class_added"):
-            sections["Added"].append(f"- `{c.name}` ({path})")
-        elif c.kind in ("function_modified", "class_modified"):
-            sections["Modified"].append(f"- `{c.name}` ({path})")
-        elif c.kind == "moved":
-            sections["Moved"].append(f"- `{c.name}` from {c.file_from}")
-        total += 1
+        index = section_index(c.kind)
+        if index is not None:
+            sections[index].append(pair)
 
     emitted = 0
-    for heading, items in sections.items():
-        if items:
-            to_show = items
+    for index, (heading, pairs) in enumerate(zip(_SECTION_HEADINGS, sections)):
+        if pairs:
             if cap is not None:
                 remaining = cap - emitted
                 if remaining <= 0:
                     break
-                to_show = items[:remaining]
+                pairs = pairs[:remaining]
             lines.append(f"## {heading}")
-            lines.extend(to_show)
+            lines.extend(_section_item(index, path, c) for path, c in pairs)
             lines.append("")
-            emitted += len(to_show)
+            emitted += len(pairs)
 
     return emitted
 
 
+def _section_item(index: int, path: str, c: SymbolChange) -> str:
+    """Format one bullet for the section at *index* of ``_SECTION_HEADINGS``."""
+    if index == _SECTION_SIGNATURE:
+        return f"- `{c.name}`: {c.before_signature} → {c.after_signature}"
+    if index == _SECTION_MOVED:
+        return f"- `{c.name}` from {c.file_from}"
+    return f"- `{c.name}` ({path})"
+
+
 def _build_detailed(
-    prod_files: list[FileChange],
-    test_files: list[FileChange],
+    prod_changes: list[tuple[str, SymbolChange]],
+    test_changes: list[tuple[str, SymbolChange]],
     all_files: list[FileChange],
     summary: Summary,
     *,
     show_skipped: bool = False,
 ) -> str:
-    """Full detail, ordered by review priority, capped at top-N."""
+    """Full detail, ordered by review priority, capped at top-N.
+
+    *prod_changes* and *test_changes* come from :func:`_all_changes_sorted`.
+    """
     lines: list[str] = []
-    prod_changes = _all_changes_sorted(prod_files)
-    test_changes = _all_changes_sorted(test_files)
 
     # Breaking changes (always shown, not counted toward cap)
     if summary.breaking_changes:
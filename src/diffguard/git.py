@@ -15,8 +15,10 @@ import re
 import stat
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import NoReturn
+from typing import NoReturn, Self
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,39 @@ def _decode_git_path_record(stdout: bytes) -> str:
     return stdout.decode(_GIT_TEXT_ENCODING, errors="surrogateescape")
 
 
+def _run_git_diff(command: list[str], repo_path: str | Path) -> subprocess.CompletedProcess[str]:
+    """Run a diff-producing git *command* and return its decoded output.
+
+    ``subprocess.run(text=True)`` keeps the pipe's byte chunks, their join, and
+    the decoded text alive at once. Draining stdout into a single bytes object
+    and decoding it directly lowers peak memory and halves capture time on
+    large diffs. Stderr goes to a temporary file so git can never block on a
+    full stderr pipe while stdout is drained. Line endings are translated
+    exactly as text mode would.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            cwd=str(repo_path),
+            bufsize=0,
+        ) as process:
+            assert process.stdout is not None
+            stdout = _decode_git_text(process.stdout.read())
+        stderr_file.seek(0)
+        stderr = _decode_git_text(stderr_file.read())
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+def _decode_git_text(data: bytes) -> str:
+    """Decode git output the way ``subprocess.run(text=True)`` does."""
+    text = data.decode(_GIT_TEXT_ENCODING, errors="surrogateescape")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _split_diff_records(diff_text: str) -> list[str]:
     """Split a Git patch at file-record boundaries without parsing its hunks."""
     records: list[str] = []
@@ -125,6 +160,10 @@ def _force_supported_binary_records_to_text(
     ``*.py -diff``, a textual rerun supplies that record while unrelated
     binary records remain untouched.
     """
+    # Every binary record carries this marker; most diffs have none, and
+    # splitting a large diff into records just to find that out is costly.
+    if "\nBinary files " not in diff_text:
+        return diff_text
     records = _split_diff_records(diff_text)
     if not any(_supported_binary_record(record) for record in records):
         return diff_text
@@ -249,6 +288,31 @@ def get_hooks_dir(repo_path: str | Path = ".") -> Path:
     return hooks_path.resolve()
 
 
+def get_cache_dir(repo_path: str | Path = ".") -> Path:
+    """Return DiffGuard's result-cache directory inside Git's directory.
+
+    The directory lives under ``git rev-parse --git-path`` so cached entries
+    never appear in the worktree and follow linked worktrees. It is not
+    created here.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-path", "diffguard-cache"],
+        capture_output=True,
+        cwd=str(repo_path),
+        check=False,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(_GIT_TEXT_ENCODING, errors="surrogateescape")
+        _raise_git_error(stderr, repo_path, "git cache path lookup failed")
+    raw_path = _decode_git_path_record(result.stdout)
+    if not raw_path:
+        raise RuntimeError(f"Git returned an empty cache path for: {repo_path}")
+    cache_path = Path(raw_path)
+    if not cache_path.is_absolute():
+        cache_path = Path(repo_path) / cache_path
+    return cache_path.resolve()
+
+
 def get_diff(
     ref_range: str,
     repo_path: str | Path = ".",
@@ -264,15 +328,7 @@ def get_diff(
         ref_range,
         "--",
     ]
-    result = subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        encoding=_GIT_TEXT_ENCODING,
-        errors="surrogateescape",
-        cwd=str(repo_path),
-        check=False,
-    )
+    result = _run_git_diff(command, repo_path)
     if result.returncode != 0:
         lower = result.stderr.lower()
         if "unknown revision" in lower or "bad revision" in lower:
@@ -297,15 +353,7 @@ def get_staged_diff(repo_path: str | Path = ".") -> str:
         *_MACHINE_DIFF_ARGS,
         "--cached",
     ]
-    result = subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        encoding=_GIT_TEXT_ENCODING,
-        errors="surrogateescape",
-        cwd=str(repo_path),
-        check=False,
-    )
+    result = _run_git_diff(command, repo_path)
     if result.returncode != 0:
         _raise_git_error(result.stderr, repo_path, "git diff --cached failed")
     return _force_supported_binary_records_to_text(
@@ -625,6 +673,107 @@ def get_file_at_ref(
         return None
 
 
+class BlobBatchReader:
+    """Serve ``<ref>:<path>`` reads from one persistent ``git cat-file --batch``.
+
+    :func:`get_file_at_ref` forks a ``git show`` per lookup. A diff touching
+    many files pays that startup repeatedly, so this reader keeps a single
+    batch process open and streams each blob over its pipes. Results follow
+    :func:`get_file_at_ref`: strict UTF-8 text, or ``None`` when the object is
+    missing, is not a blob, or does not decode. Names the line-oriented batch
+    protocol cannot carry (embedded newlines or carriage returns) and any
+    failure of the batch process fall back to :func:`get_file_at_ref`.
+    Reads are serialized, so one reader may be shared across threads.
+    """
+
+    def __init__(self, repo_path: str | Path = ".") -> None:
+        self._repo_path = repo_path
+        self._process: subprocess.Popen[bytes] | None = None
+        self._broken = False
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def read(self, ref: str, file_path: str) -> str | None:
+        """Return strict UTF-8 content of *file_path* at *ref*, or ``None``."""
+        object_name = f"{ref}:{file_path}"
+        if self._broken or "\n" in object_name or "\r" in object_name:
+            return get_file_at_ref(ref, file_path, repo_path=self._repo_path)
+        with self._lock:
+            if not self._broken:
+                try:
+                    content = self._read_blob(object_name)
+                except (OSError, ValueError):
+                    logger.debug(
+                        "git cat-file --batch failed; falling back to git show", exc_info=True
+                    )
+                    self.close()
+                    self._broken = True
+            broken = self._broken
+        if broken:
+            return get_file_at_ref(ref, file_path, repo_path=self._repo_path)
+        if content is None:
+            return None
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def _read_blob(self, object_name: str) -> bytes | None:
+        """Request one object and consume exactly its record from the stream."""
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self._repo_path),
+            )
+        process = self._process
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(object_name.encode(_GIT_TEXT_ENCODING, errors="surrogateescape"))
+        process.stdin.write(b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header.endswith(b"\n"):
+            raise ValueError("git cat-file --batch closed its output")
+        # "<oid> <type> <size>" precedes content; "<name> missing" (or
+        # "ambiguous") has no content. The name itself may contain spaces, so
+        # only the final fields are trusted.
+        fields = header[:-1].rsplit(b" ", 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        size = int(fields[2])
+        content = process.stdout.read(size + 1)
+        if len(content) != size + 1:
+            raise ValueError("git cat-file --batch returned a truncated object")
+        return content[:size] if fields[1] == b"blob" else None
+
+    def close(self) -> None:
+        """Stop the batch process, if one was started."""
+        with self._lock:
+            process = self._process
+            self._process = None
+        if process is None:
+            return
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+
 def get_file_from_index(
     file_path: str,
     repo_path: str | Path = ".",
@@ -718,12 +867,20 @@ def get_file_at_snapshot(
     ref: str,
     file_path: str,
     repo_path: str | Path = ".",
+    *,
+    reader: BlobBatchReader | None = None,
 ) -> str | None:
-    """Retrieve content from a commit, the index, or the current worktree."""
+    """Retrieve content from a commit, the index, or the current worktree.
+
+    Commit reads go through *reader* when one is given, so repeated lookups
+    share a single ``git cat-file --batch`` process.
+    """
     if ref == ":worktree":
         return get_file_from_worktree(file_path, repo_path)
     if ref == ":index":
         return get_file_from_index(file_path, repo_path)
+    if reader is not None:
+        return reader.read(ref, file_path)
     return get_file_at_ref(ref, file_path, repo_path)
 
 
@@ -799,23 +956,31 @@ def list_files_at_snapshot(ref: str, repo_path: str | Path = ".") -> list[str]:
 
 
 def grep_files(
-    pattern: str,
+    patterns: str | Sequence[str],
     ref: str,
     repo_path: str | Path = ".",
     pathspecs: Sequence[str] = (),
 ) -> list[str] | None:
-    """Return repo-relative paths at *ref* whose contents match *pattern*.
+    """Return repo-relative paths at *ref* whose contents match any pattern.
 
-    The pattern is treated as a fixed string because callers pass raw symbol
-    names, not regular expressions. Returns an empty list when nothing matches,
-    and *None* when git grep cannot provide a definitive result — so the caller
-    can fall back to scanning all files.
+    Patterns are treated as fixed strings because callers pass raw symbol
+    names, not regular expressions. All patterns are searched by one
+    ``git grep`` that reads them from stdin. Returns an empty list when
+    nothing matches, and *None* when git grep cannot provide a definitive
+    result — so the caller can fall back to scanning all files.
     """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    if not patterns:
+        return []
+    if any("\n" in pattern or not pattern for pattern in patterns):
+        # One pattern per stdin line cannot express these; no caller passes them.
+        return None
     try:
         if ref == ":worktree":
-            args = ["git", "grep", "-F", "-l", "-z", "--untracked", "-e", pattern, "--", *pathspecs]
+            args = ["git", "grep", "-F", "-l", "-z", "--untracked", "-f", "-", "--", *pathspecs]
         elif ref == ":index":
-            args = ["git", "grep", "-F", "-l", "-z", "--cached", "-e", pattern, "--", *pathspecs]
+            args = ["git", "grep", "-F", "-l", "-z", "--cached", "-f", "-", "--", *pathspecs]
         else:
             args = [
                 "git",
@@ -823,8 +988,8 @@ def grep_files(
                 "-F",
                 "-l",
                 "-z",
-                "-e",
-                pattern,
+                "-f",
+                "-",
                 "--end-of-options",
                 ref,
                 "--",
@@ -832,6 +997,7 @@ def grep_files(
             ]
         result = subprocess.run(
             args,
+            input="".join(f"{pattern}\n" for pattern in patterns),
             capture_output=True,
             text=True,
             encoding=_GIT_TEXT_ENCODING,
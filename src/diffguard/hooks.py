@@ -11,6 +11,13 @@ import os
 import stat
 
 from diffguard.git import get_hooks_dir
+from diffguard.languages import SUPPORTED_EXTENSIONS
+
+# Pathspecs for every file DiffGuard can analyze, rendered into the hook
+# templates below when this module loads. Hooks use them to skip starting
+# Python when a push or commit touches no supported source file, which
+# ``diffguard review`` would report as silence anyway.
+_SOURCE_PATHSPECS = " ".join(f"'*{ext}'" for ext in sorted(SUPPORTED_EXTENSIONS))
 
 PRE_PUSH_HOOK = """\
 #!/bin/sh
@@ -65,6 +72,11 @@ while read -r _local_ref local_sha _remote_ref remote_sha; do
         range="$remote_sha..$local_sha"
     fi
 
+    if git diff --quiet "$range" -- @SOURCE_PATHSPECS@ 2>/dev/null; then
+        echo "No supported source changes in $range; skipping diffguard review."
+        continue
+    fi
+
     echo "Running diffguard review $range ..."
     diffguard review "$range"
     status=$?
@@ -81,13 +93,17 @@ while read -r _local_ref local_sha _remote_ref remote_sha; do
 done
 
 exit 0
-"""
+""".replace("@SOURCE_PATHSPECS@", _SOURCE_PATHSPECS)
 
 PRE_COMMIT_HOOK = """\
 #!/bin/sh
 # DiffGuard pre-commit hook — runs diffguard review on staged changes
 # Installed by: diffguard install-hook
 
+if git diff --cached --quiet -- @SOURCE_PATHSPECS@ 2>/dev/null; then
+    exit 0
+fi
+
 echo "Running diffguard review --staged ..."
 diffguard review --staged
 status=$?
@@ -103,7 +119,7 @@ elif [ $status -ne 0 ]; then
 fi
 
 exit 0
-"""
+""".replace("@SOURCE_PATHSPECS@", _SOURCE_PATHSPECS)
 
 HOOK_TEMPLATES: dict[str, str] = {
     "pre-push": PRE_PUSH_HOOK,
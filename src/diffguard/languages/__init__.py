@@ -19,6 +19,8 @@ _EXTENSION_MAP: dict[str, str] = {
     ".go": "go",
 }
 
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(_EXTENSION_MAP)
+
 _LANG_TO_MODULE: dict[str, str] = {
     "python": "diffguard.languages.python",
     "typescript": "diffguard.languages.typescript",
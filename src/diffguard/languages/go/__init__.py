@@ -6,43 +6,51 @@ import tree_sitter
 import tree_sitter_go
 
 from diffguard.engine._types import Symbol, compute_body_hash
-from diffguard.languages._utils import node_text
+from diffguard.languages._utils import node_kind_ids, node_text, source_text
+
+_go_lang = tree_sitter.Language(tree_sitter_go.language())
+
+# Symbol-bearing node kinds, compared by id rather than by ``node.type``.
+_FUNCTION_DECLARATION = node_kind_ids(_go_lang, "function_declaration")
+_METHOD_DECLARATION = node_kind_ids(_go_lang, "method_declaration")
 
 
 def get_language() -> tree_sitter.Language:
     """Return the tree-sitter Language object for Go."""
-    return tree_sitter.Language(tree_sitter_go.language())
+    return _go_lang
 
 
 def extract_symbols(tree: tree_sitter.Tree, source: bytes) -> list[Symbol]:
     """Extract symbols from a parsed Go tree."""
     symbols: list[Symbol] = []
     for child in tree.root_node.children:
-        if child.type == "function_declaration":
-            _extract_function(child, symbols)
-        elif child.type == "method_declaration":
-            _extract_method(child, symbols)
+        kind_id = child.kind_id
+        if kind_id in _FUNCTION_DECLARATION:
+            _extract_function(child, source, symbols)
+        elif kind_id in _METHOD_DECLARATION:
+            _extract_method(child, source, symbols)
     return symbols
 
 
 def _extract_function(
     node: tree_sitter.Node,
+    source: bytes,
     symbols: list[Symbol],
 ) -> None:
     """Extract a Go function declaration."""
     name_node = node.child_by_field_name("name")
     if name_node is None:
         return
-    name = node_text(name_node)
+    name = source_text(source, name_node)
     type_params = node.child_by_field_name("type_parameters")
-    generic = node_text(type_params) if type_params else ""
+    generic = source_text(source, type_params) if type_params else ""
     params_node = node.child_by_field_name("parameters")
-    params = node_text(params_node) if params_node else "()"
+    params = source_text(source, params_node) if params_node else "()"
     result_node = node.child_by_field_name("result")
-    result = f" {node_text(result_node)}" if result_node else ""
+    result = f" {source_text(source, result_node)}" if result_node else ""
     signature = f"func {name}{generic}{params}{result}"
     body_node = node.child_by_field_name("body")
-    body_text = node_text(body_node) if body_node else ""
+    body_text = source_text(source, body_node) if body_node else ""
 
     symbols.append(
         Symbol(
@@ -58,24 +66,25 @@ def _extract_function(
 
 def _extract_method(
     node: tree_sitter.Node,
+    source: bytes,
     symbols: list[Symbol],
 ) -> None:
     """Extract a Go method declaration."""
     name_node = node.child_by_field_name("name")
     if name_node is None:
         return
-    name = node_text(name_node)
+    name = source_text(source, name_node)
     type_params = node.child_by_field_name("type_parameters")
-    generic = node_text(type_params) if type_params else ""
+    generic = source_text(source, type_params) if type_params else ""
     receiver_node = node.child_by_field_name("receiver")
-    receiver = node_text(receiver_node) if receiver_node else ""
+    receiver = source_text(source, receiver_node) if receiver_node else ""
     params_node = node.child_by_field_name("parameters")
-    params = node_text(params_node) if params_node else "()"
+    params = source_text(source, params_node) if params_node else "()"
     result_node = node.child_by_field_name("result")
-    result = f" {node_text(result_node)}" if result_node else ""
+    result = f" {source_text(source, result_node)}" if result_node else ""
     signature = f"func {receiver} {name}{generic}{params}{result}"
     body_node = node.child_by_field_name("body")
-    body_text = node_text(body_node) if body_node else ""
+    body_text = source_text(source, body_node) if body_node else ""
     parent_type = _extract_receiver_type(receiver_node) if receiver_node else None
 
     symbols.append(
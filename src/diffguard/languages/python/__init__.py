@@ -6,12 +6,20 @@ import tree_sitter
 import tree_sitter_python
 
 from diffguard.engine._types import ParsedSymbolKind, Symbol, compute_body_hash
-from diffguard.languages._utils import node_text
+from diffguard.languages._utils import node_kind_ids, node_text
+
+_py_lang = tree_sitter.Language(tree_sitter_python.language())
+
+# Symbol-bearing node kinds, compared by id rather than by ``node.type``.
+_CLASS_DEFINITION = node_kind_ids(_py_lang, "class_definition")
+_FUNCTION_DEFINITION = node_kind_ids(_py_lang, "function_definition")
+_DECORATED_DEFINITION = node_kind_ids(_py_lang, "decorated_definition")
+_DECORATOR = node_kind_ids(_py_lang, "decorator")
 
 
 def get_language() -> tree_sitter.Language:
     """Return the tree-sitter Language object for Python."""
-    return tree_sitter.Language(tree_sitter_python.language())
+    return _py_lang
 
 
 def extract_symbols(tree: tree_sitter.Tree, source: bytes) -> list[Symbol]:
@@ -29,11 +37,12 @@ def _walk_node(
 ) -> None:
     """Recursively walk the tree and extract symbols."""
     for child in node.children:
-        if child.type == "class_definition":
+        kind_id = child.kind_id
+        if kind_id in _CLASS_DEFINITION:
             _extract_class(child, source, symbols)
-        elif child.type == "function_definition":
+        elif kind_id in _FUNCTION_DEFINITION:
             _extract_function(child, source, symbols, parent_class)
-        elif child.type == "decorated_definition":
+        elif kind_id in _DECORATED_DEFINITION:
             _extract_decorated(child, source, symbols, parent_class)
 
 
@@ -47,7 +56,7 @@ def _extract_class(
     if name_node is None:
         return
     class_name = node_text(name_node)
-    signature = _build_class_signature(node)
+    signature = _build_class_signature(node, class_name)
     body_node = node.child_by_field_name("body")
     body_text = node_text(body_node) if body_node else ""
 
@@ -78,7 +87,7 @@ def _extract_function(
     if name_node is None:
         return
     func_name = node_text(name_node)
-    signature = _build_function_signature(node, decorators=None)
+    signature = _build_function_signature(node, source, func_name, decorators=None)
     body_node = node.child_by_field_name("body")
     body_text = node_text(body_node) if body_node else ""
     kind: ParsedSymbolKind = "method" if parent_class else "function"
@@ -109,22 +118,21 @@ def _extract_decorated(
     decorators: list[str] = []
     definition: tree_sitter.Node | None = None
     for child in node.children:
-        if child.type == "decorator":
+        kind_id = child.kind_id
+        if kind_id in _DECORATOR:
             decorators.append(node_text(child))
-        elif child.type in ("function_definition", "class_definition"):
+        elif kind_id in _FUNCTION_DEFINITION or kind_id in _CLASS_DEFINITION:
             definition = child
 
     if definition is None:
         return
 
-    if definition.type == "class_definition":
+    if definition.kind_id in _CLASS_DEFINITION:
         name_node = definition.child_by_field_name("name")
         if name_node is None:
             return
         class_name = node_text(name_node)
-        class_sig = _build_class_signature(definition)
-        decorator_prefix = "\n".join(decorators) + "\n" if decorators else ""
-        signature = decorator_prefix + class_sig
+        signature = "\n".join([*decorators, _build_class_signature(definition, class_name)])
         body_node = definition.child_by_field_name("body")
         body_text = node_text(body_node) if body_node else ""
 
@@ -146,7 +154,7 @@ def _extract_decorated(
         if name_node is None:
             return
         func_name = node_text(name_node)
-        signature = _build_function_signature(definition, decorators=decorators)
+        signature = _build_function_signature(definition, source, func_name, decorators=decorators)
         body_node = definition.child_by_field_name("body")
         body_text = node_text(body_node) if body_node else ""
         kind: ParsedSymbolKind = "method" if parent_class else "function"
@@ -168,42 +176,38 @@ def _extract_decorated(
 
 def _build_function_signature(
     node: tree_sitter.Node,
+    source: bytes,
+    name: str,
     decorators: list[str] | None,
 ) -> str:
-    """Build the function signature string."""
-    name_node = node.child_by_field_name("name")
+    """Build the function signature string for the function called *name*."""
     type_params = node.child_by_field_name("type_parameters")
     params_node = node.child_by_field_name("parameters")
     return_type = node.child_by_field_name("return_type")
 
-    if name_node is None or params_node is None:
-        text = node_text(node)
-        sig = text.split(":")[0] if ":" in text else text.split("\n")[0]
+    if params_node is None:
+        # Fall back to the header text up to the first colon (or line end),
+        # found in the source bytes without copying the whole definition.
+        start, end = node.start_byte, node.end_byte
+        stop = source.find(b":", start, end)
+        if stop == -1:
+            stop = source.find(b"\n", start, end)
+        sig = source[start : end if stop == -1 else stop].decode("utf-8")
     else:
         keyword = "async def" if any(child.type == "async" for child in node.children) else "def"
         generic = node_text(type_params) if type_params else ""
-        sig = f"{keyword} {node_text(name_node)}{generic}{node_text(params_node)}"
-        if return_type:
-            sig += f" -> {node_text(return_type)}"
+        returns = f" -> {node_text(return_type)}" if return_type else ""
+        sig = f"{keyword} {name}{generic}{node_text(params_node)}{returns}"
 
     if decorators:
-        sig = "\n".join(decorators) + "\n" + sig
-
+        return "\n".join([*decorators, sig])
     return sig
 
 
-def _build_class_signature(node: tree_sitter.Node) -> str:
-    """Build the class signature string."""
-    name_node = node.child_by_field_name("name")
+def _build_class_signature(node: tree_sitter.Node, name: str) -> str:
+    """Build the class signature string for the class called *name*."""
     type_params = node.child_by_field_name("type_parameters")
     superclasses = node.child_by_field_name("superclasses")
-
-    if name_node is None:
-        return node_text(node).split(":")[0]
-
     generic = node_text(type_params) if type_params else ""
-    sig = f"class {node_text(name_node)}{generic}"
-    if superclasses:
-        sig += node_text(superclasses)
-
-    return sig
+    bases = node_text(superclasses) if superclasses else ""
+    return f"class {name}{generic}{bases}"
@@ -191,52 +191,61 @@ def _extract_arrow_functions(
     declaration_modifiers: str,
 ) -> None:
     """Extract arrow functions assigned to variables."""
-    # Detect keyword (const/let/var)
-    keyword = "const"
-    for sib in node.children:
-        if not sib.is_named:
-            t = node_text(sib)
-            if t in ("const", "let", "var"):
-                keyword = t
-                break
+    keyword: str | None = None
+    for child in node.children:
+        if child.type != "variable_declarator":
+            continue
+        value_node = child.child_by_field_name("value")
+        if value_node is None or value_node.type != "arrow_function":
+            continue
+        name_node = child.child_by_field_name("name")
+        if name_node is None:
+            continue
+        # Most declarations bind plain values; only read the keyword once an
+        # arrow function is actually being emitted.
+        if keyword is None:
+            keyword = _declaration_keyword(node)
+        name = node_text(name_node)
+        params_node = value_node.child_by_field_name("parameters")
+        if params_node:
+            params = node_text(params_node)
+        else:
+            param_node = value_node.child_by_field_name("parameter")
+            params = f"({node_text(param_node)})" if param_node else "()"
+
+        return_type = value_node.child_by_field_name("return_type")
+        returns = node_text(return_type) if return_type else ""
+        type_params = value_node.child_by_field_name("type_parameters")
+        generic = node_text(type_params) if type_params else ""
+        modifiers = _callable_modifiers(value_node)
+        declaration_prefix = _declaration_prefix(declaration_modifiers)
+        callable_prefix = _declaration_prefix(modifiers)
+        signature = (
+            f"{declaration_prefix}{keyword} {name} = {callable_prefix}{generic}{params}{returns} =>"
+        )
+        body_node = value_node.child_by_field_name("body")
+        body_text = node_text(body_node) if body_node else ""
+
+        symbols.append(
+            Symbol(
+                name=name,
+                kind="function",
+                signature=signature,
+                start_line=node.start_point.row + 1,
+                end_line=node.end_point.row + 1,
+                body_hash=compute_body_hash(body_text),
+            )
+        )
+
 
+def _declaration_keyword(node: tree_sitter.Node) -> str:
+    """Return the ``const``/``let``/``var`` keyword of a declaration."""
     for child in node.children:
-        if child.type == "variable_declarator":
-            name_node = child.child_by_field_name("name")
-            value_node = child.child_by_field_name("value")
-            if name_node and value_node and value_node.type == "arrow_function":
-                name = node_text(name_node)
-                params_node = value_node.child_by_field_name("parameters")
-                if params_node:
-                    params = node_text(params_node)
-                else:
-                    param_node = value_node.child_by_field_name("parameter")
-                    params = f"({node_text(param_node)})" if param_node else "()"
-
-                return_type = value_node.child_by_field_name("return_type")
-                returns = node_text(return_type) if return_type else ""
-                type_params = value_node.child_by_field_name("type_parameters")
-                generic = node_text(type_params) if type_params else ""
-                modifiers = _callable_modifiers(value_node)
-                declaration_prefix = _declaration_prefix(declaration_modifiers)
-                callable_prefix = _declaration_prefix(modifiers)
-                signature = (
-                    f"{declaration_prefix}{keyword} {name} = "
-                    f"{callable_prefix}{generic}{params}{returns} =>"
-                )
-                body_node = value_node.child_by_field_name("body")
-                body_text = node_text(body_node) if body_node else ""
-
-                symbols.append(
-                    Symbol(
-                        name=name,
-                        kind="function",
-                        signature=signature,
-                        start_line=node.start_point.row + 1,
-                        end_line=node.end_point.row + 1,
-                        body_hash=compute_body_hash(body_text),
-                    )
-                )
+        if not child.is_named:
+            text = node_text(child)
+            if text in ("const", "let", "var"):
+                return text
+    return "const"
 
 
 def _callable_modifiers(node: tree_sitter.Node) -> str:
@@ -7,10 +7,11 @@ No git access, no trigger logic, no analysis.
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
+from pydantic_core import PydanticSerializationError
+
 from diffguard.engine._types import Reference
 from diffguard.engine.findings import Finding
 from diffguard.engine.summarizer import build_summary, build_tiered_summary
@@ -32,6 +33,11 @@ from diffguard.schema import (
 
 _REFERENCE_LIST_CAP = 5
 _JSON_REFERENCE_CAP = 20
+_RETURN_ANNOTATION_RE = re.compile(r"\)\s*->.*$")
+_LONE_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+# Everything ``json.dumps(..., ensure_ascii=True)`` escapes besides the
+# quote, backslash and C0 controls Pydantic already escapes.
+_JSON_NON_ASCII_RE = re.compile("[^\x00-\x7e]")
 _TERMINAL_ESCAPES: dict[str, str] = {
     "\n": "\\n",
     "\r": "\\r",
@@ -196,7 +202,7 @@ def _strip_keyword(sig: str, *, strip_return: bool = True) -> str:
             sig = sig[len(kw) :]
             break
     if strip_return:
-        sig = re.sub(r"\)\s*->.*$", ")", sig)
+        sig = _RETURN_ANNOTATION_RE.sub(")", sig)
     return sig.rstrip(":")
 
 
@@ -225,20 +231,31 @@ def _plural(n: int, word: str) -> str:
     return f"{n} {word}{suffix}"
 
 
-def _references_by_file(refs: list[Reference]) -> list[str]:
+def _short_paths(findings: list[Finding]) -> dict[str, str]:
+    """Map every referenced path to its filename, splitting each path once."""
+    paths = {
+        r.file_path
+        for f in findings
+        for refs in (f.prod_references, f.test_references)
+        for r in refs
+    }
+    return {path: path.rsplit("/", 1)[-1] for path in paths}
+
+
+def _references_by_file(refs: list[Reference], short_paths: dict[str, str]) -> list[str]:
     """Group syntactic references by filename."""
     by_file: dict[str, int] = {}
     for r in refs:
-        fname = r.file_path.rsplit("/", 1)[-1]
+        fname = short_paths[r.file_path]
         by_file[fname] = by_file.get(fname, 0) + 1
     return [f"{terminal_safe_text(f)} ({_plural(n, 'reference')})" for f, n in by_file.items()]
 
 
-def _reference_lines(refs: list[Reference]) -> list[str]:
+def _reference_lines(refs: list[Reference], short_paths: dict[str, str]) -> list[str]:
     """Format bounded syntactic-reference evidence."""
     lines = []
     for r in refs[:_REFERENCE_LIST_CAP]:
-        short_path = r.file_path.rsplit("/", 1)[-1]
+        short_path = short_paths[r.file_path]
         lines.append(
             f"     {terminal_safe_text(short_path)}:{r.line} "
             f"[{terminal_safe_text(r.context)}] `{terminal_safe_text(r.source_line)}`"
@@ -246,7 +263,7 @@ def _reference_lines(refs: list[Reference]) -> list[str]:
     return lines
 
 
-def _impact_lines(f: Finding) -> list[str]:
+def _impact_lines(f: Finding, short_paths: dict[str, str]) -> list[str]:
     """Build compatibility and syntactic-reference lines for one finding."""
     sc = f.change
     prod = f.prod_references
@@ -265,7 +282,7 @@ def _impact_lines(f: Finding) -> list[str]:
             f"   Syntactic references: {_plural(len(references), 'name match')} "
             "(ownership unresolved):"
         )
-        lines.extend(_reference_lines(references))
+        lines.extend(_reference_lines(references, short_paths))
     lines.extend(f"   Gap: {terminal_safe_text(gap)}" for gap in sc.analysis_gaps)
 
     return lines
@@ -276,6 +293,7 @@ def render_text(findings: list[Finding]) -> str:
     if not findings:
         return ""
 
+    short_paths = _short_paths(findings)
     n = len(findings)
     lines: list[str] = [
         f"⚠ DiffGuard: {n} change{'s' if n != 1 else ''} need{'s' if n == 1 else ''} review",
@@ -287,9 +305,10 @@ def render_text(findings: list[Finding]) -> str:
         line_ref = f":{sc.line}" if sc.line else ""
         lines.append(f"{idx}. {terminal_safe_text(f.category)}: {signature_display(sc)}")
         lines.append(f"   File: {terminal_safe_text(f.path)}{line_ref}")
-        lines.extend(_impact_lines(f))
+        lines.extend(_impact_lines(f, short_paths))
         if f.test_references:
-            lines.append(f"   Test evidence: {', '.join(_references_by_file(f.test_references))}")
+            test_files = _references_by_file(f.test_references, short_paths)
+            lines.append(f"   Test evidence: {', '.join(test_files)}")
         lines.append(f"   Review: {review_hint(f.category)}")
         lines.append("")
 
@@ -311,16 +330,14 @@ def _json_safe_text(value: str) -> str:
     This text is display-only and may match a literal ``\\xNN`` filename, so
     consumers must not treat it as an operational path identifier.
     """
-    chars: list[str] = []
-    for char in value:
-        codepoint = ord(char)
-        if 0xDC80 <= codepoint <= 0xDCFF:
-            chars.append(f"\\x{codepoint - 0xDC00:02x}")
-        elif 0xD800 <= codepoint <= 0xDFFF:
-            chars.append(f"\\u{codepoint:04x}")
-        else:
-            chars.append(char)
-    return "".join(chars)
+    return _LONE_SURROGATE_RE.sub(_escape_surrogate, value)
+
+
+def _escape_surrogate(match: re.Match[str]) -> str:
+    codepoint = ord(match.group())
+    if 0xDC80 <= codepoint <= 0xDCFF:
+        return f"\\x{codepoint - 0xDC00:02x}"
+    return f"\\u{codepoint:04x}"
 
 
 def _json_safe_value(value: Any) -> Any:
@@ -340,21 +357,40 @@ def _json_safe_value(value: Any) -> Any:
 
 
 def _serialize_json(model: DiffGuardOutput | ReviewEnvelope) -> str:
-    """Serialize a validated model after display-only surrogate conversion."""
-    data = _json_safe_value(model.model_dump(mode="python"))
-    safe_model: DiffGuardOutput | ReviewEnvelope
-    if isinstance(model, DiffGuardOutput):
-        safe_model = DiffGuardOutput.model_validate(data)
-    else:
-        safe_model = ReviewEnvelope.model_validate(data)
+    """Serialize a validated model after display-only surrogate conversion.
+
+    Pydantic refuses to encode lone surrogates, so the common case of a model
+    without them serializes directly; only a failure pays for the recursive
+    conversion and re-validation.
+    """
+    try:
+        serialized = model.model_dump_json(indent=2)
+    except PydanticSerializationError:
+        data = _json_safe_value(model.model_dump(mode="python"))
+        safe_model: DiffGuardOutput | ReviewEnvelope
+        if isinstance(model, DiffGuardOutput):
+            safe_model = DiffGuardOutput.model_validate(data)
+        else:
+            safe_model = ReviewEnvelope.model_validate(data)
+        serialized = safe_model.model_dump_json(indent=2)
     # Pydantic 2.0 does not accept ``ensure_ascii`` on ``model_dump_json``.
-    # Let Pydantic apply the model's established JSON encoders first (including
-    # its non-finite-float handling), then make the serialized representation
-    # safe to relay through terminals and CI logs. Parsing restores the exact
-    # Unicode values, while bidi/C1 controls cannot affect the JSON bytes as
-    # displayed.
-    encoded = json.loads(safe_model.model_dump_json())
-    return json.dumps(encoded, ensure_ascii=True, indent=2, allow_nan=False)
+    # Let Pydantic apply the model's established JSON encoders (including its
+    # non-finite-float handling) and indentation, then escape non-ASCII text
+    # so the output is safe to relay through terminals and CI logs: parsing
+    # restores the exact Unicode values, while bidi/C1 controls cannot affect
+    # the JSON bytes as displayed. Non-ASCII only occurs inside strings, so
+    # the result matches ``json.dumps(..., ensure_ascii=True, indent=2)``
+    # without re-encoding through the pure-Python indenting encoder.
+    return _JSON_NON_ASCII_RE.sub(_json_unicode_escape, serialized)
+
+
+def _json_unicode_escape(match: re.Match[str]) -> str:
+    """Return the ``\\uXXXX`` escape ``json.dumps`` uses for one character."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
 
 
 def render_summary_json(output: DiffGuardOutput) -> str:
@@ -4,10 +4,21 @@ from __future__ import annotations
 
 from typing import Any, Literal, Self
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
-class DiffStats(BaseModel):
+class _Model(BaseModel):
+    """Base for schema models.
+
+    Validators are built on first use rather than at import, so ``--help``,
+    ``install-hook`` and ``summarize`` (which never builds the review
+    envelope) do not pay for models they never touch.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class DiffStats(_Model):
     """Diff statistics."""
 
     files: int
@@ -15,7 +26,7 @@ class DiffStats(BaseModel):
     deletions: int
 
 
-class Meta(BaseModel):
+class Meta(_Model):
     """Run metadata."""
 
     ref_range: str
@@ -37,7 +48,7 @@ SymbolKind = Literal[
 """The set of values ``SymbolChange.kind`` may take."""
 
 
-class SymbolChange(BaseModel):
+class SymbolChange(_Model):
     """A single symbol-level change."""
 
     kind: SymbolKind
@@ -57,7 +68,7 @@ class SymbolChange(BaseModel):
     detail: dict[str, Any] | None = None
 
 
-class FileChange(BaseModel):
+class FileChange(_Model):
     """A changed file with its symbol-level changes."""
 
     path: str
@@ -70,7 +81,7 @@ class FileChange(BaseModel):
     changes: list[SymbolChange] = []
 
 
-class Summary(BaseModel):
+class Summary(_Model):
     """Aggregate summary of changes.
 
     Migration note (v1.0 → v1.1): Added ``focus`` field — a short list of
@@ -83,7 +94,7 @@ class Summary(BaseModel):
     focus: list[str] = []
 
 
-class TieredSummary(BaseModel):
+class TieredSummary(_Model):
     """Multi-tier human-readable summary."""
 
     oneliner: str = ""
@@ -91,7 +102,7 @@ class TieredSummary(BaseModel):
     detailed: str = ""
 
 
-class DiffGuardOutput(BaseModel):
+class DiffGuardOutput(_Model):
     """Top-level DiffGuard output.
 
     Migration note (v1.1 → v2.0): ``SymbolChange.breaking`` is now tri-state.
@@ -117,14 +128,14 @@ ReferenceKind = Literal["import", "call", "reference"]
 Confidence = Literal["high", "medium", "low"]
 
 
-class ReviewEvidence(BaseModel):
+class ReviewEvidence(_Model):
     """A factual observation supporting a review finding."""
 
     kind: Literal["syntax", "reference", "analysis_gap"]
     message: str
 
 
-class ReviewReference(BaseModel):
+class ReviewReference(_Model):
     """A syntactic name reference without compiler-grade ownership resolution."""
 
     file: str
@@ -137,7 +148,7 @@ class ReviewReference(BaseModel):
     evidence: str = "AST name match; symbol ownership unresolved"
 
 
-class ReviewFinding(BaseModel):
+class ReviewFinding(_Model):
     """One stable, agent-readable contract-change finding."""
 
     rule_id: str
@@ -158,7 +169,7 @@ class ReviewFinding(BaseModel):
     review_hint: str
 
 
-class ReviewWarning(BaseModel):
+class ReviewWarning(_Model):
     """A non-fatal analysis limitation."""
 
     code: str
@@ -166,7 +177,7 @@ class ReviewWarning(BaseModel):
     file: str | None = None
 
 
-class ReviewStats(BaseModel):
+class ReviewStats(_Model):
     """Review analysis statistics."""
 
     files_analyzed: int
@@ -176,14 +187,14 @@ class ReviewStats(BaseModel):
     silence_reason: str | None = None
 
 
-class ReviewError(BaseModel):
+class ReviewError(_Model):
     """A tool failure returned when JSON was requested."""
 
     code: str
     message: str
 
 
-class ReviewEnvelope(BaseModel):
+class ReviewEnvelope(_Model):
     """Stable JSON contract emitted by ``diffguard review``."""
 
     version: Literal["1.1.0"] = "1.1.0"
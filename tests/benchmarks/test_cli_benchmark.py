@@ -0,0 +1,68 @@
+"""CLI rendering benchmark.
+
+Times ``summarize --format json`` end to end through Click with the pipeline
+result precomputed, so the measurement covers option parsing, report
+rendering and model serialization rather than tree-sitter.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from diffguard.cli import EXIT_SUCCESS, main
+from diffguard.engine.pipeline import run_pipeline
+from diffguard.schema import DiffGuardOutput
+
+
+def _generate_added_module(n_functions: int = 50) -> tuple[str, str]:
+    """Generate an added-file diff and its source with *n_functions* functions."""
+    lines: list[str] = []
+    for i in range(n_functions):
+        lines.extend(
+            [
+                f"def func_{i}(x: int, y: str = 'default') -> dict[str, int]:",
+                f'    """Function {i}."""',
+                f"    return {{'idx': {i}, 'x': x}}",
+                "",
+                "",
+            ]
+        )
+    diff_lines = [
+        "diff --git a/module.py b/module.py",
+        "new file mode 100644",
+        "--- /dev/null",
+        "+++ b/module.py",
+        f"@@ -0,0 +1,{len(lines)} @@",
+        *(f"+{line}" for line in lines),
+    ]
+    return "\n".join(diff_lines) + "\n", "\n".join(lines)
+
+
+_DIFF, _NEW_SRC = _generate_added_module(50)
+
+
+def _get_content(ref: str, path: str) -> str | None:
+    return _NEW_SRC if ref == "new" and path == "module.py" else None
+
+
+_OUTPUT: DiffGuardOutput = run_pipeline(_DIFF, "old..new", _get_content)
+
+runner = CliRunner()
+
+
+def test_summarize_json_format(benchmark: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Benchmark rendering a 50-symbol summary as JSON through the CLI."""
+    monkeypatch.setattr("diffguard.cli.run_pipeline", lambda *args, **kwargs: _OUTPUT)
+
+    result = benchmark(
+        runner.invoke,
+        main,
+        ["summarize", "--diff", "-", "--format", "json"],
+        input=_DIFF,
+    )
+
+    assert result.exit_code == EXIT_SUCCESS
+    assert DiffGuardOutput.model_validate_json(result.output) == _OUTPUT
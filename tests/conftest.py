@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +17,42 @@ collect_ignore_glob = ["ab_repos/**"]
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _isolate_result_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Give every test an empty cache of its own.
+
+    The CLI's default path goes through the result, parse and identifier
+    caches, so they stay enabled; only their location moves, keeping tests
+    independent of entries left by earlier runs or in the real repository.
+    """
+    cache_dir = tmp_path_factory.mktemp("diffguard-cache")
+    monkeypatch.setattr("diffguard.cache.get_cache_dir", lambda repo_path=".": cache_dir)
+    monkeypatch.delenv("DIFFGUARD_NO_CACHE", raising=False)
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty, hermetic git repository initialised once per session.
+
+    Test repositories must not inherit the operator's global git hooks;
+    otherwise local commit-msg policy can make otherwise portable tests fail.
+    """
+    template = tmp_path_factory.mktemp("git-template")
+    subprocess.run(["git", "init"], cwd=template, capture_output=True, check=True)
+    for key, value in (("user.email", "t@t.com"), ("user.name", "T"), ("core.hooksPath", "")):
+        subprocess.run(["git", "config", key, value], cwd=template, capture_output=True, check=True)
+    return template
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, git_template: Path) -> Path:
+    """A fresh copy of :func:`git_template` in ``tmp_path``."""
+    shutil.copytree(git_template / ".git", tmp_path / ".git")
+    return tmp_path
+
+
 @pytest.fixture
 def load_fixture() -> Any:
     """Load a JSON fixture from tests/fixtures/<subdir>/<name>."""
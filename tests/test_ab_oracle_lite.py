@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import importlib.util
+import io
+import json
 import subprocess
+import threading
+import urllib.request
 from collections.abc import Sequence
 from pathlib import Path
 from types import ModuleType
+from typing import Any
 
 import pytest
 
@@ -28,7 +33,9 @@ def _completed(
     stdout: str = "",
     stderr: str = "",
 ) -> subprocess.CompletedProcess[Sequence[str]]:
-    return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(
+        cmd, returncode, stdout=stdout.encode(), stderr=stderr.encode()
+    )
 
 
 def test_run_test_aborts_before_claude_when_git_diff_fails(
@@ -48,11 +55,14 @@ def test_run_test_aborts_before_claude_when_git_diff_fails(
         pytest.fail("call_claude should not be invoked after a diff failure")
 
     monkeypatch.setattr(oracle.subprocess, "run", fake_run)
+    monkeypatch.setattr(oracle, "get_diffguard_context", lambda repo, ref: '{"findings": []}\n')
     monkeypatch.setattr(oracle, "call_claude", fail_call_claude)
 
     with pytest.raises(RuntimeError, match="fatal: bad revision"):
         oracle.run_test("bad range", tmp_path, "missing")
 
+    # The diffguard context runs alongside git diff, so it may also have been
+    # collected; the diff failure is still the one surfaced.
     assert calls == [["git", "diff", "missing"]]
 
 
@@ -61,69 +71,150 @@ def test_run_test_aborts_before_claude_when_diffguard_context_fails(
     tmp_path: Path,
 ) -> None:
     oracle = _load_ab_oracle()
-    calls: list[Sequence[str]] = []
 
     def fake_run(
         cmd: Sequence[str], *args: object, **kwargs: object
     ) -> subprocess.CompletedProcess[Sequence[str]]:
-        calls.append(cmd)
-        if list(cmd[:2]) == ["git", "diff"]:
-            return _completed(cmd, 0, stdout="diff --git a/lib.py b/lib.py\n")
-        return _completed(cmd, 2, stderr="Error: diffguard exploded")
+        return _completed(cmd, 0, stdout="diff --git a/lib.py b/lib.py\n")
+
+    def fail_context(repo_path: str | Path, ref_range: str) -> str:
+        raise RuntimeError("Command failed with exit 2: diffguard exploded")
 
     def fail_call_claude(system: str, user_content: str) -> str:
         pytest.fail("call_claude should not be invoked after a context failure")
 
     monkeypatch.setattr(oracle.subprocess, "run", fake_run)
+    monkeypatch.setattr(oracle, "get_diffguard_context", fail_context)
     monkeypatch.setattr(oracle, "call_claude", fail_call_claude)
 
     with pytest.raises(RuntimeError, match="diffguard exploded"):
         oracle.run_test("bad context", tmp_path, "HEAD~1..HEAD")
 
-    assert len(calls) == 2
-    assert calls[0] == ["git", "diff", "HEAD~1..HEAD"]
-    assert "review" in calls[1]
-    assert "--format" in calls[1]
-    assert "json" in calls[1]
+
+def test_run_test_issues_baseline_and_treatment_reviews_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    oracle = _load_ab_oracle()
+    (tmp_path / "tests").mkdir()
+    monkeypatch.setattr(oracle, "__file__", str(tmp_path / "scripts" / "ab_oracle_lite.py"))
+
+    def fake_run(
+        cmd: Sequence[str], *args: object, **kwargs: object
+    ) -> subprocess.CompletedProcess[Sequence[str]]:
+        return _completed(cmd, 0, stdout="diff --git a/lib.py b/lib.py\n")
+
+    # Each review waits until the other is in flight, so sequential calls
+    # would break the barrier instead of completing.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_call_claude(system: str, user_content: str) -> str:
+        barrier.wait()
+        return "treatment" if "structured context" in user_content else "baseline"
+
+    monkeypatch.setattr(oracle.subprocess, "run", fake_run)
+    monkeypatch.setattr(oracle, "get_diffguard_context", lambda repo, ref: '{"findings": []}\n')
+    monkeypatch.setattr(oracle, "call_claude", fake_call_claude)
+
+    assert oracle.run_test("pair", tmp_path, "HEAD~1..HEAD") == ("baseline", "treatment")
+    results = tmp_path / "tests" / "ab_results"
+    assert (results / "pair_A_baseline.md").read_text() == "# Baseline Review: pair\n\nbaseline"
+    assert (results / "pair_B_treatment.md").read_text() == (
+        "# Treatment Review: pair\n\ntreatment"
+    )
 
 
-def test_get_diffguard_context_accepts_review_findings_exit_one(
+def test_run_test_collects_diff_and_context_concurrently(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
     oracle = _load_ab_oracle()
-    calls: list[Sequence[str]] = []
+    (tmp_path / "tests").mkdir()
+    monkeypatch.setattr(oracle, "__file__", str(tmp_path / "scripts" / "ab_oracle_lite.py"))
+    barrier = threading.Barrier(2, timeout=5)
 
     def fake_run(
         cmd: Sequence[str], *args: object, **kwargs: object
     ) -> subprocess.CompletedProcess[Sequence[str]]:
-        calls.append(cmd)
-        return _completed(cmd, 1, stdout='{"findings": []}\n')
+        barrier.wait()
+        return _completed(cmd, 0, stdout="diff --git a/lib.py b/lib.py\n")
+
+    def fake_context(repo_path: str | Path, ref_range: str) -> str:
+        barrier.wait()
+        return '{"findings": []}\n'
+
+    monkeypatch.setattr(oracle.subprocess, "run", fake_run)
+    monkeypatch.setattr(oracle, "get_diffguard_context", fake_context)
+    monkeypatch.setattr(oracle, "call_claude", lambda system, user_content: "review")
+
+    oracle.run_test("pair", tmp_path, "HEAD~1..HEAD")
+
+    context = (tmp_path / "tests" / "ab_results" / "pair_context.md").read_text()
+    assert context == '# DiffGuard Context: pair\n\n{"findings": []}\n'
+
+
+def test_run_cmd_decodes_captured_bytes_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    oracle = _load_ab_oracle()
+    seen: dict[str, object] = {}
+
+    def fake_run(
+        cmd: Sequence[str], *args: object, **kwargs: object
+    ) -> subprocess.CompletedProcess[Sequence[str]]:
+        seen.update(kwargs)
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"caf\xc3\xa9 \xff\n", stderr=b"")
 
     monkeypatch.setattr(oracle.subprocess, "run", fake_run)
 
-    assert oracle.get_diffguard_context(tmp_path, "HEAD~1..HEAD") == '{"findings": []}\n'
-    assert calls == [
-        [
-            str(Path(__file__).parents[1] / ".venv" / "bin" / "diffguard"),
-            "review",
-            "HEAD~1..HEAD",
-            "--repo",
-            str(tmp_path),
-            "--format",
-            "json",
-        ]
+    assert oracle.run_cmd(["git", "diff"]) == "café \ufffd\n"
+    assert "text" not in seen
+
+
+def test_truncate_diff_cuts_on_a_line_boundary() -> None:
+    oracle = _load_ab_oracle()
+
+    assert oracle.truncate_diff("+a\n+b\n", limit=10) == "+a\n+b\n"
+    assert oracle.truncate_diff("+abc\n+def\n", limit=7) == "+abc"
+    assert oracle.truncate_diff("+abcdef", limit=3) == "+ab"
+
+
+def test_call_claude_streams_text_deltas(monkeypatch: pytest.MonkeyPatch) -> None:
+    oracle = _load_ab_oracle()
+    events = [
+        {"type": "message_start", "message": {"id": "msg"}},
+        {"type": "content_block_start", "index": 0},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Looks "}},
+        {"type": "ping"},
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "fine."}},
+        {"type": "message_stop"},
     ]
+    lines = [b"event: message\n"]
+    lines.extend(f"data: {json.dumps(event)}\n".encode() for event in events)
+    requests: list[urllib.request.Request] = []
+
+    def fake_urlopen(req: urllib.request.Request) -> io.BytesIO:
+        requests.append(req)
+        return io.BytesIO(b"".join(lines))
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+    assert oracle.call_claude("system", "diff") == "Looks fine."
+    assert isinstance(requests[0].data, bytes)
+    assert json.loads(requests[0].data)["stream"] is True
 
 
-def test_get_diffguard_context_uses_live_review_cli(tmp_path: Path) -> None:
+def test_call_claude_raises_on_stream_error(monkeypatch: pytest.MonkeyPatch) -> None:
     oracle = _load_ab_oracle()
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "t@example.test"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.name", "T"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "core.hooksPath", ""], cwd=repo, check=True)
+    event = {"type": "error", "error": {"type": "overloaded_error"}}
+    payload = f"data: {json.dumps(event)}\n".encode()
+    monkeypatch.setattr(urllib.request, "urlopen", lambda req: io.BytesIO(payload))
+
+    with pytest.raises(RuntimeError, match="overloaded_error"):
+        oracle.call_claude("system", "diff")
+
+
+def _commit_signature_change(repo: Path) -> Path:
     (repo / "lib.py").write_text("def helper(value):\n    return value\n")
     (repo / "app.py").write_text("from lib import helper\nprint(helper(1))\n")
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -133,8 +224,59 @@ def test_get_diffguard_context_uses_live_review_cli(tmp_path: Path) -> None:
     subprocess.run(
         ["git", "commit", "-m", "test: change signature"], cwd=repo, capture_output=True, check=True
     )
+    return repo
+
+
+def test_get_diffguard_context_uses_live_review_cli(git_repo: Path) -> None:
+    oracle = _load_ab_oracle()
+    repo = _commit_signature_change(git_repo)
 
     context = oracle.get_diffguard_context(repo, "HEAD~1..HEAD")
 
     assert '"ref_range": "HEAD~1..HEAD"' in context
     assert "helper" in context
+    # Findings make review exit 1; the JSON is still returned as context.
+    assert '"findings": [' in context
+
+
+def test_get_diffguard_context_runs_review_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+    git_repo: Path,
+) -> None:
+    oracle = _load_ab_oracle()
+    repo = _commit_signature_change(git_repo)
+    commands: list[Sequence[str]] = []
+    real_popen = subprocess.Popen
+
+    def record_popen(cmd: Sequence[str], *args: Any, **kwargs: Any) -> Any:
+        commands.append(cmd)
+        return real_popen(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", record_popen)
+
+    context = oracle.get_diffguard_context(repo, "HEAD~1..HEAD")
+
+    assert '"ref_range": "HEAD~1..HEAD"' in context
+    assert commands
+    assert all(cmd[0] == "git" for cmd in commands)
+
+
+def test_get_diffguard_context_raises_on_review_error(git_repo: Path) -> None:
+    oracle = _load_ab_oracle()
+    repo = _commit_signature_change(git_repo)
+
+    with pytest.raises(RuntimeError, match="exit 2") as excinfo:
+        oracle.get_diffguard_context(repo, "missing..HEAD")
+
+    assert "bad revision" in str(excinfo.value)
+
+
+def test_get_diffguard_context_reports_cli_stderr(git_repo: Path) -> None:
+    oracle = _load_ab_oracle()
+    repo = _commit_signature_change(git_repo)
+
+    # Usage errors are written to stderr; they belong in the error, not the terminal.
+    with pytest.raises(RuntimeError, match="exit 2") as excinfo:
+        oracle.get_diffguard_context(repo, "--no-such-option")
+
+    assert "Error: No such option" in str(excinfo.value)
@@ -0,0 +1,233 @@
+"""Tests for the committed-range result cache."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from diffguard import cache
+from diffguard.cli import main
+from diffguard.engine.deps import scan_references
+from diffguard.engine.parser import parse_file
+from diffguard.engine.pipeline import run_pipeline
+from diffguard.git import get_cache_dir
+from diffguard.schema import DiffGuardOutput, DiffStats, Meta
+
+runner = CliRunner()
+
+
+def _output(*warnings: str) -> DiffGuardOutput:
+    stats = DiffStats(files=0, additions=0, deletions=0)
+    return DiffGuardOutput(
+        meta=Meta(ref_range="HEAD~1..HEAD", stats=stats, warnings=list(warnings))
+    )
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def repo(git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Two-commit repository with the cache enabled at its real location."""
+    monkeypatch.delenv(cache.DISABLE_ENV_VAR, raising=False)
+    monkeypatch.setattr(cache, "get_cache_dir", get_cache_dir)
+    (git_repo / "app.py").write_text("def run(a):\n    return a\n")
+    _git(git_repo, "add", "-A")
+    _git(git_repo, "commit", "-q", "-m", "init")
+    (git_repo / "app.py").write_text("def run(a, b):\n    return a + b\n")
+    _git(git_repo, "commit", "-q", "-am", "change")
+    return git_repo
+
+
+def test_cache_dir_lives_under_git_dir(repo: Path) -> None:
+    assert get_cache_dir(repo) == (repo / ".git" / "diffguard-cache").resolve()
+
+
+def test_cache_key_depends_on_diff_and_options(repo: Path) -> None:
+    key = cache.cache_key(str(repo), "HEAD~1..HEAD", "diff")
+
+    assert key is not None
+    assert cache.cache_key(str(repo), "HEAD~1..HEAD", "diff") == key
+    assert cache.cache_key(str(repo), "HEAD~1..HEAD", "other") != key
+    assert cache.cache_key(str(repo), "HEAD~1..HEAD", "diff", include_tests=True) != key
+
+
+def test_cache_key_skips_mutable_and_unresolvable_snapshots(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert cache.cache_key(str(repo), "HEAD..:index", "diff") is None
+    assert cache.cache_key(str(repo), "HEAD..:worktree", "diff") is None
+    assert cache.cache_key(str(repo), "HEAD..missing", "diff") is None
+    assert cache.cache_key(str(repo / "absent"), "HEAD~1..HEAD", "diff") is None
+
+    monkeypatch.setenv(cache.DISABLE_ENV_VAR, "1")
+    assert cache.cache_key(str(repo), "HEAD~1..HEAD", "diff") is None
+
+
+def test_store_and_load_round_trip(repo: Path) -> None:
+    output = _output()
+
+    cache.store_output(str(repo), "k", output)
+
+    assert cache.load_output(str(repo), "k") == output
+    assert cache.load_output(str(repo), "missing") is None
+
+
+def test_outputs_with_warnings_are_not_stored(repo: Path) -> None:
+    output = _output("transient")
+
+    cache.store_output(str(repo), "k", output)
+
+    assert cache.load_output(str(repo), "k") is None
+
+
+def test_corrupt_entry_is_a_miss(repo: Path) -> None:
+    cache_dir = get_cache_dir(repo)
+    cache_dir.mkdir()
+    (cache_dir / "k.json").write_text("{not json")
+
+    assert cache.load_output(str(repo), "k") is None
+
+
+def test_store_prunes_oldest_entries(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 2)
+    output = _output()
+
+    for key in ("a", "b", "c"):
+        cache.store_output(str(repo), key, output)
+
+    assert len(list(get_cache_dir(repo).glob("*.json"))) == 2
+
+
+def test_repeated_review_reuses_cached_pipeline_output(repo: Path) -> None:
+    with patch("diffguard.cli.run_pipeline", wraps=run_pipeline) as pipeline:
+        first = runner.invoke(
+            main, ["review", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"]
+        )
+        second = runner.invoke(
+            main, ["review", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"]
+        )
+
+    assert first.exit_code == second.exit_code
+    assert first.output == second.output
+    assert pipeline.call_count == 1
+
+
+def test_cache_hit_reports_its_own_timing(repo: Path) -> None:
+    args = ["summarize", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"]
+    first = DiffGuardOutput.model_validate_json(runner.invoke(main, args).output)
+    (entry,) = get_cache_dir(repo).glob("*.json")
+    stored = DiffGuardOutput.model_validate_json(entry.read_text())
+    stored.meta.timing_ms = 99999.0
+    entry.write_text(stored.model_dump_json())
+
+    with patch("diffguard.cli.run_pipeline") as pipeline:
+        second = DiffGuardOutput.model_validate_json(runner.invoke(main, args).output)
+
+    pipeline.assert_not_called()
+    assert second.meta.timing_ms is not None
+    assert second.meta.timing_ms != 99999.0
+    assert second.model_copy(update={"meta": first.meta}) == first
+
+
+def test_cached_review_findings_match_an_uncached_review(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (repo / "caller.py").write_text("from app import run\n\nrun(1)\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "caller")
+    (repo / "app.py").write_text("def run(a, b, c):\n    return a + b + c\n")
+    _git(repo, "commit", "-q", "-am", "widen")
+    args = ["review", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"]
+
+    cold = runner.invoke(main, args)
+    # Drop whole-result entries so the warm run re-analyzes from the parse and
+    # identifier caches alone.
+    for entry in get_cache_dir(repo).glob("*.json"):
+        entry.unlink()
+    warm = runner.invoke(main, args)
+    monkeypatch.setenv(cache.DISABLE_ENV_VAR, "1")
+    uncached = runner.invoke(main, args)
+
+    assert uncached.exit_code == cold.exit_code == warm.exit_code
+    assert json.loads(uncached.output)["findings"]
+    assert uncached.output == cold.output == warm.output
+
+
+def test_summarize_options_are_cached_separately(repo: Path) -> None:
+    with patch("diffguard.cli.run_pipeline", wraps=run_pipeline) as pipeline:
+        runner.invoke(main, ["summarize", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"])
+        runner.invoke(
+            main,
+            [
+                "summarize",
+                "HEAD~1..HEAD",
+                "--repo",
+                str(repo),
+                "--format",
+                "json",
+                "--include-tests",
+            ],
+        )
+        runner.invoke(main, ["summarize", "HEAD~1..HEAD", "--repo", str(repo), "--format", "json"])
+
+    assert pipeline.call_count == 2
+
+
+def test_parse_cache_is_bypassed_when_disabled(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(cache.DISABLE_ENV_VAR, "1")
+
+    assert cache.make_cached_parser(str(repo)) is parse_file
+
+
+def test_parse_cache_reuses_results_across_parsers(repo: Path) -> None:
+    source = "class A:\n    def run(self, a):\n        return a\n"
+    expected = parse_file(source, "python", file_path="a.py")
+
+    with patch("diffguard.cache.parse_file", wraps=parse_file) as parse:
+        first = cache.make_cached_parser(str(repo))(source, "python", file_path="a.py")
+        second = cache.make_cached_parser(str(repo))(source, "python", file_path="b.py")
+        cache.make_cached_parser(str(repo))(source, "python", file_path="a.pyi")
+
+    assert first == second == expected
+    assert first.symbols[0] is not second.symbols[0]
+    # Same content under a different extension may select a different dialect.
+    assert parse.call_count == 2
+
+
+def test_corrupt_parse_entry_is_reparsed(repo: Path) -> None:
+    parser = cache.make_cached_parser(str(repo))
+    parser("def run():\n    pass\n", "python", file_path="a.py")
+    for entry in (get_cache_dir(repo) / "parse").glob("*.json"):
+        entry.write_text('{"symbols": [["only-a-name"]]}')
+
+    result = parser("def run():\n    pass\n", "python", file_path="a.py")
+
+    assert [symbol.name for symbol in result.symbols] == ["run"]
+
+
+def test_identifier_index_cache_serves_warm_reference_scans(repo: Path) -> None:
+    indexer = cache.make_cached_indexer(str(repo))
+    cold = scan_references(str(repo), ["run"], "HEAD", index_source=indexer)
+
+    with patch("diffguard.cache.index_identifiers") as index:
+        warm = scan_references(
+            str(repo), ["run"], "HEAD", index_source=cache.make_cached_indexer(str(repo))
+        )
+
+    index.assert_not_called()
+    assert warm == cold == scan_references(str(repo), ["run"], "HEAD")
+
+
+def test_identifier_index_cache_is_bypassed_when_disabled(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(cache.DISABLE_ENV_VAR, "1")
+
+    assert cache.make_cached_indexer(str(repo)) is None
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import gc
 import json
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import ANY, MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from diffguard import __version__
@@ -14,6 +18,8 @@ from diffguard.cli import (
     EXIT_NO_CHANGES,
     EXIT_PARTIAL,
     EXIT_SUCCESS,
+    _make_content_provider,
+    _make_staged_content_provider,
     main,
 )
 from diffguard.engine._types import Reference, ReferenceScan
@@ -29,6 +35,31 @@ from diffguard.schema import (
 
 runner = CliRunner()
 
+StubPipeline = Callable[[DiffGuardOutput | Exception], list[dict[str, Any]]]
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch: pytest.MonkeyPatch) -> StubPipeline:
+    """Swap ``run_pipeline`` for a stub returning (or raising) *result*.
+
+    Installing the stub returns the list the stub records call kwargs in.
+    """
+
+    def _install(result: DiffGuardOutput | Exception) -> list[dict[str, Any]]:
+        calls: list[dict[str, Any]] = []
+
+        def _run_pipeline(*args: object, **kwargs: Any) -> DiffGuardOutput:
+            calls.append(kwargs)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr("diffguard.cli.run_pipeline", _run_pipeline)
+        return calls
+
+    return _install
+
+
 SAMPLE_DIFF = """\
 diff --git a/hello.py b/hello.py
 new file mode 100644
@@ -72,6 +103,12 @@ def _make_output(parse_error: bool = False, generated: bool = False) -> DiffGuar
     )
 
 
+# Shared by the summarize tests that hand the output over unmodified; tests
+# that edit an output build their own with _make_output().
+_SAMPLE_OUTPUT = _make_output()
+_PARSE_ERROR_OUTPUT = _make_output(parse_error=True)
+
+
 def _make_review_output(*changes: SymbolChange) -> DiffGuardOutput:
     return DiffGuardOutput(
         meta=Meta(ref_range="base..head", stats=DiffStats(files=1, additions=1, deletions=1)),
@@ -92,9 +129,8 @@ def test_version() -> None:
     assert __version__ in result.output
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_stdin_json(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output()
+def test_stdin_json(stub_pipeline: StubPipeline) -> None:
+    stub_pipeline(_SAMPLE_OUTPUT)
     result = runner.invoke(
         main,
         ["summarize", "--diff", "-", "--repo", "/does/not/need/to/exist"],
@@ -106,14 +142,13 @@ def test_stdin_json(mock_pipeline: MagicMock) -> None:
     assert data["meta"]["ref_range"] == "stdin"
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_stdin_json_renders_surrogateescaped_paths_safely(mock_pipeline: MagicMock) -> None:
+def test_stdin_json_renders_surrogateescaped_paths_safely(stub_pipeline: StubPipeline) -> None:
     path = b"pkg/\xff.py".decode("utf-8", "surrogateescape")
     output = _make_output()
     output.files[0].path = path
     output.meta.warnings = [f"{path}: parse gap — symbol analysis skipped"]
     output.tiered.detailed = f"Changed {path}"
-    mock_pipeline.return_value = output
+    stub_pipeline(output)
 
     result = runner.invoke(
         main,
@@ -151,34 +186,30 @@ def test_stdin_no_changes_json_is_schema_valid() -> None:
     assert output.tiered.oneliner == ""
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_format_oneliner(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output()
-    result = runner.invoke(
-        main, ["summarize", "--diff", "-", "--format", "oneliner"], input=SAMPLE_DIFF
-    )
-    assert result.exit_code == EXIT_SUCCESS
-    assert result.output.strip() == "Add `hello`"
-
-
-@patch("diffguard.cli.run_pipeline")
-def test_format_short(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output()
-    result = runner.invoke(
-        main, ["summarize", "--diff", "-", "--format", "short"], input=SAMPLE_DIFF
-    )
+@pytest.mark.parametrize(
+    ("fmt", "check"),
+    [
+        ("oneliner", lambda out: out.strip() == "Add `hello`"),
+        ("short", lambda out: out.strip() == "`hello` (added)"),
+        ("detailed", lambda out: "hello.py" in out),
+        ("json", lambda out: "files" in json.loads(out)),
+    ],
+    ids=["oneliner", "short", "detailed", "json"],
+)
+def test_format(stub_pipeline: StubPipeline, fmt: str, check: Callable[[str], bool]) -> None:
+    stub_pipeline(_SAMPLE_OUTPUT)
+    result = runner.invoke(main, ["summarize", "--diff", "-", "--format", fmt], input=SAMPLE_DIFF)
     assert result.exit_code == EXIT_SUCCESS
-    assert result.output.strip() == "`hello` (added)"
+    assert check(result.output), result.output
 
 
 @patch("diffguard.cli.report.render_summary_text", return_value="safe summary")
-@patch("diffguard.cli.run_pipeline")
 def test_human_format_passes_summary_visibility_flags(
-    mock_pipeline: MagicMock,
     mock_render: MagicMock,
+    stub_pipeline: StubPipeline,
 ) -> None:
     output = _make_output()
-    mock_pipeline.return_value = output
+    stub_pipeline(output)
 
     result = runner.invoke(
         main,
@@ -204,13 +235,12 @@ def test_human_format_passes_summary_visibility_flags(
     )
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_human_summary_escapes_repository_control_characters(mock_pipeline: MagicMock) -> None:
+def test_human_summary_escapes_repository_control_characters(stub_pipeline: StubPipeline) -> None:
     output = _make_output()
     output.files[0].path = "src/unsafe\npath\x1b[2J.py"
     output.files[0].changes[0].name = "hello\tjob\u202e"
     output.files[0].changes[0].signature = "def hello\tjob\u202e()"
-    mock_pipeline.return_value = output
+    stub_pipeline(output)
 
     result = runner.invoke(
         main,
@@ -225,14 +255,13 @@ def test_human_summary_escapes_repository_control_characters(mock_pipeline: Magi
     assert r"`hello\tjob\u202e` (src/unsafe\npath\x1b[2J.py)" in result.output
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_summary_json_preserves_raw_repository_controls(mock_pipeline: MagicMock) -> None:
+def test_summary_json_preserves_raw_repository_controls(stub_pipeline: StubPipeline) -> None:
     output = _make_output()
     path = "src/unsafe\npath\x1b[2J.py"
     name = "hello\tjob\u202e"
     output.files[0].path = path
     output.files[0].changes[0].name = name
-    mock_pipeline.return_value = output
+    stub_pipeline(output)
 
     result = runner.invoke(
         main,
@@ -246,50 +275,25 @@ def test_summary_json_preserves_raw_repository_controls(mock_pipeline: MagicMock
     assert payload["files"][0]["changes"][0]["name"] == name
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_format_detailed(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output()
-    result = runner.invoke(
-        main, ["summarize", "--diff", "-", "--format", "detailed"], input=SAMPLE_DIFF
-    )
-    assert result.exit_code == EXIT_SUCCESS
-    assert "hello.py" in result.output
-
-
-@patch("diffguard.cli.run_pipeline")
-def test_format_json(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output()
-    result = runner.invoke(
-        main, ["summarize", "--diff", "-", "--format", "json"], input=SAMPLE_DIFF
-    )
-    assert result.exit_code == EXIT_SUCCESS
-    data = json.loads(result.output)
-    assert "files" in data
-
-
-@patch("diffguard.cli.run_pipeline")
-def test_partial_success(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output(parse_error=True)
+def test_partial_success(stub_pipeline: StubPipeline) -> None:
+    stub_pipeline(_PARSE_ERROR_OUTPUT)
     result = runner.invoke(main, ["summarize", "--diff", "-"], input=SAMPLE_DIFF)
     assert result.exit_code == EXIT_PARTIAL
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_no_generated(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.return_value = _make_output(generated=False)
+def test_no_generated(stub_pipeline: StubPipeline) -> None:
+    calls = stub_pipeline(_SAMPLE_OUTPUT)
     result = runner.invoke(main, ["summarize", "--diff", "-", "--no-generated"], input=SAMPLE_DIFF)
     assert result.exit_code == EXIT_SUCCESS
     # Verify skip_generated=True was passed through to run_pipeline
-    mock_pipeline.assert_called_once()
-    _, kwargs = mock_pipeline.call_args
-    assert kwargs["skip_generated"] is True
+    assert len(calls) == 1
+    assert calls[0]["skip_generated"] is True
     data = json.loads(result.output)
     assert data["files"][0]["generated"] is False
 
 
-@patch("diffguard.cli.run_pipeline")
-def test_summarize_text_error_escapes_control_characters(mock_pipeline: MagicMock) -> None:
-    mock_pipeline.side_effect = RuntimeError("something\nforged\x1b[2J broke")
+def test_summarize_text_error_escapes_control_characters(stub_pipeline: StubPipeline) -> None:
+    stub_pipeline(RuntimeError("something\nforged\x1b[2J broke"))
     result = runner.invoke(main, ["summarize", "--diff", "-"], input=SAMPLE_DIFF)
     assert result.exit_code == EXIT_ERROR
     assert "\x1b" not in result.output
@@ -298,14 +302,13 @@ def test_summarize_text_error_escapes_control_characters(mock_pipeline: MagicMoc
 
 @patch("diffguard.cli.get_diff")
 @patch("diffguard.cli.get_repository_root", return_value="/repo")
-@patch("diffguard.cli.run_pipeline")
 def test_ref_range(
-    mock_pipeline: MagicMock,
     _mock_repository_root: MagicMock,
     mock_get_diff: MagicMock,
+    stub_pipeline: StubPipeline,
 ) -> None:
     mock_get_diff.return_value = SAMPLE_DIFF
-    mock_pipeline.return_value = _make_output()
+    stub_pipeline(_SAMPLE_OUTPUT)
     result = runner.invoke(main, ["summarize", "HEAD~1..HEAD"])
     assert result.exit_code == EXIT_SUCCESS
     mock_get_diff.assert_called_once_with("HEAD~1..HEAD", repo_path="/repo")
@@ -313,6 +316,49 @@ def test_ref_range(
     assert "files" in data
 
 
+@patch("diffguard.cli.BlobBatchReader")
+def test_content_provider_memoizes_ref_path_lookups(mock_reader_class: MagicMock) -> None:
+    mock_read = mock_reader_class.return_value.read
+    mock_read.return_value = "def hello(): ...\n"
+    provider = _make_content_provider("/repo")
+
+    assert provider("base", "hello.py") == "def hello(): ...\n"
+    assert provider("base", "hello.py") == "def hello(): ...\n"
+    provider("head", "hello.py")
+    mock_reader_class.assert_called_once_with("/repo")
+    assert mock_read.call_count == 2
+    mock_read.assert_any_call("base", "hello.py")
+
+    provider.cache_clear()  # type: ignore[attr-defined]
+    provider("base", "hello.py")
+    assert mock_read.call_count == 3
+
+    del provider
+    gc.collect()
+    mock_reader_class.return_value.close.assert_called_once_with()
+
+
+@patch("diffguard.cli.get_file_from_index", return_value="staged\n")
+@patch("diffguard.cli.BlobBatchReader")
+def test_staged_content_provider_batches_commit_reads(
+    mock_reader_class: MagicMock, mock_index: MagicMock
+) -> None:
+    mock_read = mock_reader_class.return_value.read
+    mock_read.return_value = "committed\n"
+    provider = _make_staged_content_provider("/repo")
+
+    assert provider("HEAD", "a.py") == "committed\n"
+    assert provider("HEAD", "b.py") == "committed\n"
+    assert provider(":index", "a.py") == "staged\n"
+    mock_reader_class.assert_called_once_with("/repo")
+    assert mock_read.call_count == 2
+    mock_index.assert_called_once_with("a.py", repo_path="/repo")
+
+    del provider
+    gc.collect()
+    mock_reader_class.return_value.close.assert_called_once_with()
+
+
 def test_review_does_not_scan_silent_addition_or_body_change() -> None:
     output = _make_review_output(
         SymbolChange(kind="function_added", name="added", after_signature="def added()"),
@@ -369,7 +415,9 @@ def test_review_scans_only_symbols_that_surface_as_findings() -> None:
         )
 
     assert result.exit_code == EXIT_FINDINGS
-    mock_scan.assert_called_once_with("/repo", ["signature", "removed", "moved"], "head")
+    mock_scan.assert_called_once_with(
+        "/repo", ["signature", "removed", "moved"], "head", index_source=ANY
+    )
     payload = json.loads(result.output)
     assert [finding["symbol"] for finding in payload["findings"]] == [
         "signature",
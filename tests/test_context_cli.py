@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -19,21 +20,35 @@ _skip_in_ci = pytest.mark.skipif(
 )
 
 
-def _init_repo(tmp_path):
-    """Initialize a git repo in tmp_path."""
-    repo = str(tmp_path)
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "t@t.com"], cwd=repo, capture_output=True, check=True
-    )
-    subprocess.run(["git", "config", "user.name", "T"], cwd=repo, capture_output=True, check=True)
+_REAL_SUBPROCESS_RUN = subprocess.run
+
+runner = CliRunner()
+
+
+def _commit_snapshots(repo: str, *snapshots: dict[str, str]) -> None:
+    """Commit each ``{path: text}`` snapshot on top of HEAD in one fast-import.
+
+    Equivalent to writing the files then ``git add`` + ``git commit`` per
+    snapshot, without a process pair per commit. The worktree and index are
+    left untouched, so only use this for committed-range reviews.
+    """
+    git_dir = Path(repo, ".git")
+    branch = (git_dir / "HEAD").read_text().removeprefix("ref: ").strip()
+    stream = bytearray()
+    for index, files in enumerate(snapshots):
+        stream += f"commit {branch}\ncommitter T <t@t.com> 0 +0000\ndata 0\n".encode()
+        if index == 0 and (git_dir / branch).exists():
+            stream += f"from {branch}^0\n".encode()
+        for path, text in files.items():
+            data = text.encode()
+            stream += f"M 100644 inline {path}\ndata {len(data)}\n".encode() + data + b"\n"
     subprocess.run(
-        ["git", "config", "core.hooksPath", ""], cwd=repo, capture_output=True, check=True
+        ["git", "fast-import", "--quiet"],
+        input=bytes(stream),
+        cwd=repo,
+        capture_output=True,
+        check=True,
     )
-    return repo
-
-
-_REAL_SUBPROCESS_RUN = subprocess.run
 
 
 def _simulate_empty_no_index_equality(command, *args, **kwargs):
@@ -67,88 +82,73 @@ class TestReviewCommand:
     @_skip_in_ci
     def test_review_on_own_repo(self):
         """Run review on the diffguard repo itself."""
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", "."])
         assert result.exit_code in (EXIT_SUCCESS, EXIT_FINDINGS)
 
     @_skip_in_ci
     def test_review_default_ref_range(self):
         """review with no ref_range defaults to HEAD~1..HEAD."""
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "--repo", "."])
         assert result.exit_code in (EXIT_SUCCESS, EXIT_FINDINGS)
 
     @_skip_in_ci
     def test_review_verbose_on_own_repo(self):
         """With --verbose, always shows output even if no high-signal changes."""
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", ".", "--verbose"])
         assert result.exit_code in (EXIT_SUCCESS, EXIT_FINDINGS)
 
     @_skip_in_ci
     def test_review_no_deps(self):
         """Run review with --no-deps flag."""
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", ".", "--no-deps"])
         assert result.exit_code in (EXIT_SUCCESS, EXIT_FINDINGS)
 
-    def test_body_only_changes_silent(self, tmp_path):
+    def test_body_only_changes_silent(self, git_repo):
         """PR with only body modifications (no signature changes) → silent exit 0."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text("def helper():\n    return 1\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
-
-        (tmp_path / "lib.py").write_text("def helper():\n    return 42\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "change body"], cwd=repo, capture_output=True, check=True
+        _commit_snapshots(
+            repo,
+            {"lib.py": "def helper():\n    return 1\n"},
+            {"lib.py": "def helper():\n    return 42\n"},
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo])
         assert result.exit_code == EXIT_SUCCESS
         assert result.output.strip() == ""
 
-    def test_signature_change_produces_output(self, tmp_path):
+    def test_signature_change_produces_output(self, git_repo):
         """PR with signature change → exit 1 with output."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
-        (tmp_path / "main.py").write_text("from lib import helper\nx = helper(1)\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
-
-        (tmp_path / "lib.py").write_text("def helper(a, b):\n    return a + b\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "add param"], cwd=repo, capture_output=True, check=True
+        _commit_snapshots(
+            repo,
+            {
+                "lib.py": "def helper(a):\n    return a\n",
+                "main.py": "from lib import helper\nx = helper(1)\n",
+            },
+            {"lib.py": "def helper(a, b):\n    return a + b\n"},
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo])
         assert result.exit_code == EXIT_FINDINGS
         assert "⚠ DiffGuard:" in result.output
         assert "PARAMETER ADDED (REQUIRED)" in result.output
         assert "helper" in result.output
 
-    def test_signature_change_json_format(self, tmp_path):
+    def test_signature_change_json_format(self, git_repo):
         """--format json produces valid JSON with findings."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
-        (tmp_path / "main.py").write_text("from lib import helper\nx = helper(1)\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
-
-        (tmp_path / "lib.py").write_text("def helper(a, b):\n    return a + b\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "add param"], cwd=repo, capture_output=True, check=True
+        _commit_snapshots(
+            repo,
+            {
+                "lib.py": "def helper(a):\n    return a\n",
+                "main.py": "from lib import helper\nx = helper(1)\n",
+            },
+            {"lib.py": "def helper(a, b):\n    return a + b\n"},
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo, "--format", "json"])
         assert result.exit_code == EXIT_FINDINGS
         data = json.loads(result.output)
@@ -166,8 +166,8 @@ class TestReviewCommand:
         assert "review_hint" in finding
         assert data["stats"]["silence_reason"] is None
 
-    def test_move_json_preserves_source_and_destination_paths(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_move_json_preserves_source_and_destination_paths(self, tmp_path, git_repo):
+        repo = str(git_repo)
         (tmp_path / "old_module.py").write_text(
             "def helper():\n    return 1\n\ndef stays_old():\n    return 2\n"
         )
@@ -189,7 +189,7 @@ class TestReviewCommand:
             check=True,
         )
 
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             ["review", "HEAD~1..HEAD", "--repo", repo, "--format", "json"],
         )
@@ -203,29 +203,26 @@ class TestReviewCommand:
         assert move["file"] == "new_module.py"
         assert move["source_file"] == "old_module.py"
 
-    def test_body_only_json_silent(self, tmp_path):
+    def test_body_only_json_silent(self, git_repo):
         """Body-only changes in JSON format → exit 0 with empty findings."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text("def helper():\n    return 1\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
-
-        (tmp_path / "lib.py").write_text("def helper():\n    return 42\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "change body"], cwd=repo, capture_output=True, check=True
+        _commit_snapshots(
+            repo,
+            {"lib.py": "def helper():\n    return 1\n"},
+            {"lib.py": "def helper():\n    return 42\n"},
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo, "--format", "json"])
         assert result.exit_code == EXIT_SUCCESS
         data = json.loads(result.output)
         assert data["findings"] == []
         assert data["stats"]["silence_reason"] == "no high-signal changes"
 
-    def test_silent_addition_and_body_change_do_not_scan_reference_parse_gap(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_silent_addition_and_body_change_do_not_scan_reference_parse_gap(
+        self, tmp_path, git_repo
+    ):
+        repo = str(git_repo)
         (tmp_path / "lib.py").write_text("def body_only():\n    return 1\n")
         (tmp_path / "broken.py").write_text("body_only(\nadded(\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -240,7 +237,7 @@ class TestReviewCommand:
             ["git", "commit", "-m", "silent changes"], cwd=repo, capture_output=True, check=True
         )
 
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             ["review", "HEAD~1..HEAD", "--repo", repo, "--format", "json"],
         )
@@ -250,8 +247,8 @@ class TestReviewCommand:
         assert data["findings"] == []
         assert data["warnings"] == []
 
-    def test_signature_finding_retains_reference_scan_parse_gap(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_signature_finding_retains_reference_scan_parse_gap(self, tmp_path, git_repo):
+        repo = str(git_repo)
         (tmp_path / "lib.py").write_text("def surfaced(value):\n    return value\n")
         (tmp_path / "broken.py").write_text("surfaced(\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -267,7 +264,7 @@ class TestReviewCommand:
             ["git", "commit", "-m", "signature"], cwd=repo, capture_output=True, check=True
         )
 
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             ["review", "HEAD~1..HEAD", "--repo", repo, "--format", "json"],
         )
@@ -283,23 +280,16 @@ class TestReviewCommand:
             }
         ]
 
-    def test_removed_symbol_produces_output(self, tmp_path):
+    def test_removed_symbol_produces_output(self, git_repo):
         """Removed symbol should produce output with exit 1."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text(
-            "def helper():\n    return 1\n\ndef old_func():\n    pass\n"
+        _commit_snapshots(
+            repo,
+            {"lib.py": "def helper():\n    return 1\n\ndef old_func():\n    pass\n"},
+            {"lib.py": "def helper():\n    return 1\n"},
         )
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
 
-        (tmp_path / "lib.py").write_text("def helper():\n    return 1\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "remove old_func"], cwd=repo, capture_output=True, check=True
-        )
-
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo])
         assert result.exit_code == EXIT_FINDINGS
         assert "⚠ DiffGuard:" in result.output
@@ -307,33 +297,27 @@ class TestReviewCommand:
 
     def test_error_exit_code(self, tmp_path):
         """Invalid repo should exit with code 2."""
-        runner = CliRunner()
         result = runner.invoke(
             main, ["review", "HEAD~1..HEAD", "--repo", str(tmp_path / "nonexistent")]
         )
         assert result.exit_code == EXIT_ERROR
 
-    def test_verbose_shows_output_for_body_changes(self, tmp_path):
+    def test_verbose_shows_output_for_body_changes(self, git_repo):
         """--verbose shows output even for body-only changes."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        (tmp_path / "lib.py").write_text("def helper():\n    return 1\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
-
-        (tmp_path / "lib.py").write_text("def helper():\n    return 42\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "change body"], cwd=repo, capture_output=True, check=True
+        _commit_snapshots(
+            repo,
+            {"lib.py": "def helper():\n    return 1\n"},
+            {"lib.py": "def helper():\n    return 42\n"},
         )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD~1..HEAD", "--repo", repo, "--verbose"])
         assert result.exit_code in (EXIT_SUCCESS, EXIT_FINDINGS)
 
-    def test_staged_review_uses_index_not_worktree(self, tmp_path):
+    def test_staged_review_uses_index_not_worktree(self, tmp_path, git_repo):
         """--staged analyzes the index and ignores unstaged working tree edits."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -343,7 +327,6 @@ class TestReviewCommand:
         subprocess.run(["git", "add", "lib.py"], cwd=repo, capture_output=True, check=True)
         (tmp_path / "lib.py").write_text("def helper(a, b=1):\n    return a + b\n")
 
-        runner = CliRunner()
         result = runner.invoke(
             main,
             ["review", "--staged", "--repo", repo, "--format", "json"],
@@ -356,19 +339,18 @@ class TestReviewCommand:
         assert "def helper(a, b)" in data["findings"][0]["after_signature"]
         assert "b=1" not in data["findings"][0]["after_signature"]
 
-    def test_staged_review_rejects_ref_range(self, tmp_path):
+    def test_staged_review_rejects_ref_range(self, tmp_path, git_repo):
         """--staged has one unambiguous source: the git index."""
-        repo = _init_repo(tmp_path)
+        repo = str(git_repo)
 
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "HEAD", "--staged", "--repo", repo])
 
         assert result.exit_code == EXIT_ERROR
         assert "--staged cannot be combined with a ref range" in result.output
 
     @pytest.mark.parametrize("mode", ["committed", "staged"])
-    def test_review_from_nested_repo_path_uses_top_level_paths(self, tmp_path, mode):
-        repo = _init_repo(tmp_path)
+    def test_review_from_nested_repo_path_uses_top_level_paths(self, tmp_path, git_repo, mode):
+        repo = str(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a=1):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
@@ -390,7 +372,7 @@ class TestReviewCommand:
         else:
             command = ["review", "--staged"]
 
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             [*command, "--repo", str(nested), "--format", "json"],
         )
@@ -402,8 +384,8 @@ class TestReviewCommand:
 
 
 class TestSummarizeCommand:
-    def test_default_from_nested_repo_uses_complete_worktree_snapshot(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_default_from_nested_repo_uses_complete_worktree_snapshot(self, tmp_path, git_repo):
+        repo = str(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a=1):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
@@ -414,7 +396,7 @@ class TestSummarizeCommand:
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         (tmp_path / "added.py").write_text("def added():\n    return 1\n")
 
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             ["summarize", "--repo", str(nested), "--format", "json"],
         )
@@ -427,8 +409,8 @@ class TestSummarizeCommand:
         lib = next(file for file in data["files"] if file["path"] == "lib.py")
         assert any(change["kind"] == "signature_changed" for change in lib["changes"])
 
-    def test_nested_worktree_includes_empty_code_and_non_code_files(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_nested_worktree_includes_empty_code_and_non_code_files(self, tmp_path, git_repo):
+        repo = str(git_repo)
         (tmp_path / "baseline.py").write_text("VALUE = 1\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
@@ -445,7 +427,7 @@ class TestSummarizeCommand:
             "diffguard.git.subprocess.run",
             side_effect=_simulate_empty_no_index_equality,
         ):
-            result = CliRunner().invoke(
+            result = runner.invoke(
                 main,
                 ["summarize", "--repo", str(nested), "--format", "json"],
             )
@@ -465,10 +447,10 @@ class TestWorktreeReview:
     """Hermetic end-to-end coverage for base-to-worktree review state."""
 
     @staticmethod
-    def _baseline(tmp_path) -> str:
-        repo = _init_repo(tmp_path)
-        (tmp_path / "lib.py").write_text("def helper(a=1):\n    return a\n")
-        (tmp_path / "main.py").write_text("from lib import helper\nvalue = helper()\n")
+    def _baseline(git_repo) -> str:
+        repo = str(git_repo)
+        (git_repo / "lib.py").write_text("def helper(a=1):\n    return a\n")
+        (git_repo / "main.py").write_text("from lib import helper\nvalue = helper()\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
             ["git", "commit", "-m", "baseline"], cwd=repo, capture_output=True, check=True
@@ -477,7 +459,7 @@ class TestWorktreeReview:
 
     @staticmethod
     def _review(repo: str, *args: str):
-        return CliRunner().invoke(
+        return runner.invoke(
             main,
             [
                 "review",
@@ -492,8 +474,8 @@ class TestWorktreeReview:
             ],
         )
 
-    def test_clean(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_clean(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         result = self._review(repo)
         assert result.exit_code == EXIT_SUCCESS
         data = json.loads(result.output)
@@ -501,16 +483,16 @@ class TestWorktreeReview:
         assert data["findings"] == []
         assert data["stats"]["silence_reason"] == "no changes in diff"
 
-    def test_staged_only(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_staged_only(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "lib.py"], cwd=repo, capture_output=True, check=True)
         result = self._review(repo)
         assert result.exit_code == EXIT_FINDINGS
         assert json.loads(result.output)["findings"][0]["category_id"] == "default_removed"
 
-    def test_unstaged_only_and_changed_file_reference(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_unstaged_only_and_changed_file_reference(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n\nvalue = helper(1)\n")
         result = self._review(repo)
         assert result.exit_code == EXIT_FINDINGS
@@ -519,8 +501,8 @@ class TestWorktreeReview:
             ref["file"] == "lib.py" and ref["kind"] == "call" for ref in finding["references"]
         )
 
-    def test_changed_file_destructuring_bindings_are_not_references(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_changed_file_destructuring_bindings_are_not_references(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text(
             "def helper(a):\n"
             "    return a\n"
@@ -541,8 +523,8 @@ class TestWorktreeReview:
             if ref["file"] == "lib.py"
         ] == [("lib.py", 4, "call")]
 
-    def test_nested_repo_path_uses_top_level_tracked_and_untracked_paths(self, tmp_path):
-        self._baseline(tmp_path)
+    def test_nested_repo_path_uses_top_level_tracked_and_untracked_paths(self, tmp_path, git_repo):
+        self._baseline(git_repo)
         nested = tmp_path / "package" / "internal"
         nested.mkdir(parents=True)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
@@ -556,8 +538,8 @@ class TestWorktreeReview:
         assert data["findings"][0]["file"] == "lib.py"
         assert not any("content unavailable" in warning["message"] for warning in data["warnings"])
 
-    def test_nested_review_counts_empty_code_and_non_code_files(self, tmp_path):
-        self._baseline(tmp_path)
+    def test_nested_review_counts_empty_code_and_non_code_files(self, tmp_path, git_repo):
+        self._baseline(git_repo)
         nested = tmp_path / "package" / "internal"
         nested.mkdir(parents=True)
         docs = tmp_path / "docs"
@@ -578,8 +560,8 @@ class TestWorktreeReview:
         assert data["findings"] == []
         assert data["warnings"] == []
 
-    def test_hostile_diff_output_config_does_not_hide_worktree_changes(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_hostile_diff_output_config_does_not_hide_worktree_changes(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / ".gitattributes").write_text("*.py diff=hostile\n")
         subprocess.run(["git", "add", ".gitattributes"], cwd=repo, capture_output=True, check=True)
         subprocess.run(
@@ -603,8 +585,8 @@ class TestWorktreeReview:
         )
         assert data["warnings"] == []
 
-    def test_unicode_filename_is_analyzed(self, tmp_path):
-        repo = _init_repo(tmp_path)
+    def test_unicode_filename_is_analyzed(self, tmp_path, git_repo):
+        repo = str(git_repo)
         source = tmp_path / "café.py"
         source.write_text("def helper(value=1):\n    return value\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -620,8 +602,8 @@ class TestWorktreeReview:
         assert data["findings"][0]["file"] == "café.py"
         assert data["findings"][0]["category_id"] == "default_removed"
 
-    def test_untracked_filename_with_tab_is_counted(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_untracked_filename_with_tab_is_counted(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "new\tmodule.py").write_text("def added():\n    return 1\n")
 
         result = self._review(repo)
@@ -631,8 +613,8 @@ class TestWorktreeReview:
         assert data["stats"]["files_analyzed"] == 1
         assert data["findings"] == []
 
-    def test_symlink_type_change_does_not_fabricate_symbol_removal(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_symlink_type_change_does_not_fabricate_symbol_removal(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "target.txt").write_text("not Python source\n")
         (tmp_path / "lib.py").unlink()
         (tmp_path / "lib.py").symlink_to("target.txt")
@@ -644,8 +626,8 @@ class TestWorktreeReview:
         assert data["findings"] == []
         assert any("content unavailable" in warning["message"] for warning in data["warnings"])
 
-    def test_mixed_staged_and_unstaged(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_mixed_staged_and_unstaged(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "lib.py"], cwd=repo, capture_output=True, check=True)
         (tmp_path / "main.py").write_text(
@@ -657,8 +639,8 @@ class TestWorktreeReview:
         assert sum(ref["file"] == "main.py" for ref in finding["references"]) == 3
 
     @pytest.mark.parametrize("staged", [False, True])
-    def test_added_file(self, tmp_path, staged):
-        repo = self._baseline(tmp_path)
+    def test_added_file(self, tmp_path, git_repo, staged):
+        repo = self._baseline(git_repo)
         (tmp_path / "added.py").write_text("def added():\n    return 1\n")
         if staged:
             subprocess.run(["git", "add", "added.py"], cwd=repo, capture_output=True, check=True)
@@ -668,24 +650,24 @@ class TestWorktreeReview:
         assert data["stats"]["files_analyzed"] == 1
         assert data["findings"] == []
 
-    def test_deleted_file(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_deleted_file(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").unlink()
         result = self._review(repo)
         assert result.exit_code == EXIT_FINDINGS
         assert json.loads(result.output)["findings"][0]["category_id"] == "symbol_removed"
 
-    def test_renamed_symbol(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_renamed_symbol(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def renamed(a=1):\n    return a\n")
         result = self._review(repo)
         assert result.exit_code == EXIT_FINDINGS
         categories = {item["category_id"] for item in json.loads(result.output)["findings"]}
         assert "symbol_removed" in categories
 
-    def test_invalid_base_is_schema_valid_error(self, tmp_path):
-        repo = self._baseline(tmp_path)
-        result = CliRunner().invoke(
+    def test_invalid_base_is_schema_valid_error(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
+        result = runner.invoke(
             main,
             [
                 "review",
@@ -711,8 +693,8 @@ class TestWorktreeReview:
         assert data["mode"] == "worktree"
         assert data["error"]["message"] == f"Not a git repository: {tmp_path}"
 
-    def test_parse_gap_warns_without_fabricated_finding(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_parse_gap_warns_without_fabricated_finding(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a:\n    return a\n")
         result = self._review(repo)
         assert result.exit_code == EXIT_SUCCESS
@@ -721,10 +703,10 @@ class TestWorktreeReview:
         assert data["stats"]["parse_errors"] == 1
         assert any(warning["code"] == "parse_gap" for warning in data["warnings"])
 
-    def test_parse_gap_is_visible_in_text_mode(self, tmp_path):
-        repo = self._baseline(tmp_path)
+    def test_parse_gap_is_visible_in_text_mode(self, tmp_path, git_repo):
+        repo = self._baseline(git_repo)
         (tmp_path / "lib.py").write_text("def helper(a:\n    return a\n")
-        result = CliRunner().invoke(
+        result = runner.invoke(
             main,
             ["review", "--worktree", "--against", "HEAD", "--repo", repo],
         )
@@ -737,13 +719,11 @@ class TestHelpText:
     """Test that help text is clear and self-documenting."""
 
     def test_main_help(self):
-        runner = CliRunner()
         result = runner.invoke(main, ["--help"])
         assert "structural breaks" in result.output
         assert "review" in result.output
 
     def test_review_help(self):
-        runner = CliRunner()
         result = runner.invoke(main, ["review", "--help"])
         assert "high-signal" in result.output
         assert "Exit codes" in result.output
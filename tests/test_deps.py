@@ -2,34 +2,19 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
 
 from diffguard.engine.deps import (
     _candidate_files,
     _scan_file_for_symbols,
+    _scan_file_for_symbols_with_status,
+    find_named_identifiers,
     find_references,
+    index_identifiers,
     scan_references,
 )
 
 
-def _init_git_repo(repo: str, *, email: str = "t@t.com", name: str = "T") -> None:
-    """Initialize a hermetic temp repo for tests.
-
-    Test repositories must not inherit the operator's global git hooks; otherwise
-    local commit-msg policy can make otherwise portable tests fail.
-    """
-
-    import subprocess
-
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", email], cwd=repo, capture_output=True, check=True
-    )
-    subprocess.run(["git", "config", "user.name", name], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "core.hooksPath", ""], cwd=repo, capture_output=True, check=True
-    )
-
-
 class TestScanFileForSymbols:
     """Unit tests for _scan_file_for_symbols."""
 
@@ -147,16 +132,78 @@ class TestScanFileForSymbols:
         hits = _scan_file_for_symbols(source, "python", {"nonexistent"})
         assert hits == []
 
+    def test_identifier_index_is_independent_of_searched_names(self):
+        source = "def target():\n    pass\n\nimport other\ntarget()\nother.value\n"
+        hits, parse_error = index_identifiers(source, "python")
+
+        assert not parse_error
+        assert ("target", 5, "call", "target()") in hits
+        assert ("other", 4, "import", "import other") in hits
+        assert all(line != 1 for _, line, _, _ in hits)
+        assert _scan_file_for_symbols(source, "python", {"target"}) == [
+            hit for hit in hits if hit[0] == "target"
+        ]
+
+    def test_named_scan_confirms_text_matches_against_the_tree(self):
+        source = (
+            "from mod import target\n"
+            "# target in a comment\n"
+            "label = 'target'\n"
+            "target_count = target(1) + obj.target\n"
+        )
+        hits, parse_error = find_named_identifiers(source, "python", {"target", "obj"})
+
+        assert not parse_error
+        assert [(name, line, context) for name, line, context, _ in hits] == [
+            ("target", 1, "import"),
+            ("target", 4, "call"),
+            ("obj", 4, "reference"),
+            ("target", 4, "reference"),
+        ]
+        index, _ = index_identifiers(source, "python")
+        assert hits == [hit for hit in index if hit[0] in {"target", "obj"}]
+
+    def test_sources_without_a_whole_token_match_are_not_parsed(self):
+        source = "def broken(:\n    return target_count\n"
+
+        with patch("diffguard.engine.deps.get_parser") as get_parser:
+            named = find_named_identifiers(source, "python", {"target"})
+            indexed = _scan_file_for_symbols_with_status(
+                source, "python", {"target"}, index_source=index_identifiers
+            )
+
+        get_parser.assert_not_called()
+        assert named == indexed == ([], False)
+
+    def test_source_lines_follow_tree_sitter_rows(self):
+        # str.splitlines() also splits on form feeds, which shifted the text.
+        source = "x = 1\n\x0c\ndef f():\n    return target  # café\n"
+
+        hits = _scan_file_for_symbols(source, "python", {"target"})
+        indexed, _ = index_identifiers(source, "python")
+
+        assert hits == [("target", 4, "reference", "return target  # café")]
+        assert indexed[-1] == hits[0]
+
+    def test_deeply_nested_source_does_not_exhaust_recursion(self):
+        depth = 3000
+        source = "value = " + "[" * depth + "target" + "]" * depth + "\n"
+
+        hits = _scan_file_for_symbols(source, "python", {"target"})
+
+        assert [(name, line, context) for name, line, context, _ in hits] == [
+            ("target", 1, "reference")
+        ]
+
     def test_typescript_identifiers(self):
         source = "import { foo } from './bar';\nfoo();\n"
         hits = _scan_file_for_symbols(source, "typescript", {"foo"})
         assert len(hits) >= 2
 
-    def test_tsx_references_use_path_specific_grammar(self, tmp_path):
+    def test_tsx_references_use_path_specific_grammar(self, tmp_path, git_repo):
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "component.tsx").write_text(
             "export function Widget() { return <button onClick={target}>Run</button>; }\n",
             encoding="utf-8",
@@ -603,13 +650,12 @@ class TestScanFileForSymbols:
 class TestFindReferencesIntegration:
     """Integration tests using the actual diffguard repo."""
 
-    def test_finds_refs_in_own_repo(self, tmp_path):
+    def test_finds_refs_in_own_repo(self, tmp_path, git_repo):
         """Test that find_references works on a real git repo."""
         import subprocess
 
         # Create a small test repo
-        repo = str(tmp_path)
-        _init_git_repo(repo, email="test@test.com", name="Test")
+        repo = str(git_repo)
 
         # Create files
         (tmp_path / "lib.py").write_text("def helper():\n    return 42\n")
@@ -636,12 +682,11 @@ class TestFindReferencesIntegration:
         assert any(r.context == "import" for r in refs)
         assert any(r.context == "call" for r in refs)
 
-    def test_includes_changed_files_but_excludes_declarations(self, tmp_path):
+    def test_includes_changed_files_but_excludes_declarations(self, tmp_path, git_repo):
         """Changed files retain useful references without counting declarations."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
 
         (tmp_path / "a.py").write_text("def foo(): pass\nfoo()\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -657,11 +702,10 @@ class TestFindReferencesIntegration:
         assert refs[0].context == "call"
         assert refs[0].line == 2
 
-    def test_changed_file_scan_excludes_unparenthesized_binding_targets(self, tmp_path):
+    def test_changed_file_scan_excludes_unparenthesized_binding_targets(self, tmp_path, git_repo):
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
 
         (tmp_path / "a.py").write_text(
             "def target():\n"
@@ -693,11 +737,10 @@ class TestFindReferencesIntegration:
         )
         assert refs == []
 
-    def test_same_named_modules_are_unresolved_not_exact(self, tmp_path):
+    def test_same_named_modules_are_unresolved_not_exact(self, tmp_path, git_repo):
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "a.py").write_text("def helper(): pass\n")
         (tmp_path / "b.py").write_text("def helper(): pass\n")
         (tmp_path / "use.py").write_text("from b import helper\nhelper()\n")
@@ -710,11 +753,10 @@ class TestFindReferencesIntegration:
         assert all(ref.confidence == "low" for ref in refs)
         assert all("ownership unresolved" in ref.evidence for ref in refs)
 
-    def test_reference_parse_gap_warns_without_emitting_hits(self, tmp_path):
+    def test_reference_parse_gap_warns_without_emitting_hits(self, tmp_path, git_repo):
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "broken.py").write_text("target(\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
@@ -728,12 +770,11 @@ class TestFindReferencesIntegration:
 class TestGitGrepPreFilter:
     """Tests for git grep pre-filter."""
 
-    def test_git_grep_finds_files(self, tmp_path):
+    def test_git_grep_finds_files(self, tmp_path, git_repo):
         """git grep should find files containing the symbol."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
 
         (tmp_path / "a.py").write_text("def helper(): pass\n")
         (tmp_path / "b.py").write_text("helper()\n")
@@ -746,30 +787,37 @@ class TestGitGrepPreFilter:
         assert "b.py" in files
         assert "c.py" not in files
 
-    def test_git_grep_reduces_scan(self, tmp_path):
+    def test_git_grep_reduces_scan(self, git_repo):
         """Pre-filter should reduce files scanned vs scanning all."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
 
-        # Create many files, only 1 references the symbol
-        for i in range(20):
-            (tmp_path / f"file_{i}.py").write_text(f"x_{i} = {i}\n")
-        (tmp_path / "caller.py").write_text("from lib import target_func\ntarget_func()\n")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        # Create many files, only 1 references the symbol. The scan reads the
+        # HEAD tree, so commit them with one fast-import and skip the worktree.
+        files = {f"file_{i}.py": f"x_{i} = {i}\n" for i in range(20)}
+        files["caller.py"] = "from lib import target_func\ntarget_func()\n"
+        branch = (git_repo / ".git" / "HEAD").read_text().removeprefix("ref: ").strip()
+        stream = f"commit {branch}\ncommitter T <t@t.com> 0 +0000\ndata 0\n" + "".join(
+            f"M 100644 inline {path}\ndata {len(text)}\n{text}\n" for path, text in files.items()
+        )
+        subprocess.run(
+            ["git", "fast-import", "--quiet"],
+            cwd=repo,
+            input=stream.encode(),
+            capture_output=True,
+            check=True,
+        )
 
         files = _candidate_files({"target_func"}, "HEAD", repo)
         assert len(files) == 1
         assert "caller.py" in files
 
-    def test_typescript_dollar_identifier_is_matched_as_a_fixed_string(self, tmp_path):
+    def test_typescript_dollar_identifier_is_matched_as_a_fixed_string(self, tmp_path, git_repo):
         """Regex metacharacters in legal identifiers must remain literal."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "handler.ts").write_text(
             "export function handler$() {}\nhandler$();\n",
             encoding="utf-8",
@@ -784,12 +832,11 @@ class TestGitGrepPreFilter:
         ]
         assert scan.warnings == []
 
-    def test_zero_matches_do_not_scan_unrelated_malformed_files(self, tmp_path):
+    def test_zero_matches_do_not_scan_unrelated_malformed_files(self, tmp_path, git_repo):
         """A definitive no-match result should be an empty candidate set."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "broken.py").write_text("def broken(:\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
@@ -799,6 +846,36 @@ class TestGitGrepPreFilter:
         assert scan.references == []
         assert scan.warnings == []
 
+    def test_candidate_discovery_greps_all_symbols_at_once(self, monkeypatch):
+        calls = []
+
+        def _grep(patterns, *_args, **_kwargs):
+            calls.append(patterns)
+            return ["b.py", "a.py"]
+
+        monkeypatch.setattr("diffguard.engine.deps.grep_files", _grep)
+
+        assert _candidate_files({"target", "other"}, "HEAD", "/repo") == {"a.py", "b.py"}
+        assert calls == [["other", "target"]]
+
+    def test_commit_candidates_share_one_batch_reader(self, tmp_path, git_repo):
+        import subprocess
+
+        repo = str(git_repo)
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("target()\n")
+        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+
+        with (
+            patch("diffguard.engine.deps.grep_files", return_value=["a.py", "b.py", "c.py"]),
+            patch("diffguard.git.get_file_at_ref") as get_file,
+        ):
+            scan = scan_references(repo, ["target"], "HEAD")
+
+        get_file.assert_not_called()
+        assert [ref.file_path for ref in scan.references] == ["a.py", "b.py", "c.py"]
+
     def test_unreadable_candidates_warn_in_deterministic_deduplicated_order(self, monkeypatch):
         monkeypatch.setattr(
             "diffguard.engine.deps.grep_files",
@@ -852,11 +929,10 @@ class TestGitGrepPreFilter:
             "reference analysis incomplete"
         ]
 
-    def test_invalid_utf8_candidate_warns_across_snapshot_kinds(self, tmp_path):
+    def test_invalid_utf8_candidate_warns_across_snapshot_kinds(self, tmp_path, git_repo):
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "bad.py").write_bytes(b"target()\n\xff\n")
         (tmp_path / "good.py").write_text("target()\n", encoding="utf-8")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
@@ -874,13 +950,12 @@ class TestGitGrepPreFilter:
             ]
 
     def test_unavailable_candidate_discovery_falls_back_to_supported_files(
-        self, tmp_path, monkeypatch
+        self, tmp_path, git_repo, monkeypatch
     ):
         """An unavailable grep should retain references via the full scan."""
         import subprocess
 
-        repo = str(tmp_path)
-        _init_git_repo(repo)
+        repo = str(git_repo)
         (tmp_path / "caller.py").write_text("target_func()\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
@@ -253,6 +253,12 @@ class TestGeneratedFileDetection:
         assert is_generated("api/v1/service.pb.go")
         assert is_generated("internal/_generated.go")
 
+    def test_patterns_match_whole_names_and_directories(self) -> None:
+        assert not is_generated("internal/api_generated.go")
+        assert not is_generated("vendored/lib.c")
+        assert is_generated("src/vendor/lib.c")
+        assert is_generated("web/app.js.map")
+
 
 class TestHunkHeaderEdgeCases:
     def test_single_line_hunk(self) -> None:
@@ -7,9 +7,13 @@ presentation and orchestration.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from diffguard.engine._paths import is_test_file
 from diffguard.engine._types import Reference
 from diffguard.engine.findings import (
     Finding,
+    attach_references,
     categorize_change,
     extract_findings,
     has_high_signal,
@@ -131,6 +135,21 @@ class TestExtractFindings:
         assert [r.file_path for r in finding.prod_references] == ["src/app.py"]
         assert [r.file_path for r in finding.test_references] == ["tests/test_app.py"]
 
+    def test_reference_paths_are_classified_once_per_reference(self) -> None:
+        out = _output(
+            _sc("function_removed", name="gone"),
+            _sc("function_removed", name="gone"),
+        )
+        refs = [
+            Reference("src/app.py", 10, "gone", "call", "gone()"),
+            Reference("tests/test_app.py", 5, "gone", "call", "gone()"),
+        ]
+        with patch("diffguard.engine.findings.is_test_file", wraps=is_test_file) as classify:
+            first, second = extract_findings(out, refs)
+        assert classify.call_count == len(refs)
+        assert first.prod_references == second.prod_references
+        assert first.prod_references is not second.prod_references
+
     def test_import_refs_are_preserved_as_syntactic_evidence(self) -> None:
         out = _output(_sc("function_removed", name="gone"))
         refs = [Reference("src/app.py", 1, "gone", "import", "from mod import gone")]
@@ -138,6 +157,19 @@ class TestExtractFindings:
         assert [ref.context for ref in finding.prod_references] == ["import"]
         assert finding.test_references == []
 
+    def test_attach_references_matches_extracting_with_references(self) -> None:
+        out = _output(
+            _sc("function_removed", name="gone"),
+            _sc("function_modified", name="internal"),
+        )
+        refs = [
+            Reference("src/app.py", 10, "gone", "call", "gone()"),
+            Reference("tests/test_app.py", 5, "gone", "call", "gone()"),
+        ]
+        findings = extract_findings(out)
+        assert attach_references(findings, refs) == extract_findings(out, refs)
+        assert findings[0].prod_references == []
+
     def test_finding_path_property(self) -> None:
         out = _output(_sc("function_removed"), path="pkg/thing.py")
         (finding,) = extract_findings(out)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import errno
 import logging
 import os
@@ -16,6 +17,7 @@ import pytest
 from diffguard.diff import parse_diff
 from diffguard.engine.pipeline import run_pipeline
 from diffguard.git import (
+    BlobBatchReader,
     _decode_git_path_record,
     _force_supported_binary_records_to_text,
     get_diff,
@@ -207,6 +209,63 @@ def test_snapshot_content_rejects_invalid_utf8_across_boundaries(tmp_path: Path)
     assert get_file_at_snapshot(":worktree", "invalid.py", tmp_path) is None
 
 
+def test_blob_batch_reader_matches_single_object_reads(tmp_path: Path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package" / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "with space.py").write_text("", encoding="utf-8")
+    (tmp_path / "invalid.py").write_bytes(b"target()\n\xff\n")
+    _commit_all(tmp_path, "fixtures")
+
+    with BlobBatchReader(tmp_path) as reader:
+        assert reader.read("HEAD", "package/module.py") == "VALUE = 1\n"
+        assert reader.read("HEAD", "with space.py") == ""
+        assert reader.read("HEAD", "invalid.py") is None
+        assert reader.read("HEAD", "package") is None
+        assert reader.read("HEAD", "missing.py") is None
+        assert reader.read("missing-ref", "package/module.py") is None
+        # The stream stays aligned after non-blob and missing records.
+        assert reader.read("HEAD", "package/module.py") == "VALUE = 1\n"
+
+
+def test_blob_batch_reader_serializes_concurrent_reads(tmp_path: Path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    expected = {f"m{index}.py": f"VALUE = {index}\n" * (index + 1) for index in range(16)}
+    for name, content in expected.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    _commit_all(tmp_path, "fixtures")
+
+    with BlobBatchReader(tmp_path) as reader, ThreadPoolExecutor(max_workers=8) as executor:
+        names = list(expected) * 4
+        contents = list(executor.map(lambda name: reader.read("HEAD", name), names))
+
+    assert contents == [expected[name] for name in names]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows paths cannot contain newlines")
+def test_blob_batch_reader_falls_back_for_names_outside_batch_protocol(tmp_path: Path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    (tmp_path / "line\nbreak.py").write_text("VALUE = 2\n", encoding="utf-8")
+    _commit_all(tmp_path, "newline path")
+
+    with BlobBatchReader(tmp_path) as reader:
+        assert reader.read("HEAD", "line\nbreak.py") == "VALUE = 2\n"
+
+
+def test_blob_batch_reader_falls_back_when_batch_process_fails() -> None:
+    with (
+        patch("diffguard.git.subprocess.Popen", side_effect=OSError("no git")) as popen,
+        patch("diffguard.git.get_file_at_ref", return_value="VALUE = 3\n") as get_file,
+    ):
+        reader = BlobBatchReader("/repo")
+        assert reader.read("HEAD", "module.py") == "VALUE = 3\n"
+        assert reader.read("HEAD", "other.py") == "VALUE = 3\n"
+
+    popen.assert_called_once()
+    assert get_file.call_count == 2
+    get_file.assert_called_with("HEAD", "other.py", repo_path="/repo")
+
+
 def test_worktree_read_does_not_follow_symlinked_parent(tmp_path) -> None:
     outside = tmp_path.parent / f"{tmp_path.name}-outside"
     outside.mkdir()
@@ -245,6 +304,21 @@ def test_grep_files_distinguishes_no_matches_from_command_failure(tmp_path) -> N
     assert grep_files("missing_symbol", "missing-ref", tmp_path, ("*.py",)) is None
 
 
+def test_grep_files_matches_any_pattern_in_one_command(tmp_path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    (tmp_path / "a.py").write_text("alpha()\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("beta.gamma\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("delta\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True, check=True)
+
+    with patch("diffguard.git.subprocess.run", wraps=subprocess.run) as run:
+        hits = grep_files(["alpha", "gamma", "a.b"], ":index", tmp_path, ("*.py",))
+
+    assert sorted(hits or []) == ["a.py", "b.py"]
+    run.assert_called_once()
+    assert grep_files([], ":index", tmp_path, ("*.py",)) == []
+
+
 def test_grep_files_treats_patterns_as_fixed_strings_for_every_snapshot(tmp_path) -> None:
     subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
     (tmp_path / "module.ts").write_text("handler$();\n", encoding="utf-8")
@@ -326,19 +400,30 @@ def _assert_machine_diff_command(command: list[str]) -> None:
 def test_committed_and_staged_diff_force_machine_stable_output() -> None:
     completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
 
-    with patch("diffguard.git.subprocess.run", return_value=completed) as run:
+    with patch("diffguard.git._run_git_diff", return_value=completed) as run:
         get_diff("base..head", "/repo")
     committed_command = run.call_args.args[0]
     _assert_machine_diff_command(committed_command)
     assert committed_command[-3:] == ["--end-of-options", "base..head", "--"]
 
-    with patch("diffguard.git.subprocess.run", return_value=completed) as run:
+    with patch("diffguard.git._run_git_diff", return_value=completed) as run:
         get_staged_diff("/repo")
     staged_command = run.call_args.args[0]
     _assert_machine_diff_command(staged_command)
     assert staged_command[-1] == "--cached"
 
 
+def test_staged_diff_translates_line_endings_like_text_mode(tmp_path: Path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    (tmp_path / "module.py").write_bytes(b"A = 1\r\nB = 2\r\n")
+    subprocess.run(["git", "add", "module.py"], cwd=tmp_path, capture_output=True, check=True)
+
+    diff_text = get_staged_diff(tmp_path)
+
+    assert "\r" not in diff_text
+    assert diff_text.endswith("+A = 1\n+B = 2\n")
+
+
 @pytest.mark.parametrize("diff_kind", ["committed", "worktree"])
 def test_revision_output_option_cannot_redirect_diff(
     tmp_path: Path,
@@ -6,7 +6,7 @@ import os
 import subprocess
 from pathlib import Path
 
-from diffguard.hooks import HookError, PRE_PUSH_HOOK, install_hook
+from diffguard.hooks import HookError, PRE_COMMIT_HOOK, PRE_PUSH_HOOK, install_hook
 
 
 Z40 = "0" * 40
@@ -114,6 +114,64 @@ def test_pre_push_blocks_new_branch_when_default_branch_is_unknown(tmp_path: Pat
     assert not (tmp_path / "calls").exists()
 
 
+def test_pre_push_skips_review_without_supported_source_changes(tmp_path: Path) -> None:
+    local_sha = "a" * 40
+    remote_sha = "b" * 40
+    result = _run_pre_push(
+        tmp_path,
+        f"refs/heads/topic {local_sha} refs/heads/topic {remote_sha}\n",
+        """#!/bin/sh
+printf '%s\\n' "$*" > "$DIFFGUARD_CALLS.git"
+exit 0
+""",
+    )
+
+    assert result.returncode == 0
+    assert "skipping diffguard review" in result.stdout
+    assert not (tmp_path / "calls").exists()
+    git_args = (tmp_path / "calls.git").read_text(encoding="utf-8")
+    assert git_args.startswith(f"diff --quiet {remote_sha}..{local_sha} -- ")
+    assert "*.py" in git_args and "*.tsx" in git_args
+
+
+def test_pre_push_reviews_when_supported_source_changed(tmp_path: Path) -> None:
+    local_sha = "a" * 40
+    remote_sha = "b" * 40
+    result = _run_pre_push(
+        tmp_path,
+        f"refs/heads/topic {local_sha} refs/heads/topic {remote_sha}\n",
+        "#!/bin/sh\nexit 1\n",
+    )
+
+    assert result.returncode == 0
+    assert (tmp_path / "calls").read_text(encoding="utf-8") == (
+        f"review {remote_sha}..{local_sha}\n"
+    )
+
+
+def test_pre_commit_only_reviews_staged_supported_sources(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _write_executable(bin_dir / "diffguard", '#!/bin/sh\necho "$*" >> "$DIFFGUARD_CALLS"\n')
+    hook_path = tmp_path / "pre-commit"
+    _write_executable(hook_path, PRE_COMMIT_HOOK)
+    env = os.environ.copy()
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env['PATH']}"
+    env["DIFFGUARD_CALLS"] = str(tmp_path / "calls")
+
+    (repo / "notes.md").write_text("notes\n")
+    subprocess.run(["git", "add", "notes.md"], cwd=repo, check=True)
+    skipped = subprocess.run([str(hook_path)], cwd=repo, env=env, check=False)
+    (repo / "lib.py").write_text("def f():\n    pass\n")
+    subprocess.run(["git", "add", "lib.py"], cwd=repo, check=True)
+    reviewed = subprocess.run([str(hook_path)], cwd=repo, env=env, check=False)
+
+    assert skipped.returncode == reviewed.returncode == 0
+    assert (tmp_path / "calls").read_text(encoding="utf-8") == "review --staged\n"
+
+
 def _init_repo(path: Path) -> None:
     path.mkdir()
     subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
@@ -1,6 +1,7 @@
 """Tests for language detection and registry."""
 
-from diffguard.languages import SUPPORTED_LANGUAGES, detect_language
+from diffguard.languages import SUPPORTED_LANGUAGES, detect_language, get_parser
+from diffguard.languages._utils import node_kind_ids
 
 
 def test_supported_languages() -> None:
@@ -29,3 +30,24 @@ def test_detect_unknown() -> None:
     assert detect_language("file.rs") is None
     assert detect_language("file.c") is None
     assert detect_language("README.md") is None
+
+
+def test_node_kind_ids_match_node_types() -> None:
+    parser = get_parser("python")
+    language = parser.language
+    assert language is not None
+    tree = parser.parse(b"@cache\ndef f():\n    class C: pass\n")
+    wanted = {"decorated_definition", "function_definition", "class_definition"}
+    ids = node_kind_ids(language, *wanted)
+
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        assert (node.kind_id in ids) == (node.type in wanted)
+        stack.extend(node.children)
+
+
+def test_parsers_share_one_language_per_grammar() -> None:
+    for language, path in [("python", None), ("go", None), ("typescript", "a.tsx")]:
+        first = get_parser(language, file_path=path).language
+        assert first is get_parser(language, file_path=path).language
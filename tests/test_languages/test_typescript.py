@@ -33,6 +33,19 @@ const add = (a, b) => {
     assert "const add = (a, b) =>" in sym.signature
 
 
+def test_arrow_functions_among_plain_declarators_keep_their_keyword() -> None:
+    source = """\
+let count = 0, inc = (n) => n + 1;
+var limit = 10;
+var twice = x => x * 2;
+"""
+    result = parse_file(source, "javascript")
+    assert [s.signature for s in result.symbols] == [
+        "let inc = (n) =>",
+        "var twice = (x) =>",
+    ]
+
+
 def test_class_with_methods() -> None:
     source = """\
 class Calculator {
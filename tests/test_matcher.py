@@ -35,13 +35,24 @@ class TestMatchSymbols:
     def test_identical_lists(self) -> None:
         syms = [_sym(name="a"), _sym(name="b", signature="def b()")]
         result = match_symbols(syms, syms)
-        assert len(result) == 2
-        assert all(m.old is not None and m.new is not None for m in result)
+        # Identical pairs cannot classify as changes and are not emitted.
+        assert result.matches == []
+        assert result.unmatched_old == result.unmatched_new == []
+
+    def test_pairs_with_changed_signature_or_body_are_emitted(self) -> None:
+        old = [_sym(name="a"), _sym(name="b"), _sym(name="c")]
+        new = [
+            _sym(name="a"),
+            _sym(name="b", body_hash="changed"),
+            _sym(name="c", signature="def c(x)"),
+        ]
+        result = match_symbols(old, new).matches
+        assert [(m.old, m.new) for m in result] == [(old[1], new[1]), (old[2], new[2])]
 
     def test_added_symbols(self) -> None:
         old = [_sym(name="a")]
         new = [_sym(name="a"), _sym(name="b", signature="def b()")]
-        result = match_symbols(old, new)
+        result = match_symbols(old, new).matches
         added = [m for m in result if m.old is None]
         assert len(added) == 1
         assert added[0].new is not None
@@ -50,16 +61,29 @@ class TestMatchSymbols:
     def test_removed_symbols(self) -> None:
         old = [_sym(name="a"), _sym(name="b", signature="def b()")]
         new = [_sym(name="a")]
-        result = match_symbols(old, new)
+        result = match_symbols(old, new).matches
         removed = [m for m in result if m.new is None]
         assert len(removed) == 1
         assert removed[0].old is not None
         assert removed[0].old.name == "b"
 
+    def test_unmatched_symbols_are_reported_per_side(self) -> None:
+        kept = _sym(name="a")
+        removed = _sym(name="b", signature="def b()")
+        duplicate_old = _sym(name="c", signature="def c(x)")
+        duplicate_new = [_sym(name="c", signature="def c(x)"), _sym(name="c", signature="def c()")]
+
+        result = match_symbols([kept, removed, duplicate_old], [kept, *duplicate_new])
+
+        assert result.unmatched_old == [removed]
+        assert result.unmatched_new == [duplicate_new[1]]
+        assert [m.old for m in result.matches if m.new is None] == result.unmatched_old
+        assert [m.new for m in result.matches if m.old is None] == result.unmatched_new
+
     def test_modified_symbols(self) -> None:
         old = [_sym(name="a", body_hash="old")]
         new = [_sym(name="a", body_hash="new")]
-        result = match_symbols(old, new)
+        result = match_symbols(old, new).matches
         assert len(result) == 1
         assert result[0].old is not None and result[0].new is not None
         assert result[0].old.body_hash != result[0].new.body_hash
@@ -70,10 +94,10 @@ class TestMatchSymbols:
             _sym(name="run", parent="Cat", signature="def run(self)"),
         ]
         new = [
-            _sym(name="run", parent="Dog", signature="def run(self)"),
-            _sym(name="run", parent="Cat", signature="def run(self)"),
+            _sym(name="run", parent="Dog", signature="def run(self)", body_hash="dog"),
+            _sym(name="run", parent="Cat", signature="def run(self)", body_hash="cat"),
         ]
-        result = match_symbols(old, new)
+        result = match_symbols(old, new).matches
         assert len(result) == 2
         assert all(m.old is not None and m.new is not None for m in result)
 
@@ -84,15 +108,36 @@ class TestMatchSymbols:
             _sym(name="foo", signature="def foo(a: str)", body_hash="h2"),
         ]
         new = [
-            _sym(name="foo", signature="def foo(a: str)", body_hash="h2"),
-            _sym(name="foo", signature="def foo(a: int)", body_hash="h1"),
+            _sym(name="foo", signature="def foo(a: str)", body_hash="h2-new"),
+            _sym(name="foo", signature="def foo(a: int)", body_hash="h1-new"),
         ]
-        result = match_symbols(old, new)
+        result = match_symbols(old, new).matches
         assert len(result) == 2
         for m in result:
             assert m.old is not None and m.new is not None
             assert m.old.signature == m.new.signature
 
+    def test_duplicate_signature_pairs_precede_positional_pairs(self) -> None:
+        old = [
+            _sym(name="f", signature="def f(a)", start_line=1),
+            _sym(name="f", signature="def f(b)", start_line=2),
+            _sym(name="f", signature="def f(a)", start_line=3),
+        ]
+        new = [
+            _sym(name="f", signature="def f(c)", start_line=10, body_hash="new"),
+            _sym(name="f", signature="def f(a)", start_line=11, body_hash="new"),
+            _sym(name="f", signature="def f(a)", start_line=12, body_hash="new"),
+            _sym(name="f", signature="def f(d)", start_line=13, body_hash="new"),
+        ]
+
+        result = match_symbols(old, new)
+
+        assert [
+            (m.old.start_line if m.old else None, m.new.start_line if m.new else None)
+            for m in result.matches
+        ] == [(1, 11), (3, 12), (2, 10), (None, 13)]
+        assert result.unmatched_new == [new[3]]
+
 
 class TestMatchCrossFile:
     def test_cross_file_move(self) -> None:
@@ -174,6 +219,23 @@ class TestMatchCrossFile:
             for match in result
         )
 
+    def test_cross_file_matched_candidates_leave_later_tiers(self) -> None:
+        """A symbol paired by exact evidence no longer makes later tiers ambiguous."""
+        old_exact = _sym(signature="def foo(a)", body_hash="same")
+        old_body = _sym(signature="def foo(b)", body_hash="same")
+        new_exact = _sym(signature="def foo(a)", body_hash="same")
+        new_body = _sym(signature="def foo(c)", body_hash="same")
+
+        result = match_cross_file(
+            _unmatched({"old_a.py": [old_exact], "old_b.py": [old_body]}),
+            _unmatched({"new_a.py": [new_exact], "new_c.py": [new_body]}),
+        )
+
+        assert [(match.old, match.new) for match in result] == [
+            (old_exact, new_exact),
+            (old_body, new_body),
+        ]
+
     def test_cross_file_does_not_guess_ambiguous_body_only_moves(self) -> None:
         """Duplicate body evidence alone cannot establish one-to-one move identity."""
         result = match_cross_file(
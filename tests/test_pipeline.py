@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
-from diffguard.engine._types import MatchedSymbol, Symbol, compute_body_hash
+from diffguard.engine._types import MatchedSymbol, ParseResult, Symbol, compute_body_hash
+from diffguard.engine.parser import parse_file
 from diffguard.engine.pipeline import _apply_moves, run_pipeline
 from diffguard.schema import FileChange, DiffGuardOutput, SymbolChange
 
@@ -1370,3 +1373,106 @@ diff --git a/{path} b/{path}
     assert len(changes) == 1
     assert changes[0].before_signature != changes[0].after_signature
     assert changes[0].breaking is None
+
+
+def test_parallel_file_analysis_matches_sequential_order_and_moves() -> None:
+    diff = """\
+diff --git a/utils.py b/utils.py
+--- a/utils.py
++++ b/utils.py
+@@ -1,5 +1,8 @@
+ def greet(name: str) -> str:
+     return f"Hello {name}"
++
++def farewell(name: str) -> str:
++    return f"Goodbye {name}"
+diff --git a/missing.py b/missing.py
+--- a/missing.py
++++ b/missing.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+diff --git a/old.go b/old.go
+deleted file mode 100644
+--- a/old.go
++++ /dev/null
+@@ -1,2 +0,0 @@
+-package sample
+-func helper() {}
+diff --git a/new.go b/new.go
+new file mode 100644
+--- /dev/null
++++ b/new.go
+@@ -0,0 +1,2 @@
++package sample
++func helper() {}
+"""
+    source = "package sample\nfunc helper() {}\n"
+    get = _content_provider(
+        {"utils.py": OLD_UTILS, "old.go": source},
+        {"utils.py": NEW_UTILS, "new.go": source},
+    )
+
+    sequential = run_pipeline(diff, "abc..def", get, max_workers=1)  # type: ignore[arg-type]
+    parallel = run_pipeline(diff, "abc..def", get, max_workers=4)  # type: ignore[arg-type]
+
+    assert parallel.files == sequential.files
+    assert (
+        parallel.meta.warnings
+        == sequential.meta.warnings
+        == ["missing.py: content unavailable at ref — symbol analysis skipped"]
+    )
+    assert [change.kind for change in parallel.files[3].changes] == ["moved"]
+
+
+def test_sequential_analysis_reads_later_files_ahead_of_parsing() -> None:
+    diff = SIMPLE_DIFF + SIMPLE_DIFF.replace("utils.py", "other.py")
+    files = {"utils.py": OLD_UTILS, "other.py": OLD_UTILS}
+    last_read = threading.Event()
+    reads: list[tuple[str, str]] = []
+    base = _content_provider(files, {path: NEW_UTILS for path in files})
+
+    def get(ref: str, path: str) -> str | None:
+        reads.append((ref, path))
+        if (ref, path) == ("def", "other.py"):
+            last_read.set()
+        return base(ref, path)  # type: ignore[operator,no-any-return]
+
+    read_ahead: list[bool] = []
+
+    def parse(source: str, language: str, *, file_path: str | None = None) -> ParseResult:
+        if not read_ahead:
+            read_ahead.append(last_read.wait(timeout=5))
+        return parse_file(source, language, file_path=file_path)
+
+    result = run_pipeline(diff, "abc..def", get, parse_source=parse, max_workers=1)
+
+    assert read_ahead == [True]
+    assert sorted(reads) == [
+        ("abc", "other.py"),
+        ("abc", "utils.py"),
+        ("def", "other.py"),
+        ("def", "utils.py"),
+    ]
+    assert [[c.name for c in fc.changes] for fc in result.files] == [["farewell"], ["farewell"]]
+
+
+def test_identical_rename_is_parsed_once() -> None:
+    diff = """\
+diff --git a/utils.py b/helpers.py
+similarity index 100%
+rename from utils.py
+rename to helpers.py
+"""
+    get = _content_provider({"utils.py": OLD_UTILS}, {"helpers.py": OLD_UTILS})
+    parsed: list[str | None] = []
+
+    def parse(source: str, language: str, *, file_path: str | None = None) -> ParseResult:
+        parsed.append(file_path)
+        return parse_file(source, language, file_path=file_path)
+
+    result = run_pipeline(diff, "abc..def", get, parse_source=parse)  # type: ignore[arg-type]
+
+    assert parsed == ["utils.py"]
+    assert result.files[0].changes == []
+    assert result.meta.warnings == []
@@ -438,6 +438,23 @@ class TestRenderJson:
         assert r"\u2066" in rendered
         assert json.loads(rendered)["warnings"][0]["message"] == message
 
+    def test_json_matches_stdlib_ascii_indented_encoding(self) -> None:
+        out = DiffGuardOutput(
+            meta=Meta(
+                ref_range="a..b",
+                stats=DiffStats(files=1, additions=0, deletions=0),
+                warnings=['astral:\U0001d518 del:\x7f tab:\t quote:" slash:/'],
+                timing_ms=1234.5,
+            ),
+            files=[_fc("café.py", [_sc("function_added", name="\U0001f600")])],
+        )
+
+        rendered = render_summary_json(out)
+
+        assert rendered == json.dumps(json.loads(rendered), ensure_ascii=True, indent=2)
+        assert r"\ud835\udd18" in rendered
+        assert r"\u007f" in rendered
+
     def test_surrogateescaped_paths_are_json_safe_display_values(self) -> None:
         destination = b"pkg/\xff.py".decode("utf-8", "surrogateescape")
         source = b"old/\xfe.py".decode("utf-8", "surrogateescape")
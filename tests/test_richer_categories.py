@@ -59,13 +59,22 @@ class TestClassifySignatureChange:
 # ---------------------------------------------------------------------------
 
 
+# Commit identity comes from the environment rather than two ``git config``
+# calls per repository; global config is ignored so commits stay hermetic.
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "T",
+    "GIT_AUTHOR_EMAIL": "t@t.com",
+    "GIT_COMMITTER_NAME": "T",
+    "GIT_COMMITTER_EMAIL": "t@t.com",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+}
+
+
 def _init_repo(tmp_path):
     repo = str(tmp_path)
     subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "t@t.com"], cwd=repo, capture_output=True, check=True
-    )
-    subprocess.run(["git", "config", "user.name", "T"], cwd=repo, capture_output=True, check=True)
     subprocess.run(
         ["git", "config", "core.hooksPath", str(tmp_path / ".git" / "hooks")],
         cwd=repo,
@@ -80,11 +89,17 @@ class TestRicherCategoriesCLI:
         repo = _init_repo(tmp_path)
         (tmp_path / "lib.py").write_text("def helper(a, b):\n    return a + b\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, env=_GIT_ENV, check=True
+        )
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "remove param"], cwd=repo, capture_output=True, check=True
+            ["git", "commit", "-m", "remove param"],
+            cwd=repo,
+            capture_output=True,
+            env=_GIT_ENV,
+            check=True,
         )
 
         runner = CliRunner()
@@ -96,11 +111,17 @@ class TestRicherCategoriesCLI:
         repo = _init_repo(tmp_path)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, env=_GIT_ENV, check=True
+        )
         (tmp_path / "lib.py").write_text("def helper(a, b):\n    return a + b\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "add required param"], cwd=repo, capture_output=True, check=True
+            ["git", "commit", "-m", "add required param"],
+            cwd=repo,
+            capture_output=True,
+            env=_GIT_ENV,
+            check=True,
         )
 
         runner = CliRunner()
@@ -113,11 +134,17 @@ class TestRicherCategoriesCLI:
         repo = _init_repo(tmp_path)
         (tmp_path / "lib.py").write_text("def helper(a) -> int:\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, env=_GIT_ENV, check=True
+        )
         (tmp_path / "lib.py").write_text("def helper(a) -> str:\n    return str(a)\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "change return type"], cwd=repo, capture_output=True, check=True
+            ["git", "commit", "-m", "change return type"],
+            cwd=repo,
+            capture_output=True,
+            env=_GIT_ENV,
+            check=True,
         )
 
         runner = CliRunner()
@@ -130,12 +157,18 @@ class TestRicherCategoriesCLI:
         repo = _init_repo(tmp_path)
         (tmp_path / "lib.py").write_text("def helper(a, b=1):\n    return a + b\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, env=_GIT_ENV, check=True
+        )
         # Change default AND add a new optional param so pipeline detects signature change
         (tmp_path / "lib.py").write_text("def helper(a, b=2, c=3):\n    return a + b + c\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "change default"], cwd=repo, capture_output=True, check=True
+            ["git", "commit", "-m", "change default"],
+            cwd=repo,
+            capture_output=True,
+            env=_GIT_ENV,
+            check=True,
         )
 
         runner = CliRunner()
@@ -148,11 +181,17 @@ class TestRicherCategoriesCLI:
         repo = _init_repo(tmp_path)
         (tmp_path / "lib.py").write_text("def helper(a):\n    return a\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-        subprocess.run(["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, env=_GIT_ENV, check=True
+        )
         (tmp_path / "lib.py").write_text("def helper(a, b):\n    return a + b\n")
         subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "add param"], cwd=repo, capture_output=True, check=True
+            ["git", "commit", "-m", "add param"],
+            cwd=repo,
+            capture_output=True,
+            env=_GIT_ENV,
+            check=True,
         )
 
         runner = CliRunner()
@@ -3,6 +3,7 @@
 import pytest
 
 from diffguard.engine.signatures import (
+    _parse_python_declaration,
     assess_signature_change,
     compare_signatures,
     extract_params,
@@ -57,6 +58,14 @@ class TestExtractParams:
             "other=1",
         ]
 
+    def test_escaped_quotes_and_identifier_lambda_prefixes(self) -> None:
+        assert extract_params(r'def foo(a="x\",)", lambda_value=1, b=(1, 2))') == [
+            r'a="x\",)"',
+            "lambda_value=1",
+            "b=(1, 2)",
+        ]
+        assert extract_params("def foo(a='unterminated, b)") == []
+
     def test_typescript_generic_type_commas_do_not_split_parameters(self) -> None:
         assert extract_params(
             "function foo(value: Map<string, number>, other: boolean)",
@@ -1242,6 +1251,29 @@ class TestCompareSignatures:
         assert comparison.equivalent is True
         assert comparison.assessment is None
 
+    def test_repeated_comparisons_reuse_the_memoized_result(self) -> None:
+        compare_signatures.cache_clear()
+        first = compare_signatures("def foo(a)", "def foo(a, b)", "python")
+        second = compare_signatures("def foo(a)", "def foo(a, b)", "python")
+        assert second is first
+        assert compare_signatures.cache_info().hits == 1
+        assert compare_signatures("def foo(a)", "def foo(a, b)", "go") is not first
+
+    def test_each_signature_is_parsed_once_per_assessment(self) -> None:
+        compare_signatures.cache_clear()
+        assess_signature_change.cache_clear()
+        _parse_python_declaration.cache_clear()
+
+        compare_signatures("def fresh(a, b=1)", "def fresh(a, b=2, c=3)", "python")
+
+        assert _parse_python_declaration.cache_info().misses == 2
+
+    def test_cached_params_are_returned_as_fresh_lists(self) -> None:
+        params = extract_params("def foo(a, b)")
+        params.append("mutated")
+
+        assert extract_params("def foo(a, b)") == ["a", "b"]
+
     def test_python_callable_kind_change_is_not_structurally_equivalent(self) -> None:
         comparison = compare_signatures("def foo(value)", "async def foo(value)", "python")
         assert comparison.equivalent is False
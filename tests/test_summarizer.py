@@ -54,6 +54,16 @@ class TestIsTestFile:
     def test_not_test(self) -> None:
         assert not is_test_file("src/testing_utils.py")
 
+    def test_matching_ignores_case(self) -> None:
+        assert is_test_file("Project/TESTS/helpers.py")
+        assert is_test_file("src/Widget.SPEC.TSX")
+        assert not is_test_file("src/tests.py")
+
+    def test_non_ascii_paths(self) -> None:
+        assert is_test_file("café/__tests__/menu.js")
+        assert is_test_file("café/teſts/menu.py")  # long s folds to "s"
+        assert not is_test_file("café/menu.py")
+
 
 # ---------------------------------------------------------------------------
 # build_summary (unchanged behaviour)